@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# AppStream ingestion of large synthetic catalogs.
+#
+# Writes a Flathub-style appstream.xml.gz and a DEP-11 YAML catalog with
+# translations, long descriptions and releases in every component (the
+# bulk of real catalogs), ingests both, then re-ingests them unchanged and
+# with a few components edited. Peak RSS is reported for the first pass,
+# which should stay flat however big the catalogs get. Searches that are
+# answered from the indexes and ones that have to scan are timed last.
+#
+#   python benchmarks/bench_appstream.py [--components N] [--keep DIR]
+
+import argparse
+import gzip
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from software.appstream import AppStreamDB
+
+LANGS = ("de", "fr", "it", "es", "pt_BR", "ja", "zh_CN", "ru")
+CATEGORIES = ("Graphics", "Office", "Development", "AudioVideo", "Game", "Network", "Utility", "Education")
+WORDS = ("edit", "image", "photo", "paint", "video", "music", "office", "text", "chat", "mail", "code", "game")
+
+def write_xml(path, count, rng, edited=()):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<components version="0.14" origin="flathub">\n')
+        for n in range(count):
+            name = f"App {n}" + (" (edited)" if n in edited else "")
+            f.write(f'  <component type="desktop-application">\n    <id>org.example.App{n}</id>\n'
+                    f"    <name>{escape(name)}</name>\n")
+            for lang in LANGS:
+                f.write(f'    <name xml:lang="{lang}">{name} {lang}</name>\n')
+            f.write(f"    <summary>Does {rng.choice(WORDS)} things</summary>\n    <description>\n")
+            for p in range(4):
+                f.write(f"      <p>{' '.join(rng.choice(WORDS) for _ in range(60))}</p>\n")
+            f.write("    </description>\n    <categories>\n")
+            for category in rng.sample(CATEGORIES, 2):
+                f.write(f"      <category>{category}</category>\n")
+            f.write("    </categories>\n    <keywords>\n")
+            for word in rng.sample(WORDS, 3):
+                f.write(f"      <keyword>{word}</keyword>\n")
+            f.write("    </keywords>\n    <releases>\n")
+            for r in range(10):
+                f.write(f'      <release version="1.{r}" timestamp="{1600000000 + r * 86400}"/>\n')
+            f.write("    </releases>\n  </component>\n")
+        f.write("</components>\n")
+
+def write_dep11(path, count, rng):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("---\nFile: DEP-11\nVersion: '0.16'\nOrigin: debian-trixie-main\n")
+        for n in range(count):
+            f.write(f"---\nType: desktop-application\nID: org.example.Deb{n}\nPackage: deb{n}\n"
+                    f"Name:\n  C: Deb App {n}\n" + "".join(f"  {lang}: Deb App {n} {lang}\n" for lang in LANGS) +
+                    f"Summary:\n  C: Does {rng.choice(WORDS)} things\nDescription:\n  C: >-\n"
+                    f"    <p>{' '.join(rng.choice(WORDS) for _ in range(120))}</p>\n"
+                    "Categories:\n" + "".join(f"- {c}\n" for c in rng.sample(CATEGORIES, 2)) +
+                    "Keywords:\n  C:\n" + "".join(f"  - {w}\n" for w in rng.sample(WORDS, 3)) +
+                    "Icon:\n  cached:\n  - name: deb.png\n    width: 64\n    height: 64\n")
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--components", type=int, default=50000)
+    parser.add_argument("--keep", default=None, help="write the catalogs and database here")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = args.keep or tmp
+        os.makedirs(out, exist_ok=True)
+        xml = os.path.join(out, "appstream.xml.gz")
+        yml = os.path.join(out, "Components-amd64.yml.gz")
+        write_xml(xml, args.components, random.Random(1))
+        write_dep11(yml, args.components // 2, rng)
+        for path in (xml, yml):
+            with gzip.open(path, "rb") as f:
+                size = sum(len(chunk) for chunk in iter(lambda: f.read(1 << 20), b""))
+            print(f"{os.path.basename(path)}: {os.path.getsize(path) / 1e6:.1f} MB, {size / 1e6:.0f} MB uncompressed")
+
+        db_path = os.path.join(out, "appstream.db")
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        with AppStreamDB(db_path) as db:
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            for path in (xml, yml):
+                result, elapsed = timed(lambda: db.ingest(path))
+                print(f"ingest {os.path.basename(path)}: {result[0]} components in {elapsed:.1f} s")
+            grown = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+            print(f"peak RSS grew by {grown / 1024:.1f} MB")
+
+            result, elapsed = timed(lambda: db.ingest(xml))
+            print(f"unchanged re-ingest: {result} in {elapsed * 1e3:.1f} ms")
+
+            write_xml(xml, args.components, random.Random(1), edited={5, 500})
+            result, elapsed = timed(lambda: db.ingest(xml))
+            print(f"edited re-ingest: {result[0]} written, {result[1]} removed in {elapsed:.1f} s")
+            print(f"{db.count()} components")
+            # The last two fall through to the table scans for id endings and name substrings
+            for kind, text in (("keyword", "photo"), ("id ending", "app123"), ("substring", "app 4999"),
+                               ("no", "nothing")):
+                found, elapsed = timed(lambda: db.search(text))
+                print(f"{kind} search {text!r}: {len(found)} results in {elapsed * 1e3:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Compiled alternatives catalog against loading the JSON source.
+#
+# Writes a synthetic catalog, compiles it, then compares the time and the
+# resident memory it takes to open each form, and the cost of exact
+# lookups on the compiled one. Each form is loaded in a fresh process so
+# the RSS numbers don't mix.
+#
+#   python benchmarks/bench_catalog.py [--entries N] [--lookups N]
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_matcher import make_catalog
+from software.catalog import Catalog, compile_catalog
+
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+def load(kind, path):
+    # Runs in the child: prints open time (s) and RSS growth (kB)
+    before = rss_kb()
+    start = time.perf_counter()
+    if kind == "json":
+        with open(path, encoding="utf-8") as f:
+            programs = json.load(f)
+        table = {p["name"].lower(): p for p in programs}
+    else:
+        table = Catalog(path)
+    elapsed = time.perf_counter() - start
+    print(json.dumps([elapsed, rss_kb() - before, len(table)]))
+
+def measure(kind, path):
+    out = subprocess.run([sys.executable, __file__, "--child", kind, path], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        load(*args.child)
+        return 0
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "alternatives.json")
+        programs = [{"name": name, "aliases": [name.split()[-1]], "category": "Synthetic",
+                     "alternatives": [{"name": f"Alt {i}", "id": f"org.example.Alt{i}", "note": "synthetic"},
+                                      {"name": f"Other {i}", "id": f"org.example.Other{i}"}]}
+                    for i, (_, name) in enumerate(make_catalog(rng, args.entries))]
+        with open(source, "w", encoding="utf-8") as f:
+            json.dump(programs, f)
+        compiled = os.path.join(tmp, "alternatives.idx")
+        start = time.perf_counter()
+        compile_catalog(source, compiled)
+        build = time.perf_counter() - start
+
+        print(f"{args.entries} programs: JSON {os.path.getsize(source) / 1e6:.1f} MB, "
+              f"compiled {os.path.getsize(compiled) / 1e6:.1f} MB in {build:.2f} s")
+        for kind, path in (("json", source), ("compiled", compiled)):
+            elapsed, rss, _ = measure(kind, path)
+            print(f"{kind:>10}: open {elapsed * 1e3:8.2f} ms, RSS +{rss / 1024:6.2f} MB")
+
+        catalog = Catalog(compiled)
+        names = [rng.choice(programs)["name"] for _ in range(args.lookups)]
+        start = time.perf_counter()
+        found = sum(1 for name in names if catalog.lookup(name) is not None)
+        elapsed = time.perf_counter() - start
+        print(f"{found}/{len(names)} exact lookups, {elapsed / len(names) * 1e6:.1f} us each")
+        catalog.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
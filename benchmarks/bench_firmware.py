@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Firmware extraction from kernel modules on a synthetic module tree.
+#
+# Writes .ko, .ko.gz and .ko.xz modules declaring firmware (see
+# synthetic.build_modules), a few of them truncated or corrupt, and times
+# hardware.firmware.extract_firmware cold on the process pool and warm from
+# its cache. The broken modules must come back as errors without stopping
+# the run, and stay out of the cache so they are retried next time.
+#
+#   python benchmarks/bench_firmware.py [--modules N] [--broken N] [--jobs N]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import build_modules
+from hardware.firmware import FirmwareStore, extract_firmware, load_cache, read_modules_dep
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=400)
+    parser.add_argument("--broken", type=int, default=6)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        moddir, firmware_dir, bad = build_modules(root, args.modules, args.broken)
+        paths = list(read_modules_dep(moddir).values())
+        cache_path = os.path.join(root, "firmware.json")
+
+        (found, errors), elapsed = timed(lambda: extract_firmware(paths, cache_path, args.jobs))
+        declared = sum(len(firmware) for firmware in found.values())
+        print(f"cold: {len(found)} modules read, {len(errors)} unreadable, {declared} firmware declared, "
+              f"{elapsed * 1e3:.0f} ms")
+        _, elapsed = timed(lambda: extract_firmware(paths, cache_path, args.jobs))
+        print(f"warm: {elapsed * 1e3:.1f} ms")
+
+        broken = {path for path in paths if os.path.basename(path).split(".")[0] in bad}
+        cached = load_cache(cache_path)
+        for path in sorted(errors):
+            print(f"  {os.path.basename(path)}: {errors[path]}, {'cached' if path in cached else 'not cached'}")
+        if set(errors) != broken or broken & (set(found) | set(cached)) or len(found) + len(errors) != len(paths):
+            print("broken modules were not handled", file=sys.stderr)
+            return 1
+
+        store = FirmwareStore(firmware_dir)
+        missing = sum(1 for firmware in found.values() for name in firmware if not store.has(name))
+        print(f"{missing} of {declared} firmware files missing from {firmware_dir}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Name resolution with the compiled hardware.ids index against parsing the
+# text pci.ids on every run.
+#
+# Resolves a full machine's worth of devices: the ones on this machine plus
+# IDs picked from the database until there are --devices of them. Without a
+# system pci.ids a synthetic one of about the same size is generated.
+#
+#   python benchmarks/bench_ids.py [--ids PATH] [--devices N] [--runs N]
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hardware import ids
+from hardware.sysfs import PciDevice, pci_devices
+
+def synthetic_ids(path, vendors=2500, devices=8, subsystems=2):
+    # Roughly the shape of the real pci.ids (~2.5k vendors, ~40k lines)
+    rng = random.Random(0)
+    with open(path, "w") as f:
+        f.write("# Synthetic pci.ids\n")
+        for vendor in sorted(rng.sample(range(0x10000), vendors)):
+            f.write(f"{vendor:04x}  Vendor {vendor:04x} Corporation\n")
+            for device in sorted(rng.sample(range(0x10000), devices)):
+                f.write(f"\t{device:04x}  Device {device:04x} Controller [Model {rng.randrange(1000)}]\n")
+                for _ in range(subsystems):
+                    f.write(f"\t\t{rng.randrange(0x10000):04x} {rng.randrange(0x10000):04x}  Subsystem board\n")
+        for base in range(0x14):
+            f.write(f"C {base:02x}  Class {base:02x}\n")
+            for sub in range(8):
+                f.write(f"\t{sub:02x}  Subclass {sub:02x}\n")
+
+def text_lookup(source, devices):
+    # What resolving names costs without an index: parse, then look up
+    names = {}
+    with open(source, encoding="utf-8", errors="replace") as f:
+        for kind, a, b, c, d, name in ids.parse_ids(f):
+            names.setdefault((kind, a, b, c, d), name)
+    return [(names.get((ids.VENDOR, d.vendor, 0, 0, 0)), names.get((ids.DEVICE, d.vendor, d.device, 0, 0)))
+            for d in devices]
+
+def index_lookup(index_dir, source, devices):
+    resolver = ids.NameResolver(index_dir, {"pci": source})
+    result = [resolver.names(d) for d in devices]
+    resolver.close()
+    return result
+
+def pick_devices(source, count, rng):
+    known = []
+    with open(source, encoding="utf-8", errors="replace") as f:
+        for kind, a, b, c, d, name in ids.parse_ids(f):
+            if kind == ids.DEVICE:
+                known.append((a, b))
+    return [PciDevice(f"0000:{i:02x}:00.0", vendor, device, None, None, 0x020000, None, None)
+            for i, (vendor, device) in enumerate(rng.sample(known, min(count, len(known))))]
+
+def resident_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGESIZE") // 1024
+    except OSError:
+        return 0
+
+def timed(func, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = func()
+    return result, (time.perf_counter() - start) / runs
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ids", default=ids.find_source("pci"), help="pci.ids to use (default: the system one)")
+    parser.add_argument("--devices", type=int, default=60, help="devices on the simulated machine")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.ids
+        if source is None:
+            source = os.path.join(tmp, "pci.ids")
+            synthetic_ids(source)
+            print("no pci.ids on this system, using a synthetic one")
+        print(f"source: {source} ({os.path.getsize(source) // 1024} KB)")
+
+        devices = pci_devices()
+        devices += pick_devices(source, max(0, args.devices - len(devices)), random.Random(1))
+
+        start = time.perf_counter()
+        count = ids.compile_ids(source, os.path.join(tmp, "pci.ids.idx"))
+        print(f"compile: {count} entries in {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"{os.path.getsize(os.path.join(tmp, 'pci.ids.idx')) // 1024} KB")
+
+        rss = resident_kb()
+        fast, fast_time = timed(lambda: index_lookup(tmp, source, devices), args.runs)
+        fast_rss = resident_kb() - rss
+        rss = resident_kb()
+        slow, slow_time = timed(lambda: text_lookup(source, devices), max(1, args.runs // 10))
+        slow_rss = resident_kb() - rss
+
+        status = "ok" if fast == slow else "MISMATCH"
+        print(f"{len(devices)} devices")
+        print(f"  index: {fast_time * 1e3:8.3f} ms per machine ({fast_time / len(devices) * 1e6:.1f} us per device), "
+              f"+{fast_rss} KB RSS")
+        print(f"  text:  {slow_time * 1e3:8.3f} ms per machine, +{slow_rss} KB RSS  ({slow_time / fast_time:.0f}x)  {status}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Microbenchmark of system.live against the old subprocess based is_live().
+#
+# The new detector runs against fixture /proc and /sys trees for the layouts
+# the old one got wrong or couldn't see (LUKS+LVM, btrfs subvolumes, virtio,
+# overlay and squashfs live roots), then both run on this machine.
+#
+#   python benchmarks/bench_live.py [--runs N]
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system.live import is_live, session_type
+
+def legacy_is_live():
+    out = subprocess.run("df ~", shell=True, capture_output=True, text=True, check=False)
+    fs = out.stdout.strip().split("\n")[-1].split()[0].split("/")[-1]
+
+    parts = subprocess.run("awk '{print $4}' /proc/partitions", shell=True, capture_output=True, text=True)
+    devices = parts.stdout.split()
+
+    real = [p for p in devices if re.match(r'^(sd\w+|nvme\d+n\d+p?\d*|mmcblk\d+p?\d*)$', p)]
+    if fs not in real:
+        subprocess.run("cat /proc/1/cgroup", shell=True, capture_output=True, text=True)
+        return True
+
+    return False
+
+# name: (mountinfo lines for / and /home, block devices, home st_dev, expected)
+# block devices: name -> (devno, parent disk or None, slaves, dm name)
+SCENARIOS = {
+    "nvme-ext4": (
+        ["259:2 / / rw - ext4 /dev/nvme0n1p2 rw"],
+        {"nvme0n1": ("259:0", None, [], None), "nvme0n1p2": ("259:2", "nvme0n1", [], None)},
+        (259, 2), "installed"),
+    "luks-lvm": (
+        ["254:1 / / rw - ext4 /dev/mapper/vg-root rw",
+         "254:2 / /home rw - ext4 /dev/mapper/vg-home rw"],
+        {"sda": ("8:0", None, [], None), "sda2": ("8:2", "sda", [], None),
+         "dm-0": ("254:0", None, ["sda2"], "luks-1234"),
+         "dm-1": ("254:1", None, ["dm-0"], "vg-root"),
+         "dm-2": ("254:2", None, ["dm-0"], "vg-home")},
+        (254, 2), "installed"),
+    "btrfs-subvolume": (
+        ["0:31 /@ / rw - btrfs /dev/vda2 rw,subvol=/@",
+         "0:31 /@home /home rw - btrfs /dev/vda2 rw,subvol=/@home"],
+        {"vda": ("253:0", None, [], None), "vda2": ("253:2", "vda", [], None)},
+        (0, 34), "installed"),
+    "live-overlay": (
+        ["0:28 / / rw - overlay overlay rw,lowerdir=/run/live/rootfs/filesystem.squashfs"],
+        {"loop0": ("7:0", None, [], None), "sdb": ("8:16", None, [], None)},
+        (0, 28), "live"),
+    "live-squashfs-home": (
+        ["8:1 / / rw - ext4 /dev/sda1 rw",
+         "7:0 / /home ro - squashfs /dev/loop0 ro"],
+        {"sda": ("8:0", None, [], None), "sda1": ("8:1", "sda", [], None), "loop0": ("7:0", None, [], None)},
+        (7, 0), "live"),
+}
+
+def build_fixture(root, mountinfo, devices):
+    proc = os.path.join(root, "proc")
+    sysfs = os.path.join(root, "sys")
+    os.makedirs(os.path.join(proc, "self"))
+    with open(os.path.join(proc, "self", "mountinfo"), "w") as f:
+        for i, line in enumerate(mountinfo):
+            f.write(f"{20 + i} 1 {line}\n")
+
+    class_dir = os.path.join(sysfs, "class", "block")
+    dev_dir = os.path.join(sysfs, "dev", "block")
+    os.makedirs(class_dir)
+    os.makedirs(dev_dir)
+    for name, (devno, parent, slaves, dm_name) in devices.items():
+        if parent:
+            node = os.path.join(sysfs, "devices", "pci0000:00", parent, name)
+        else:
+            node = os.path.join(sysfs, "devices", "virtual" if name.startswith(("dm-", "loop")) else "pci0000:00", name)
+        os.makedirs(os.path.join(node, "slaves"), exist_ok=True)
+        with open(os.path.join(node, "dev"), "w") as f:
+            f.write(devno + "\n")
+        if parent:
+            with open(os.path.join(node, "partition"), "w") as f:
+                f.write("1\n")
+        elif not name.startswith(("dm-", "loop")):
+            os.symlink("../..", os.path.join(node, "device"))
+        for slave in slaves:
+            os.symlink(f"../../{slave}", os.path.join(node, "slaves", slave))
+        if dm_name:
+            os.makedirs(os.path.join(node, "dm"))
+            with open(os.path.join(node, "dm", "name"), "w") as f:
+                f.write(dm_name + "\n")
+        os.symlink(os.path.relpath(node, class_dir), os.path.join(class_dir, name))
+        os.symlink(os.path.relpath(node, dev_dir), os.path.join(dev_dir, devno))
+    return proc, sysfs
+
+def timed(func, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = func()
+    return result, (time.perf_counter() - start) / runs
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (mountinfo, devices, dev, expected) in SCENARIOS.items():
+            proc, sysfs = build_fixture(os.path.join(tmp, name), mountinfo, devices)
+            home_dev = os.makedev(*dev)
+            result, per_call = timed(lambda: session_type("/home/user", home_dev, proc, sysfs), args.runs)
+            status = "ok" if result == expected else f"WRONG, expected {expected}"
+            print(f"{name:>20}: {result:<9} {per_call * 1e6:8.1f} us  {status}")
+
+    if sys.platform.startswith("linux"):
+        runs = max(1, args.runs // 50)
+        new, new_time = timed(is_live, args.runs)
+        old, old_time = timed(legacy_is_live, runs)
+        print(f"{'this machine':>20}: new {new!s:<5} {new_time * 1e6:8.1f} us   old {old!s:<5} {old_time * 1e6:8.1f} us  "
+              f"({old_time / new_time:.0f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Program name matching: trigram index against a pairwise scan.
+#
+# Builds a synthetic catalog and a list of installed programs, most of
+# them catalog names dressed up the way Windows shows them (versions,
+# "(64-bit)", locales, editions), the rest unknown: made-up names, other
+# products of a catalog vendor, and runtimes, redistributables and
+# updaters of catalog programs. Reports index build and lookup time, top-1
+# accuracy, how many unknown programs were matched anyway, and the cost of
+# a difflib pairwise scan over the whole catalog, timed on a sample and
+# extrapolated.
+#
+#   python benchmarks/bench_matcher.py [--catalog N] [--programs N] [--sample N]
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from software.matcher import TrigramIndex, normalize
+
+SYLLABLES = ("ar", "be", "co", "da", "el", "fi", "go", "ha", "in", "jo", "ka", "lu", "mo", "ne", "or",
+             "pa", "qu", "ri", "so", "ta", "ul", "ve", "wi", "xo", "ya", "ze", "tron", "lab", "soft", "ware")
+NOUNS = ("Studio", "Player", "Editor", "Manager", "Browser", "Viewer", "Converter", "Suite", "Tools",
+         "Recorder", "Sync", "Client", "Server", "Designer", "Reader", "Office", "Launcher", "Driver")
+VENDORS = ("Microsoft", "Adobe", "Corel", "Autodesk", "Google", "Mozilla", "NVIDIA", "Intel", "Logitech", "")
+DRESSING = ("{name} {major}.{minor}.{patch}", "{name} ({arch})", "{name} {year}", "{name} {major}.{minor} ({arch})",
+            "{name} Professional Plus {year} - {locale}", "{name} version {major}.{minor}", "{name}")
+
+# Unknown programs are made of other syllables, so they really are unknown
+OTHER_SYLLABLES = ("ix", "uk", "ep", "om", "yr", "vax", "dun", "gle", "pho", "sny")
+# Same vendor, not the same program
+UNKNOWN = ("{other} {more} Helper", "{vendor} {other} {noun}", "{vendor} {other}",
+           "{name} Runtime", "{name} Redistributable", "{name} Update Helper", "{name} Plugin")
+
+def word(rng, syllables=SYLLABLES):
+    return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 3))).capitalize()
+
+def make_catalog(rng, size):
+    names = set()
+    while len(names) < size:
+        parts = [rng.choice(VENDORS), word(rng), rng.choice(NOUNS) if rng.random() < 0.6 else ""]
+        names.add(" ".join(p for p in parts if p))
+    return [(f"app{i}", name) for i, name in enumerate(sorted(names))]
+
+def make_programs(rng, catalog, count, known=0.75):
+    # [(kind, key, name)], key None for programs the catalog doesn't have
+    programs = []
+    for _ in range(count):
+        if rng.random() < known:
+            kind = "known"
+            key, name = rng.choice(catalog)
+            if rng.random() < 0.2:
+                name = name.lower()
+        else:
+            kind = rng.choice(UNKNOWN)
+            key, name = None, kind.format(other=word(rng, OTHER_SYLLABLES), more=word(rng, OTHER_SYLLABLES),
+                                          vendor=rng.choice(VENDORS[:-1]), noun=rng.choice(NOUNS),
+                                          name=rng.choice(catalog)[1])
+        dressed = rng.choice(DRESSING).format(name=name, major=rng.randint(1, 30), minor=rng.randint(0, 9),
+                                              patch=rng.randint(0, 999), year=rng.randint(2010, 2025),
+                                              arch=rng.choice(("64-bit", "x64", "x86", "32-bit")),
+                                              locale=rng.choice(("en-us", "de-de", "fr-fr")))
+        programs.append((kind, key, dressed))
+    return programs
+
+def pairwise(name, catalog):
+    text = normalize(name)
+    matcher = difflib.SequenceMatcher(None, text)
+    best = None
+    for key, entry in catalog:
+        matcher.set_seq1(normalize(entry))
+        ratio = matcher.ratio()
+        if best is None or ratio > best[0]:
+            best = (ratio, key)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--catalog", type=int, default=20000)
+    parser.add_argument("--programs", type=int, default=1000)
+    parser.add_argument("--sample", type=int, default=10, help="programs timed with the pairwise scan")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = make_catalog(rng, args.catalog)
+    programs = make_programs(rng, catalog, args.programs)
+
+    start = time.perf_counter()
+    index = TrigramIndex(catalog)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [index.best(name) for _, _, name in programs]
+    lookup = time.perf_counter() - start
+
+    right = sum(1 for (_, key, _), found in zip(programs, results) if (found[1] if found else None) == key)
+    false = Counter(kind for (kind, key, _), found in zip(programs, results) if key is None and found)
+    unknown = Counter(kind for kind, key, _ in programs if key is None)
+    print(f"catalog {len(catalog)}, programs {len(programs)}")
+    print(f"trigram index: built in {build * 1e3:.0f} ms, matched in {lookup * 1e3:.0f} ms "
+          f"({lookup / len(programs) * 1e6:.0f} us/program)")
+    print(f"accuracy: {right / len(programs):.1%} top-1, {sum(false.values())} unknown programs matched")
+    for kind in UNKNOWN:
+        print(f"    {kind:<26} {false[kind]:>4} of {unknown[kind]}")
+
+    sample = programs[:args.sample]
+    start = time.perf_counter()
+    for _, _, name in sample:
+        pairwise(name, catalog)
+    per_program = (time.perf_counter() - start) / max(1, len(sample))
+    print(f"pairwise difflib: {per_program * 1e3:.0f} ms/program, ~{per_program * len(programs):.0f} s for all "
+          f"({per_program / (lookup / len(programs)):.0f}x slower)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
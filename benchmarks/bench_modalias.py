@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Modalias matching with the hardware.modalias prefix index against a
+# linear fnmatch over every pattern in modules.alias.
+#
+# Uses the running kernel's modules.alias, or a synthetic one with the size
+# and pattern mix of a distro kernel's (~35k aliases) when there is none.
+#
+#   python benchmarks/bench_modalias.py [--alias FILE] [--devices N] [--runs N]
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hardware import modalias
+
+def pci_alias(vendor, device="*", sv="*", sd="*", bc="*", sc="*", i="*"):
+    return f"pci:v{vendor}d{device}sv{sv}sd{sd}bc{bc}sc{sc}i{i}"
+
+def usb_alias(vendor="*", product="*", dc="*", ic="*"):
+    return f"usb:v{vendor}p{product}d*dc{dc}dsc*dp*ic{ic}isc*ip*in*"
+
+def synthetic_aliases(path, count=35000):
+    rng = random.Random(0)
+    lines = []
+    while len(lines) < count:
+        kind = rng.random()
+        module = f"mod{rng.randrange(3000)}"
+        if kind < 0.45:
+            pattern = pci_alias(f"0000{rng.randrange(0x10000):04X}", f"0000{rng.randrange(0x10000):04X}")
+        elif kind < 0.47:
+            pattern = pci_alias("*", bc=f"{rng.randrange(0x14):02X}", sc=f"{rng.randrange(8):02X}")
+        elif kind < 0.85:
+            pattern = usb_alias(f"{rng.randrange(0x10000):04X}", f"{rng.randrange(0x10000):04X}")
+        elif kind < 0.87:
+            pattern = usb_alias(ic=f"{rng.randrange(0x100):02X}")
+        elif kind < 0.95:
+            pattern = f"of:N*T*C{rng.choice(['vendor', 'acme', 'soc'])},dev{rng.randrange(5000)}*"
+        else:
+            pattern = f"acpi*:{rng.choice(['INT', 'PNP', 'MSFT'])}{rng.randrange(0x10000):04X}:*"
+        lines.append(f"alias {pattern} {module}\n")
+    with open(path, "w") as f:
+        f.write("# Aliases extracted from modules themselves.\n")
+        f.writelines(lines)
+
+def sample_modaliases(aliases, count, rng):
+    # Concrete modaliases, most of which hit some pattern
+    out = []
+    for pattern, _ in rng.sample(aliases, count):
+        if pattern.startswith(("pci:", "usb:")):
+            out.append(pattern.replace("*", "00").replace("?", "0"))
+    while len(out) < count:
+        out.append(f"pci:v0000{rng.randrange(0x10000):04X}d0000{rng.randrange(0x10000):04X}"
+                   f"sv00000000sd00000000bc{rng.randrange(0x14):02X}sc00i00")
+    return out[:count]
+
+def linear(patterns, modaliases):
+    # Every pattern in turn, precompiled so this measures matching and not fnmatch's cache
+    result = []
+    for alias in modaliases:
+        seen = []
+        for match, module in patterns:
+            if module not in seen and match(alias):
+                seen.append(module)
+        result.append(seen)
+    return result
+
+def indexed(index, modaliases):
+    return [index.match(alias) for alias in modaliases]
+
+def timed(func, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = func()
+    return result, (time.perf_counter() - start) / runs
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--alias", default=None, help="modules.alias (default: the running kernel's)")
+    parser.add_argument("--devices", type=int, default=80, help="modaliases to match per run")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.alias or modalias.default_alias_path()
+        if not os.path.isfile(path):
+            path = os.path.join(tmp, "modules.alias")
+            synthetic_aliases(path)
+            print("no modules.alias for this kernel, using a synthetic one")
+        aliases = modalias.read_aliases(path)
+        print(f"source: {path} ({len(aliases)} aliases)")
+
+        _, compile_time = timed(lambda: modalias.compile_aliases(path), 1)
+        modalias.load_index(path, tmp)
+        index, load_time = timed(lambda: modalias.load_index(path, tmp), args.runs)
+        print(f"compile: {compile_time * 1e3:.1f} ms, load from cache: {load_time * 1e3:.1f} ms, "
+              f"{len(index.buckets)} prefixes")
+
+        modaliases = sample_modaliases(aliases, args.devices, random.Random(1))
+        indexed(index, modaliases)  # compile the regexes once, as a long-running scan would
+        fast, fast_time = timed(lambda: indexed(index, modaliases), args.runs)
+        patterns = [(re.compile(fnmatch.translate(p), re.DOTALL).match, m) for p, m in aliases]
+        slow, slow_time = timed(lambda: linear(patterns, modaliases), 1)
+        status = "ok" if fast == slow else "MISMATCH"
+        print(f"{len(modaliases)} modaliases")
+        print(f"  index:  {fast_time * 1e3:8.2f} ms ({fast_time / len(modaliases) * 1e6:.0f} us per modalias)")
+        print(f"  linear: {slow_time * 1e3:8.2f} ms ({slow_time / fast_time:.0f}x)  {status}")
+
+if __name__ == "__main__":
+    main()
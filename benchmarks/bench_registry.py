@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Installed-programs listing from a large synthetic SOFTWARE hive.
+#
+# Writes a hive padded to --mb megabytes (see synthetic.py), checks the
+# reader lists exactly the programs that were put in and times opening
+# the hive plus walking both Uninstall keys, cold page cache aside.
+#
+#   python benchmarks/bench_registry.py [--mb N] [--programs N] [--runs N] [--keep FILE]
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import build_hive
+from software.registry import Hive, uninstall_entries
+
+def list_programs(path):
+    with Hive(path) as hive:
+        return list(uninstall_entries(hive, "SOFTWARE"))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=float, default=128)
+    parser.add_argument("--programs", type=int, default=400)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--keep", default=None, help="write the hive here instead of a temporary file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.keep or os.path.join(tmp, "SOFTWARE")
+        start = time.perf_counter()
+        expected = build_hive(path, args.programs, args.mb)
+        print(f"hive: {os.path.getsize(path) / 1e6:.1f} MB written in {time.perf_counter() - start:.1f} s")
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        best = None
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            programs = list_programs(path)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        grown = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+
+    found = sorted(p.name for p in programs)
+    if found != sorted(expected):
+        print(f"MISMATCH: listed {len(found)} programs, expected {len(expected)}")
+        return 1
+    print(f"{len(programs)} programs in {best * 1e3:.1f} ms (best of {args.runs}), peak RSS +{grown / 1024:.1f} MB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Cold-start comparison of the two resource modes (see gui/resources.py).
+#
+# Every run is a fresh interpreter that registers the resources and reads
+# the logo back. The "resources" time starts once QtCore is imported, so
+# it is only the registration (importing/unmarshalling the module or
+# mapping the .rcc) and the read; "process" is the whole run. Pass
+# --no-bytecode to also pay for compiling gui/image_rc.py, which is what a
+# first start from read-only media costs.
+#
+#   python benchmarks/bench_resources.py [--runs N] [--no-bytecode]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import time
+# QtCore takes a 100 ms or more to import in either mode, keep it out of the timing
+from PySide6.QtCore import QFile, QResource
+from gui.resources import ensure_resources
+start = time.perf_counter()
+mode = ensure_resources()
+f = QFile(":/newPrefix/SwitcherooOS.png")
+f.open(QFile.ReadOnly)
+size = len(f.readAll())
+print(mode, size, time.perf_counter() - start)
+"""
+
+def run_once(mode, no_bytecode):
+    env = dict(os.environ, SWITCHEROO_RESOURCES=mode)
+    cmd = [sys.executable]
+    if no_bytecode:
+        cmd.append("-B")
+        env["PYTHONPYCACHEPREFIX"] = os.devnull
+    cmd += ["-c", SNIPPET]
+
+    start = time.perf_counter()
+    out = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    total = time.perf_counter() - start
+    loaded, size, inner = out.stdout.split()
+    if loaded != mode:
+        raise SystemExit(f"asked for {mode!r} but got {loaded!r}, build the .rcc with 'python -m gui.resources'")
+    return total, float(inner), int(size)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--no-bytecode", action="store_true")
+    args = parser.parse_args()
+
+    for mode in ("module", "rcc"):
+        run_once(mode, args.no_bytecode)  # warm the page cache for both modes alike
+        totals, inners = [], []
+        for _ in range(args.runs):
+            total, inner, size = run_once(mode, args.no_bytecode)
+            totals.append(total)
+            inners.append(inner)
+        print(f"{mode:>6}: process {statistics.median(totals) * 1000:7.1f} ms  "
+              f"resources {statistics.median(inners) * 1000:7.2f} ms  ({size} bytes, median of {args.runs})")
+
+if __name__ == "__main__":
+    main()
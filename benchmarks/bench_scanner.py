@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Scanner benchmark suite on a synthetic machine (see synthetic.py).
+#
+# Times each stage of a scan over the whole device list: sysfs enumeration,
+# pci.ids/usb.ids name resolution, modules.alias matching and the batch
+# compatibility lookup. Each stage has a budget in microseconds per device;
+# going over it is reported as a regression and the exit status is 1, so
+# this can run as a CI step. No real hardware or root is needed.
+#
+#   python benchmarks/bench_scanner.py [--pci N] [--usb N] [--block N] [--hub-depth N]
+#                                      [--runs N] [--scale X] [--json]
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import build_fixture
+from hardware import compatdb, ids, modalias
+from hardware.sysfs import all_devices, scan
+
+# Microseconds per device, several times what a laptop measures so only real regressions trip them
+BUDGETS = {
+    "enumerate": 250.0,
+    "names": 40.0,
+    "aliases": 60.0,
+    "compat": 40.0,
+}
+
+def timed(func, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def run_suite(fixture, runs):
+    cache = os.path.join(fixture.root, "cache")
+    results = {}
+
+    scanned, elapsed = timed(lambda: scan(fixture.sysfs), runs)
+    devices = all_devices(scanned)
+    results["enumerate"] = elapsed
+
+    resolver = ids.NameResolver(cache, {"pci": fixture.pci_ids, "usb": fixture.usb_ids})
+    resolver.index("pci")
+    resolver.index("usb")
+    _, results["names"] = timed(lambda: [resolver.names(d) for d in devices], runs)
+    resolver.close()
+
+    index = modalias.load_index(fixture.modules_alias, cache)
+    [index.modules_for(d) for d in devices]  # compile the patterns that get used
+    _, results["aliases"] = timed(lambda: [index.modules_for(d) for d in devices], runs)
+
+    with compatdb.CompatDB(os.path.join(cache, "compat.db")) as db:
+        db.import_dump(fixture.compat_dump)
+        wanted = [d for d in devices if d.bus in ("pci", "usb")]
+        _, results["compat"] = timed(lambda: db.check(wanted), runs)
+    return devices, results
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pci", type=int, default=2000)
+    parser.add_argument("--usb", type=int, default=7000)
+    parser.add_argument("--block", type=int, default=1000)
+    parser.add_argument("--hub-depth", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. 2 on slow CI machines")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        fixture = build_fixture(tmp, args.pci, args.usb, args.block, args.hub_depth)
+        setup = time.perf_counter() - start
+        devices, results = run_suite(fixture, args.runs)
+
+    count = len(devices)
+    report = {"devices": count, "setup_s": round(setup, 2), "stages": {}}
+    failed = []
+    for stage, elapsed in results.items():
+        per_device = elapsed / count * 1e6
+        budget = BUDGETS[stage] * args.scale
+        ok = per_device <= budget
+        report["stages"][stage] = {"ms": round(elapsed * 1e3, 2), "us_per_device": round(per_device, 2),
+                                   "budget_us": budget, "ok": ok}
+        if not ok:
+            failed.append(stage)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{count} devices ({fixture.counts}), fixture built in {setup:.1f} s")
+        for stage, r in report["stages"].items():
+            status = "ok" if r["ok"] else "REGRESSION"
+            print(f"{stage:>10}: {r['ms']:9.2f} ms  {r['us_per_device']:7.2f} us/device  "
+                  f"(budget {r['budget_us']:.0f})  {status}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Start Menu shortcut discovery on a synthetic Windows partition.
+#
+# Lays out shared and per-user Start Menus full of shortcuts (see
+# synthetic.write_lnk) whose targets exist on the partition, each a small
+# executable with a version resource (synthetic.write_pe) or a copy of the
+# real one given with --exe, so every shortcut also has its version
+# resource read. The scan is timed serially and on the thread pool. On a
+# warm page cache the pool mostly overlaps file opens; on a real ntfs-3g
+# mount, where every read is a FUSE round trip, it overlaps the I/O
+# itself.
+#
+#   python benchmarks/bench_shortcuts.py [--shortcuts N] [--users N] [--exe FILE] [--jobs N]
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_lnk, write_pe
+from software.shortcuts import START_MENU, find_shortcuts, read_shortcuts
+
+def build(root, shortcuts, users, exe):
+    menus = [(os.path.join(root, "ProgramData", *START_MENU), None)]
+    menus += [(os.path.join(root, "Users", f"user{u}", "AppData", "Roaming", *START_MENU), f"user{u}")
+              for u in range(users)]
+    for n in range(shortcuts):
+        menu, user = menus[n % len(menus)]
+        folder = os.path.join(menu, f"Vendor {n % 50}")
+        os.makedirs(folder, exist_ok=True)
+        if user and n % 3 == 0:
+            target = f"%LOCALAPPDATA%\\Programs\\App{n}\\app{n}.exe"
+            local = os.path.join(root, "Users", user, "AppData", "Local", "Programs", f"App{n}", f"app{n}.exe")
+        else:
+            target = f"C:\\Program Files\\App{n}\\app{n}.exe"
+            local = os.path.join(root, "Program Files", f"App{n}", f"app{n}.exe")
+        write_lnk(os.path.join(folder, f"App {n}.lnk"), target, description=f"Application {n}",
+                  environment=bool(user and n % 3 == 0))
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        if exe:
+            shutil.copyfile(exe, local)
+        else:
+            write_pe(local, {"CompanyName": f"Vendor {n % 50}", "ProductName": f"App {n}",
+                             "ProductVersion": f"{n % 7}.{n % 10}.0"}, (n % 7, n % 10, 0, 0))
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shortcuts", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--exe", default=None, help="Windows executable to copy to every target instead")
+    parser.add_argument("--jobs", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        build(root, args.shortcuts, args.users, args.exe)
+        links, elapsed = timed(lambda: find_shortcuts(root))
+        print(f"{len(links)} shortcuts found in {elapsed * 1e3:.0f} ms")
+        for jobs in (1, args.jobs):
+            found, elapsed = timed(lambda: read_shortcuts(links, root, jobs))
+            named = sum(1 for s in found if s.product)
+            print(f"{jobs:>2} thread(s): {len(found)} parsed, {named} with a product name, "
+                  f"{elapsed * 1e3:.0f} ms ({elapsed / max(1, len(links)) * 1e6:.0f} us/shortcut)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Synthetic machines for the scanner benchmarks.
+#
+# build_fixture() lays out a sysfs tree the way the kernel does (device
+# directories under devices/, bus/ and class/ symlinks into them, driver
+# links) with any number of PCI functions, USB devices behind hubs nested
+# as deep as asked, and disks with partitions. Next to it go a pci.ids,
+# usb.ids, modules.alias and compatibility dump that know most, but not
+# all, of the generated devices, so every stage of a scan has realistic
+# hits and misses. build_modules() writes a kernel module tree whose
+# .ko/.ko.gz/.ko.xz files declare firmware, a few of them truncated or
+# corrupt, and the firmware directory they load from. build_hive() writes
+# a Windows registry hive (regf) with Uninstall entries buried under as
+# many megabytes of unrelated keys as asked; write_lnk() a Start Menu
+# shortcut and write_pe() a small executable whose only content is a
+# version resource. Everything is seeded and reproducible.
+#
+#   python benchmarks/synthetic.py OUT [--pci N] [--usb N] [--block N] [--hub-depth N]
+#                                      [--hive-mb N]
+
+import argparse
+import gzip
+import lzma
+import os
+import random
+import struct
+
+PCI_DRIVERS = ("i915", "amdgpu", "nvme", "xhci_hcd", "iwlwifi", "e1000e", "snd_hda_intel", "ahci")
+USB_DRIVERS = ("usbhid", "btusb", "uas", "usb-storage", "cdc_ether", "snd-usb-audio")
+PCI_CLASSES = (0x030000, 0x010802, 0x0c0330, 0x028000, 0x020000, 0x040300, 0x010601)
+USB_INTERFACE_CLASSES = (0x03, 0xe0, 0x08, 0x02, 0x01)
+HUB_PORTS = 4
+
+def _write(path, text):
+    with open(path, "w") as f:
+        f.write(text + "\n")
+
+def _link(target, link):
+    os.symlink(os.path.relpath(target, os.path.dirname(link)), link)
+
+class Fixture:
+    __slots__ = ("root", "sysfs", "pci_ids", "usb_ids", "modules_alias", "compat_dump", "counts")
+
+    def __init__(self, root):
+        self.root = root
+        self.sysfs = os.path.join(root, "sys")
+        self.pci_ids = os.path.join(root, "pci.ids")
+        self.usb_ids = os.path.join(root, "usb.ids")
+        self.modules_alias = os.path.join(root, "modules.alias")
+        self.compat_dump = os.path.join(root, "compat.csv")
+        self.counts = {}
+
+def _drivers(sysfs, bus, names):
+    paths = {}
+    for name in names:
+        path = os.path.join(sysfs, "bus", bus, "drivers", name)
+        os.makedirs(path, exist_ok=True)
+        paths[name] = path
+    return paths
+
+def build_fixture(root, pci=200, usb=300, block=50, hub_depth=4, seed=0):
+    rng = random.Random(seed)
+    fixture = Fixture(root)
+    sysfs = fixture.sysfs
+    devices_dir = os.path.join(sysfs, "devices", "pci0000:00")
+    for rel in ("bus/pci/devices", "bus/usb/devices", "class/block"):
+        os.makedirs(os.path.join(sysfs, rel), exist_ok=True)
+    os.makedirs(devices_dir, exist_ok=True)
+    pci_drivers = _drivers(sysfs, "pci", PCI_DRIVERS)
+    usb_drivers = _drivers(sysfs, "usb", USB_DRIVERS)
+
+    vendors = sorted(rng.sample(range(0x1000, 0xffff), 300))
+    pci_ids = {}
+    usb_ids = {}
+
+    # PCI functions, 8 per slot, 32 slots per bus
+    pci_dirs = []
+    for i in range(pci):
+        slot = f"0000:{i // 256:02x}:{(i // 8) % 32:02x}.{i % 8}"
+        vendor, device = rng.choice(vendors), rng.randrange(0x10000)
+        subvendor, subdevice = rng.choice(vendors), rng.randrange(0x10000)
+        device_class = rng.choice(PCI_CLASSES)
+        path = os.path.join(devices_dir, slot)
+        os.makedirs(path)
+        _write(os.path.join(path, "vendor"), f"0x{vendor:04x}")
+        _write(os.path.join(path, "device"), f"0x{device:04x}")
+        _write(os.path.join(path, "subsystem_vendor"), f"0x{subvendor:04x}")
+        _write(os.path.join(path, "subsystem_device"), f"0x{subdevice:04x}")
+        _write(os.path.join(path, "class"), f"0x{device_class:06x}")
+        _write(os.path.join(path, "modalias"),
+               f"pci:v{vendor:08X}d{device:08X}sv{subvendor:08X}sd{subdevice:08X}"
+               f"bc{device_class >> 16:02X}sc{(device_class >> 8) & 0xff:02X}i{device_class & 0xff:02X}")
+        if rng.random() < 0.8:
+            _link(pci_drivers[rng.choice(PCI_DRIVERS)], os.path.join(path, "driver"))
+        _link(path, os.path.join(sysfs, "bus", "pci", "devices", slot))
+        pci_ids[(vendor, device)] = device_class
+        pci_dirs.append(path)
+
+    # USB: root hubs with HUB_PORTS ports each, hubs chained hub_depth deep
+    made = 0
+    bus_number = 0
+    while made < usb:
+        bus_number += 1
+        queue = [(f"usb{bus_number}", os.path.join(devices_dir, f"usb{bus_number}"), 0, True)]
+        while queue and made < usb:
+            name, path, depth, hub = queue.pop(0)
+            vendor, product = rng.choice(vendors), rng.randrange(0x10000)
+            os.makedirs(path)
+            _write(os.path.join(path, "idVendor"), f"{vendor:04x}")
+            _write(os.path.join(path, "idProduct"), f"{product:04x}")
+            _write(os.path.join(path, "bDeviceClass"), "09" if hub else "00")
+            _link(path, os.path.join(sysfs, "bus", "usb", "devices", name))
+            made += 1
+            interfaces = 1 if hub else rng.randint(1, 3)
+            for n in range(interfaces):
+                iface_name = f"{name.replace('usb', '') + '-0' if name.startswith('usb') else name}:1.{n}"
+                iface = os.path.join(path, iface_name)
+                iface_class = 0x09 if hub else rng.choice(USB_INTERFACE_CLASSES)
+                os.makedirs(iface)
+                _write(os.path.join(iface, "bInterfaceClass"), f"{iface_class:02x}")
+                _write(os.path.join(iface, "modalias"),
+                       f"usb:v{vendor:04X}p{product:04X}d0100dc{9 if hub else 0:02X}dsc00dp00"
+                       f"ic{iface_class:02X}isc00ip00in{n:02X}")
+                if not hub and rng.random() < 0.7:
+                    _link(usb_drivers[rng.choice(USB_DRIVERS)], os.path.join(iface, "driver"))
+                _link(iface, os.path.join(sysfs, "bus", "usb", "devices", iface_name))
+            usb_ids[(vendor, product)] = 0x09 if hub else 0
+            if hub and depth < hub_depth:
+                for port in range(1, HUB_PORTS + 1):
+                    if name.startswith("usb"):
+                        child = f"{bus_number}-{port}"
+                    else:
+                        child = f"{name}.{port}"
+                    queue.append((child, os.path.join(path, child), depth + 1, rng.random() < 0.3))
+
+    # Disks behind random PCI functions, two partitions each
+    for n in range(block):
+        disk = f"nvme{n}n1"
+        path = os.path.join(devices_dir, "nvme", disk)
+        os.makedirs(path)
+        _write(os.path.join(path, "size"), str(rng.choice((500, 1000, 2000)) * 1953125))
+        _write(os.path.join(path, "removable"), "0")
+        os.makedirs(os.path.join(path, "queue"))
+        _write(os.path.join(path, "queue", "rotational"), "0")
+        _link(rng.choice(pci_dirs) if pci_dirs else path, os.path.join(path, "device"))
+        _link(path, os.path.join(sysfs, "class", "block", disk))
+        for p in (1, 2):
+            part = os.path.join(path, f"{disk}p{p}")
+            os.makedirs(part)
+            _write(os.path.join(part, "partition"), str(p))
+            _link(part, os.path.join(sysfs, "class", "block", f"{disk}p{p}"))
+
+    _write_ids(fixture.pci_ids, pci_ids, rng, "C 03  Display controller\n\t00  VGA compatible controller")
+    _write_ids(fixture.usb_ids, usb_ids, rng, "C 09  Hub\nC 03  Human Interface Device")
+    _write_aliases(fixture.modules_alias, pci_ids, usb_ids, rng)
+    _write_compat(fixture.compat_dump, pci_ids, usb_ids, rng)
+    fixture.counts = {"pci": pci, "usb": made, "block": block}
+    return fixture
+
+def _write_ids(path, known, rng, classes):
+    # Names for about 90% of the devices, plus unrelated entries for bulk
+    by_vendor = {}
+    for (vendor, device) in known:
+        if rng.random() < 0.9:
+            by_vendor.setdefault(vendor, set()).add(device)
+    for _ in range(2000):
+        by_vendor.setdefault(rng.randrange(0x10000), set()).add(rng.randrange(0x10000))
+    with open(path, "w") as f:
+        f.write("# Synthetic ids\n")
+        for vendor in sorted(by_vendor):
+            f.write(f"{vendor:04x}  Vendor {vendor:04x}\n")
+            for device in sorted(by_vendor[vendor]):
+                f.write(f"\t{device:04x}  Device {device:04x}\n")
+        f.write(classes + "\n")
+
+def _write_aliases(path, pci_ids, usb_ids, rng, filler=30000):
+    lines = []
+    for (vendor, device) in pci_ids:
+        if rng.random() < 0.7:
+            lines.append(f"alias pci:v{vendor:08X}d{device:08X}sv*sd*bc*sc*i* {rng.choice(PCI_DRIVERS)}")
+    for (vendor, product) in usb_ids:
+        if rng.random() < 0.5:
+            lines.append(f"alias usb:v{vendor:04X}p{product:04X}d*dc*dsc*dp*ic*isc*ip*in* {rng.choice(USB_DRIVERS)}")
+    lines.append("alias pci:v*d*sv*sd*bc0Csc03i30* xhci_pci")
+    lines.append("alias usb:v*p*d*dc*dsc*dp*ic03isc*ip*in* usbhid")
+    lines.append("alias usb:v*p*d*dc09dsc*dp*ic*isc*ip*in* hub")
+    while len(lines) < filler:
+        lines.append(f"alias pci:v{rng.randrange(0x10000):08X}d{rng.randrange(0x10000):08X}sv*sd*bc*sc*i* mod{rng.randrange(3000)}")
+    rng.shuffle(lines)
+    with open(path, "w") as f:
+        f.write("# Aliases extracted from modules themselves.\n")
+        f.write("\n".join(lines) + "\n")
+
+def _write_compat(path, pci_ids, usb_ids, rng):
+    with open(path, "w") as f:
+        f.write("bus,vendor,device,subvendor,subdevice,class,driver,works,detected,failed\n")
+        for bus, known in (("pci", pci_ids), ("usb", usb_ids)):
+            for (vendor, device), device_class in known.items():
+                if rng.random() < 0.6:
+                    f.write(f"{bus},{vendor:04x},{device:04x},,,{device_class:x},,"
+                            f"{rng.randrange(50)},{rng.randrange(10)},{rng.randrange(5)}\n")
+
+# Kernel modules: minimal ELF64 files with a .modinfo section
+def _elf_module(modinfo):
+    names = b"\0.modinfo\0.shstrtab\0"
+    body_at = 64
+    names_at = body_at + len(modinfo)
+    shoff = (names_at + len(names) + 7) & ~7
+    header = (b"\x7fELF\x02\x01\x01" + bytes(9) +
+              struct.pack("<HHIQQQIHHHHHH", 1, 62, 1, 0, 0, shoff, 0, 64, 0, 0, 64, 3, 2))
+    sections = bytes(64)
+    sections += struct.pack("<IIQQQQIIQQ", 1, 1, 2, 0, body_at, len(modinfo), 0, 0, 1, 0)
+    sections += struct.pack("<IIQQQQIIQQ", 10, 3, 0, 0, names_at, len(names), 0, 0, 1, 0)
+    data = header + modinfo + names
+    return data + bytes(shoff - len(data)) + sections
+
+def build_modules(root, count=400, broken=6, seed=0):
+    # (module directory, firmware directory, names of the broken modules)
+    rng = random.Random(seed)
+    moddir = os.path.join(root, "lib", "modules", "6.99.0-synthetic")
+    firmware_dir = os.path.join(root, "lib", "firmware")
+    os.makedirs(firmware_dir, exist_ok=True)
+    dep = []
+    bad = []
+    for n in range(count):
+        name = f"drv{n}"
+        blobs = [f"vendor{n % 40}/{name}-{i}.bin" for i in range(rng.randint(0, 4))]
+        modinfo = b"".join(f"{key}={value}\0".encode() for key, value in
+                           [("license", "GPL"), ("description", f"Driver {n}")] + [("firmware", b) for b in blobs])
+        data = _elf_module(modinfo + bytes(rng.randrange(256) for _ in range(2048)))
+        if n < broken:
+            # Alternately a truncated .ko.gz and garbage named .ko.xz
+            suffix = (".ko.gz", ".ko.xz")[n % 2]
+            data = gzip.compress(data)[:len(data) // 3] if n % 2 == 0 else b"not really compressed" * 8
+            bad.append(name)
+        else:
+            suffix = (".ko", ".ko.gz", ".ko.xz")[n % 3]
+            if suffix == ".ko.gz":
+                data = gzip.compress(data)
+            elif suffix == ".ko.xz":
+                data = lzma.compress(data, check=lzma.CHECK_CRC32)
+        rel = os.path.join("kernel", "drivers", f"group{n % 10}", name + suffix)
+        os.makedirs(os.path.join(moddir, os.path.dirname(rel)), exist_ok=True)
+        with open(os.path.join(moddir, rel), "wb") as f:
+            f.write(data)
+        dep.append(f"{rel}:")
+        for blob in blobs:
+            if rng.random() < 0.7:
+                path = os.path.join(firmware_dir, blob)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(b"fw")
+    _write(os.path.join(moddir, "modules.dep"), "\n".join(dep))
+    return moddir, firmware_dir, bad
+
+# Registry hives. Cells go into a single hive bin and keys are written
+# children first, so every offset a cell needs is known when it is written.
+HIVE_LIST_MAX = 500
+HIVE_SEGMENT = 16344
+PUBLISHERS = ("Microsoft Corporation", "Adobe Inc.", "Mozilla", "Valve Corporation", "Oracle Corporation",
+              "The Document Foundation", "Google LLC", "NVIDIA Corporation", "Zoom Video Communications")
+EDITIONS = ("Studio", "Player", "Tools", "Runtime", "\u00c9diteur")
+
+class _HiveWriter:
+    def __init__(self):
+        self.data = bytearray(32)
+
+    def cell(self, payload):
+        size = (len(payload) + 4 + 7) & ~7
+        offset = len(self.data)
+        self.data += struct.pack("<i", -size) + payload + bytes(size - 4 - len(payload))
+        return offset
+
+    def value(self, name, kind, data):
+        name = name.encode("latin-1")
+        if len(data) <= 4:
+            size, offset = len(data) | 0x80000000, int.from_bytes(data.ljust(4, b"\0"), "little")
+        elif len(data) > HIVE_SEGMENT:
+            segments = [self.cell(data[i:i + HIVE_SEGMENT]) for i in range(0, len(data), HIVE_SEGMENT)]
+            listing = self.cell(struct.pack(f"<{len(segments)}I", *segments))
+            size, offset = len(data), self.cell(struct.pack("<2sHI", b"db", len(segments), listing))
+        else:
+            size, offset = len(data), self.cell(data)
+        return self.cell(struct.pack("<2sHIIIHH", b"vk", len(name), size, offset, kind, 1, 0) + name)
+
+    def key(self, name, values=(), subkeys=()):
+        # values: (name, type, bytes); subkeys: offsets of keys already written
+        value_offsets = [self.value(*v) for v in values]
+        value_list = self.cell(struct.pack(f"<{len(value_offsets)}I", *value_offsets)) if value_offsets else 0xffffffff
+        subkey_list = self._subkey_list(list(subkeys)) if subkeys else 0xffffffff
+        try:
+            raw, flags = name.encode("ascii"), 0x20
+        except UnicodeEncodeError:
+            raw, flags = name.encode("utf-16-le"), 0
+        return self.cell(struct.pack("<2sHQIIIIIIIIIIIIIIIHH", b"nk", flags, 0, 0, 0, len(subkeys), 0,
+                                     subkey_list, 0xffffffff, len(value_offsets), value_list, 0xffffffff,
+                                     0xffffffff, 0, 0, 0, 0, 0, len(raw), 0) + raw)
+
+    def _subkey_list(self, offsets):
+        lists = []
+        for i in range(0, len(offsets), HIVE_LIST_MAX):
+            chunk = offsets[i:i + HIVE_LIST_MAX]
+            entries = b"".join(struct.pack("<II", offset, 0) for offset in chunk)
+            lists.append(self.cell(struct.pack("<2sH", b"lh", len(chunk)) + entries))
+        if len(lists) == 1:
+            return lists[0]
+        return self.cell(struct.pack(f"<2sH{len(lists)}I", b"ri", len(lists), *lists))
+
+    def save(self, path, root):
+        size = (len(self.data) + 4095) & ~4095
+        self.data += bytes(size - len(self.data))
+        self.data[:32] = struct.pack("<4sIII", b"hbin", 0, size, 0) + bytes(16)
+        header = bytearray(4096)
+        struct.pack_into("<4sIIQIIIIII", header, 0, b"regf", 1, 1, 0, 1, 5, 0, 1, root, size)
+        struct.pack_into("<I", header, 0x2c, 1)
+        checksum = 0
+        for word in struct.unpack_from("<127I", header):
+            checksum ^= word
+        struct.pack_into("<I", header, 508, checksum)
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self.data)
+
+def _sz(text):
+    return (text + "\0").encode("utf-16-le")
+
+def build_hive(path, programs=300, filler_mb=0, kind="SOFTWARE", seed=0):
+    # Returns the names of the programs a reader should list, updates and system components left out
+    rng = random.Random(seed)
+    w = _HiveWriter()
+    expected = []
+
+    # Unrelated keys first so the Uninstall keys end up at the far end of the file
+    filler = []
+    blob = bytes(rng.randrange(256) for _ in range(4096)) * 16
+    for n in range(int(filler_mb * 1024 * 1024 // (len(blob) + 4096))):
+        small = [w.key(f"{{{rng.randrange(1 << 64):016X}}}", [("", 1, _sz(f"Class {n}.{i}"))]) for i in range(8)]
+        filler.append(w.key(f"Component{n:06d}", [("Data", 3, blob)], small))
+
+    def uninstall(count):
+        entries = []
+        for n in range(count):
+            name = f"Program {n:05d} {rng.choice(EDITIONS)}"
+            values = [("DisplayName", 1, _sz(name)), ("DisplayVersion", 1, _sz(f"{rng.randrange(1, 30)}.{rng.randrange(10)}")),
+                      ("Publisher", 1, _sz(rng.choice(PUBLISHERS))), ("InstallLocation", 2, _sz(f"C:\\Program Files\\P{n}")),
+                      ("EstimatedSize", 4, struct.pack("<I", rng.randrange(1 << 20)))]
+            roll = rng.random()
+            if roll < 0.1:
+                values.append(("SystemComponent", 4, struct.pack("<I", 1)))
+            elif roll < 0.2:
+                values.append(("ParentKeyName", 1, _sz("Program 00000")))
+                values.append(("ReleaseType", 1, _sz("Update")))
+            elif roll < 0.25:
+                values = values[1:]
+            else:
+                expected.append(name)
+            key = f"{{{rng.randrange(1 << 128):032X}}}" if rng.random() < 0.7 else name
+            entries.append(w.key(key, values))
+        return w.key("Uninstall", (), entries)
+
+    def chain(names, leaf):
+        offset = leaf
+        for name in reversed(names):
+            offset = w.key(name, (), [offset])
+        return offset
+
+    path_names = ["Microsoft", "Windows", "CurrentVersion"]
+    native = chain(path_names, uninstall(programs))
+    wow = chain(["WOW6432Node"] + path_names, uninstall(programs // 4))
+    top = [w.key("Classes", (), filler), native, wow, w.key("Policies")]
+    if kind != "SOFTWARE":
+        top = [w.key("Software", (), top), w.key("Environment", [("TEMP", 2, _sz("%USERPROFILE%\\Temp"))])]
+    w.save(path, w.key("ROOT", (), top))
+    return expected
+
+def write_lnk(path, target, arguments=None, description=None, environment=False):
+    # A shell link with an item ID list, LinkInfo (or an environment block) and Unicode strings
+    flags = 0x1 | 0x80 | 0x10
+    strings = b""
+    for flag, text in ((0x4, description), (0x10, target.rpartition("\\")[0]), (0x20, arguments)):
+        if text is not None:
+            flags |= flag
+            strings += struct.pack("<H", len(text)) + text.encode("utf-16-le")
+    body = struct.pack("<H", 22) + struct.pack("<H", 20) + b"\x1fP" + bytes(16) + b"\0\0"
+    if environment:
+        flags |= 0x200
+    else:
+        flags |= 0x2
+        volume = struct.pack("<IIII", 17, 3, 0x1234, 16) + b"\0"
+        local = target.encode("cp1252") + b"\0"
+        size = 0x1C + len(volume) + len(local) + 1
+        body += struct.pack("<IIIIIII", size, 0x1C, 1, 0x1C, 0x1C + len(volume), 0, size - 1) + volume + local + b"\0"
+    header = struct.pack("<I16sIIQQQIiIHHII", 0x4C, bytes.fromhex("0114020000000000c000000000000046"),
+                         flags, 0x20, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0)
+    extra = b""
+    if environment:
+        extra = struct.pack("<II", 0x314, 0xA0000001) + target.encode("cp1252").ljust(260, b"\0") + \
+                target.encode("utf-16-le").ljust(520, b"\0")
+    with open(path, "wb") as f:
+        f.write(header + body + strings + extra + bytes(4))
+
+def _version_block(key, value=b"", text=False, children=()):
+    # One VS_VERSIONINFO-style block: header, UTF-16 key, value and child blocks, 32-bit aligned
+    def pad(data):
+        return data + bytes(-len(data) % 4)
+    body = pad(struct.pack("<HHH", 0, 0, 0) + key.encode("utf-16-le") + b"\0\0") + pad(value)
+    for child in children:
+        body = pad(body) + child
+    return struct.pack("<HHH", len(body), len(value) // 2 if text else len(value), int(text)) + body[6:]
+
+def write_pe(path, strings, version=(1, 0, 0, 0)):
+    # A PE32+ executable with one .rsrc section holding an RT_VERSION resource of these strings
+    entries = [_version_block(name, (text + "\0").encode("utf-16-le"), True) for name, text in strings.items()]
+    table = _version_block("040904b0", text=True, children=entries)
+    fixed = struct.pack("<13I", 0xFEEF04BD, 0x10000, version[0] << 16 | version[1], version[2] << 16 | version[3],
+                        version[0] << 16 | version[1], version[2] << 16 | version[3], 0x3F, 0, 0x4, 0x1, 0, 0, 0)
+    info = _version_block("VS_VERSION_INFO", fixed, children=[_version_block("StringFileInfo", text=True,
+                                                                             children=[table])])
+    # Resource tree: type RT_VERSION (16) -> name 1 -> language 0x409 -> data entry, then the data
+    rva = 0x1000
+    directory = struct.pack("<IIHHHH", 0, 0, 0, 0, 0, 1)
+    rsrc = (directory + struct.pack("<II", 16, 0x80000000 | 24) +
+            directory + struct.pack("<II", 1, 0x80000000 | 48) +
+            directory + struct.pack("<II", 0x409, 72) +
+            struct.pack("<IIII", rva + 96, len(info), 0, 0)).ljust(96, b"\0") + info
+    raw_size = (len(rsrc) + 0x1FF) & ~0x1FF
+
+    dos = b"MZ".ljust(0x3C, b"\0") + struct.pack("<I", 64)
+    coff = b"PE\0\0" + struct.pack("<HHIIIHH", 0x8664, 1, 0, 0, 0, 240, 0x22)
+    optional = bytearray(240)
+    struct.pack_into("<H", optional, 0, 0x20B)
+    struct.pack_into("<II", optional, 32, 0x1000, 0x200)
+    struct.pack_into("<II", optional, 56, rva + ((len(rsrc) + 0xFFF) & ~0xFFF), 0x200)
+    struct.pack_into("<H", optional, 68, 2)
+    struct.pack_into("<I", optional, 108, 16)
+    struct.pack_into("<II", optional, 112 + 2 * 8, rva, len(rsrc))
+    section = struct.pack("<8sIIIIIIHHI", b".rsrc", len(rsrc), rva, raw_size, 0x200, 0, 0, 0, 0, 0x40000040)
+    with open(path, "wb") as f:
+        f.write((dos + coff + bytes(optional) + section).ljust(0x200, b"\0") + rsrc.ljust(raw_size, b"\0"))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("out")
+    parser.add_argument("--pci", type=int, default=200)
+    parser.add_argument("--usb", type=int, default=300)
+    parser.add_argument("--block", type=int, default=50)
+    parser.add_argument("--hub-depth", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hive-mb", type=float, default=None, help="also write a SOFTWARE hive this big")
+    args = parser.parse_args()
+    fixture = build_fixture(args.out, args.pci, args.usb, args.block, args.hub_depth, args.seed)
+    print(f"{fixture.counts} under {fixture.sysfs}")
+    if args.hive_mb is not None:
+        path = os.path.join(args.out, "SOFTWARE")
+        programs = build_hive(path, filler_mb=args.hive_mb, seed=args.seed)
+        print(f"{len(programs)} programs in {path}")
+
+if __name__ == "__main__":
+    main()
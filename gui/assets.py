@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Pre-scaled image assets.
+#
+# Every asset is shown at a fixed logical width. build_variants() renders
+# 1x/2x/3x copies of it into images/scaled/ (listed in images/scaled.qrc and
+# compiled into image.rcc by gui.resources), and pixmap() picks the copy that
+# matches the screen's devicePixelRatio, so the full-size PNG is never
+# decoded at runtime. Decoded pixmaps are kept in a bounded QPixmapCache.
+
+import os
+
+from PySide6.QtCore import QFile, Qt
+from PySide6.QtGui import QGuiApplication, QImage, QPixmap, QPixmapCache
+
+from gui.resources import IMAGES_DIR, ensure_resources
+
+SCALED_DIR = os.path.join(IMAGES_DIR, "scaled")
+SCALES = (1, 2, 3)
+CACHE_LIMIT_KB = 8 * 1024
+
+# name -> logical width in device independent pixels
+ASSETS = {
+    "SwitcherooOS": 350,
+}
+
+def variant_name(name, scale):
+    return f"{name}@{scale}x.png"
+
+def build_variants(output_dir=SCALED_DIR):
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for name, width in ASSETS.items():
+        source = QImage(os.path.join(IMAGES_DIR, f"{name}.png"))
+        if source.isNull():
+            raise RuntimeError(f"cannot read {name}.png from {IMAGES_DIR}")
+        for scale in SCALES:
+            path = os.path.join(output_dir, variant_name(name, scale))
+            scaled = source.scaledToWidth(width * scale, Qt.SmoothTransformation)
+            if not scaled.save(path, "PNG"):
+                raise RuntimeError(f"cannot write {path}")
+            written.append(path)
+    return written
+
+def pick_scale(ratio):
+    for scale in SCALES:
+        if scale >= ratio:
+            return scale
+    return SCALES[-1]
+
+def device_pixel_ratio(widget=None):
+    if widget is not None:
+        return widget.devicePixelRatioF()
+    screen = QGuiApplication.primaryScreen()
+    return screen.devicePixelRatio() if screen is not None else 1.0
+
+def pixmap(name, widget=None):
+    scale = pick_scale(device_pixel_ratio(widget))
+    key = f"{name}@{scale}x"
+
+    pm = QPixmapCache.find(key)
+    if pm is not None:
+        return pm
+
+    ensure_resources()
+    if QPixmapCache.cacheLimit() != CACHE_LIMIT_KB:
+        QPixmapCache.setCacheLimit(CACHE_LIMIT_KB)
+
+    path = f":/newPrefix/scaled/{variant_name(name, scale)}"
+    if QFile.exists(path):
+        pm = QPixmap(path)
+    else:
+        # Variants are only in the .rcc, the generated module has just the
+        # original, so scale it once here and let the cache keep the result
+        pm = QPixmap(f":/newPrefix/{name}.png").scaledToWidth(ASSETS[name] * scale, Qt.SmoothTransformation)
+    pm.setDevicePixelRatio(scale)
+    QPixmapCache.insert(key, pm)
+    return pm
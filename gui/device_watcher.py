@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Keeps the device list from the "devices" probe up to date. Sockets are
+# watched with a QSocketNotifier and polled sources with a QTimer, both in
+# the main thread, so events arrive as signals carrying hardware.sysfs
+# records without any extra thread.
+
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer, Signal
+
+from hardware.hotplug import DeviceTracker, open_source
+
+class DeviceWatcher(QObject):
+    deviceAdded = Signal(object)
+    deviceRemoved = Signal(object)
+    deviceChanged = Signal(object)
+
+    def __init__(self, source=None, root=None, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.root = root
+        self.tracker = None
+        self.notifier = None
+        self.timer = None
+
+    def start(self, scanned):
+        # scanned: the hardware.sysfs scan() result, updated in place from now on
+        self.stop()
+        self.tracker = DeviceTracker(scanned, self.root)
+        if self.source is None:
+            self.source = open_source(self.root or "/sys")
+        fd = self.source.fileno()
+        if fd is not None:
+            self.notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+            self.notifier.activated.connect(self.process)
+        elif self.source.interval:
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.process)
+            self.timer.start(self.source.interval)
+
+    def process(self):
+        if self.tracker is None:
+            return
+        signals = {"add": self.deviceAdded, "remove": self.deviceRemoved, "change": self.deviceChanged}
+        for event in self.source.read():
+            change = self.tracker.apply(event)
+            if change is not None:
+                signals[change[0]].emit(change[1])
+
+    def stop(self):
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier.deleteLater()
+            self.notifier = None
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer = None
+
+    def close(self):
+        self.stop()
+        if self.source is not None:
+            self.source.close()
+            self.source = None
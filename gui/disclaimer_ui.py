@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+################################################################################
+## Form generated from reading UI file 'disclaimer.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.1
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QLabel, QPushButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_DisclaimerPage(object):
+    def setupUi(self, DisclaimerPage):
+        if not DisclaimerPage.objectName():
+            DisclaimerPage.setObjectName(u"DisclaimerPage")
+        DisclaimerPage.resize(734, 542)
+        self.verticalLayout_4 = QVBoxLayout(DisclaimerPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.label_3 = QLabel(DisclaimerPage)
+        self.label_3.setObjectName(u"label_3")
+
+        self.verticalLayout_4.addWidget(self.label_3)
+
+        self.checkBox_2 = QCheckBox(DisclaimerPage)
+        self.checkBox_2.setObjectName(u"checkBox_2")
+
+        self.verticalLayout_4.addWidget(self.checkBox_2)
+
+        self.pushButton_3 = QPushButton(DisclaimerPage)
+        self.pushButton_3.setObjectName(u"pushButton_3")
+        self.pushButton_3.setEnabled(False)
+        icon = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.GoNext))
+        self.pushButton_3.setIcon(icon)
+
+        self.verticalLayout_4.addWidget(self.pushButton_3)
+
+
+        self.retranslateUi(DisclaimerPage)
+        self.checkBox_2.toggled.connect(self.pushButton_3.setEnabled)
+
+        QMetaObject.connectSlotsByName(DisclaimerPage)
+    # setupUi
+
+    def retranslateUi(self, DisclaimerPage):
+        self.label_3.setText(QCoreApplication.translate("DisclaimerPage", u"<html><head/><body><p><span style=\" font-size:20pt; font-weight:700;\">DISCLAIMER: NO WARRANTY</span><span style=\" font-size:12pt;\"><br/><br/></span><span style=\" font-size:14pt;\"><br/>SwitcherooOS - helps to switch to a linux distro easily<br/>Copyright (C) 2025 Raffaele</span></p><p><span style=\" font-size:14pt;\">This program is distributed in the hope that it will be useful,<br/>but WITHOUT ANY WARRANTY; without even the implied warranty of<br/>MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the<br/>GNU General Public License for more details.</span></p><p><span style=\" font-size:14pt;\">You should have received a copy of the GNU General Public License<br/>along with this program. If not, see &lt;</span><a href=\"https://www.gnu.org/licenses/\"><span style=\" font-size:14pt; text-decoration: underline; color:#1d99f3;\">https://www.gnu.org/licenses/</span></a><span style=\" font-size:14pt;\">&gt;.</span></p></body></html>", None))
+        self.checkBox_2.setText(QCoreApplication.translate("DisclaimerPage", u"I accept", None))
+        self.pushButton_3.setText(QCoreApplication.translate("DisclaimerPage", u"Next", None))
+        pass
+    # retranslateUi
+
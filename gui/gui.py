@@ -16,36 +16,152 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from PySide6.QtWidgets import QApplication, QMainWindow
+import os
+import sys
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QMainWindow, QWidget
 from gui.windows_ui import Ui_MainWindow
+from gui.resources import ROOT, ensure_resources
+from gui import assets
+from gui.probe_runner import ProbeRunner
+from gui.device_watcher import DeviceWatcher
+from gui.steps import Step, StepGraph
+from system import tracing
 
 class MainApp(QMainWindow, Ui_MainWindow):
+    # Delay before building the page after the current one, so the prefetch
+    # never competes with painting the page that was just shown
+    PREFETCH_DELAY_MS = 50
+
+    STEPS = (
+        Step("welcome", prefetch=("platform", "is_live")),
+        Step("license", guard=lambda app: app.license_ui.checkBox.isChecked()),
+        Step("disclaimer", guard=lambda app: app.disclaimer_ui.checkBox_2.isChecked(), prefetch=("devices",)),
+        Step("linux_intro"),
+    )
+
     def __init__(self):
         super().__init__()
-        self.setupUi(self)
-        self.stackedWidget.setCurrentIndex(0)
-
-        self.pushButton.clicked.connect(self.on_pushButton_clicked)
-        self.pushButton_2.clicked.connect(self.on_pushButton_2_clicked)
-        self.pushButton_3.clicked.connect(self.on_pushButton_3_clicked)
-
-    def on_pushButton_clicked(self):
-        sw = self.stackedWidget
-        next_idx = (sw.currentIndex() + 1) % sw.count()
-        sw.setCurrentIndex(next_idx)
-        #self.stackedWidget.setCurrentIndex(1)
-
-    def on_pushButton_2_clicked(self):
-        sw = self.stackedWidget
-        next_idx = (sw.currentIndex() + 1) % sw.count()
-        sw.setCurrentIndex(next_idx)
-        #self.stackedWidget.setCurrentIndex(1)
-
-    def on_pushButton_3_clicked(self):
-        sw = self.stackedWidget
-        next_idx = (sw.currentIndex() + 1) % sw.count()
-        sw.setCurrentIndex(next_idx)
-        #self.stackedWidget.setCurrentIndex(1)
+        with tracing.span("ensure_resources"):
+            ensure_resources()
+        with tracing.span("setupUi"):
+            self.setupUi(self)
+        with tracing.span("logo pixmap"):
+            self.Logo.setPixmap(assets.pixmap("SwitcherooOS", self.Logo))
+
+        # System probes run on a thread pool, pages subscribe to the results
+        # they need with watch_probe() and fill in as they arrive, or learn
+        # that the probe failed
+        self.probe_listeners = {}
+        self.probes = ProbeRunner(parent=self)
+        self.probes.probeFinished.connect(self.on_probe_finished)
+        self.probes.probeFailed.connect(self.on_probe_failed)
+
+        # Once the first scan is in, hotplug events keep it current and pages
+        # follow the deviceAdded/deviceRemoved/deviceChanged signals
+        self.device_watcher = DeviceWatcher(parent=self)
+        self.watch_probe("devices", self.start_device_watcher)
+
+        # Only the welcome page comes from setupUi, every other page is built
+        # by its factory the first time it is shown or prefetched
+        self.page_factories = {}
+        self.pages = {}
+        self.register_page("welcome", lambda: self.page)
+        self.register_page("license", self.build_license_page)
+        self.register_page("disclaimer", self.build_disclaimer_page)
+        self.register_page("linux_intro", self.build_linux_intro_page)
+
+        self.steps = StepGraph(self.STEPS)
+        self.current_step = None
+        self.pushButton.clicked.connect(self.next_step)
+        self.show_step(self.steps.first)
+
+    def retranslateUi(self, MainWindow):
+        with tracing.span("retranslateUi"):
+            super().retranslateUi(MainWindow)
+
+    def register_page(self, name, factory):
+        self.page_factories[name] = factory
+
+    def page_widget(self, name):
+        widget = self.pages.get(name)
+        if widget is None:
+            with tracing.span(f"build page {name}", cat="page"):
+                widget = self.page_factories[name]()
+            if self.stackedWidget.indexOf(widget) < 0:
+                self.stackedWidget.addWidget(widget)
+            self.pages[name] = widget
+        return widget
+
+    def show_step(self, name):
+        step = self.steps[name]
+        self.current_step = name
+        self.stackedWidget.setCurrentWidget(self.page_widget(step.page))
+        if step.prefetch:
+            self.probes.start(step.prefetch)
+        QTimer.singleShot(self.PREFETCH_DELAY_MS, self.prefetch_next_page)
+
+    def prefetch_next_page(self):
+        step = self.steps.next_step(self.current_step)
+        if step is not None:
+            self.page_widget(step.page)
+
+    def next_step(self):
+        step = self.steps.next_step(self.current_step)
+        if step is not None and self.steps.can_leave(self.current_step, self):
+            self.show_step(step.name)
+
+    def watch_probe(self, name, callback, on_error=None):
+        # on_error(message) is called instead of callback if the probe fails
+        if name in self.probes.results:
+            callback(self.probes.results[name])
+        else:
+            self.probe_listeners.setdefault(name, []).append((callback, on_error))
+
+    def on_probe_finished(self, name, value):
+        for callback, _ in self.probe_listeners.pop(name, []):
+            callback(value)
+
+    def on_probe_failed(self, name, message):
+        # Listeners are dropped either way, they can watch again when a later step retries the probe
+        print(f"probe {name} failed: {message}", file=sys.stderr)
+        for _, on_error in self.probe_listeners.pop(name, []):
+            if on_error is not None:
+                on_error(message)
+
+    def start_device_watcher(self, devices):
+        if devices:
+            self.device_watcher.start(devices)
+
+    def closeEvent(self, event):
+        self.probes.cancel()
+        self.device_watcher.close()
+        super().closeEvent(event)
+
+    def build_license_page(self):
+        from gui.license_ui import Ui_LicensePage
+        page = QWidget()
+        self.license_ui = Ui_LicensePage()
+        self.license_ui.setupUi(page)
+        self.license_ui.licenseViewer.load(os.path.join(ROOT, "LICENSE"))
+        self.license_ui.pushButton_2.clicked.connect(self.next_step)
+        return page
+
+    def build_disclaimer_page(self):
+        from gui.disclaimer_ui import Ui_DisclaimerPage
+        page = QWidget()
+        self.disclaimer_ui = Ui_DisclaimerPage()
+        self.disclaimer_ui.setupUi(page)
+        self.disclaimer_ui.pushButton_3.clicked.connect(self.next_step)
+        return page
+
+    def build_linux_intro_page(self):
+        from gui.linux_intro_ui import Ui_LinuxIntroPage
+        page = QWidget()
+        self.linux_intro_ui = Ui_LinuxIntroPage()
+        self.linux_intro_ui.setupUi(page)
+        return page
 
 if __name__ == "__main__":
     app = QApplication([])
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+################################################################################
+## Form generated from reading UI file 'license.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.1
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QPushButton, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+from gui.text_viewer import TextFileViewer
+
+class Ui_LicensePage(object):
+    def setupUi(self, LicensePage):
+        if not LicensePage.objectName():
+            LicensePage.setObjectName(u"LicensePage")
+        LicensePage.resize(734, 542)
+        self.verticalLayout_2 = QVBoxLayout(LicensePage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.licenseViewer = TextFileViewer(LicensePage)
+        self.licenseViewer.setObjectName(u"licenseViewer")
+
+        self.verticalLayout_2.addWidget(self.licenseViewer)
+
+        self.checkBox = QCheckBox(LicensePage)
+        self.checkBox.setObjectName(u"checkBox")
+
+        self.verticalLayout_2.addWidget(self.checkBox)
+
+        self.pushButton_2 = QPushButton(LicensePage)
+        self.pushButton_2.setObjectName(u"pushButton_2")
+        self.pushButton_2.setEnabled(False)
+        icon = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.GoNext))
+        self.pushButton_2.setIcon(icon)
+        self.pushButton_2.setCheckable(False)
+        self.pushButton_2.setChecked(False)
+        self.pushButton_2.setAutoDefault(False)
+        self.pushButton_2.setFlat(False)
+
+        self.verticalLayout_2.addWidget(self.pushButton_2)
+
+
+        self.retranslateUi(LicensePage)
+        self.checkBox.toggled.connect(self.pushButton_2.setEnabled)
+
+        self.pushButton_2.setDefault(False)
+
+
+        QMetaObject.connectSlotsByName(LicensePage)
+    # setupUi
+
+    def retranslateUi(self, LicensePage):
+        self.checkBox.setText(QCoreApplication.translate("LicensePage", u"I accept", None))
+        self.pushButton_2.setText(QCoreApplication.translate("LicensePage", u"Next", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+################################################################################
+## Form generated from reading UI file 'linux_intro.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.1
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QLabel, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_LinuxIntroPage(object):
+    def setupUi(self, LinuxIntroPage):
+        if not LinuxIntroPage.objectName():
+            LinuxIntroPage.setObjectName(u"LinuxIntroPage")
+        LinuxIntroPage.resize(734, 542)
+        self.verticalLayout_5 = QVBoxLayout(LinuxIntroPage)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.label_4 = QLabel(LinuxIntroPage)
+        self.label_4.setObjectName(u"label_4")
+
+        self.verticalLayout_5.addWidget(self.label_4)
+
+
+        self.retranslateUi(LinuxIntroPage)
+
+        QMetaObject.connectSlotsByName(LinuxIntroPage)
+    # setupUi
+
+    def retranslateUi(self, LinuxIntroPage):
+        self.label_4.setText(QCoreApplication.translate("LinuxIntroPage", u"<html><head/><body><p><span style=\" font-size:16pt; font-weight:700;\">What is Linux?</span></p><p><span style=\" font-size:12pt; font-weight:700;\">Linux</span><span style=\" font-size:12pt;\"> is the core engine (called the </span><span style=\" font-size:12pt; font-style:italic;\">kernel</span><span style=\" font-size:12pt;\">) that makes your computer hardware work. <br/>But an engine alone isn\u2019t a full car, and Linux alone isn\u2019t a full operating system. <br/>The complete system you actually use (with windows, menus, apps, and file manager like file explorer)<br/>is built by </span><span style=\" font-size:12pt; font-weight:700;\">GNU</span><span style=\" font-size:12pt;\">. <br/>Together, they form </span><span style=\" font-size:12pt; font-weight:700;\">GNU/Linux</span><span style=\" font-size:12pt;\">: a free, open alternative to Windows or macOS.<br/>When people say &quot;Linux,&quot; they often mean popular versions like Ubuntu or Mint,<br/>which are </span><span style=\" font-size:12pt; fo"
+                        "nt-style:italic;\">distributions</span><span style=\" font-size:12pt;\"> of </span><span style=\" font-size:12pt; font-weight:700;\">GNU/Linux.</span><span style=\" font-size:12pt;\"><br/>You get </span><span style=\" font-size:12pt; font-weight:700;\">freedom</span><span style=\" font-size:12pt;\">: no cost, no forced updates, and total control over your system.</span></p><p><span style=\" font-size:16pt; font-weight:700;\">What is Open Source?</span></p><p><span style=\" font-size:12pt;\">TODO</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
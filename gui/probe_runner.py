@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Runs system probes off the Qt main thread. Results are emitted from the
+# pool threads and Qt queues them to receivers living in the main thread.
+
+from PySide6.QtCore import QObject, Signal
+
+from system.cache import default_cache
+from system.probes import default_registry
+
+class ProbeRunner(QObject):
+    probeFinished = Signal(str, object)
+    probeFailed = Signal(str, str)
+    finished = Signal()
+
+    def __init__(self, registry=None, cache=None, parent=None):
+        super().__init__(parent)
+        self.registry = registry if registry is not None else default_registry()
+        self.cache = cache if cache is not None else default_cache()
+        self.results = {}
+        self.runs = []
+
+    def _on_result(self, name, value):
+        self.results[name] = value
+        self.probeFinished.emit(name, value)
+
+    def start(self, names=None):
+        # Probes that already finished in an earlier run are reused as inputs
+        run = self.registry.start(names,
+                                  on_result=self._on_result,
+                                  on_error=lambda name, e: self.probeFailed.emit(name, str(e)),
+                                  on_complete=self.finished.emit,
+                                  cache=self.cache,
+                                  known=dict(self.results))
+        self.runs = [r for r in self.runs if not r.done()] + [run]
+        return run
+
+    def cancel(self):
+        for run in self.runs:
+            run.cancel()
+        self.runs.clear()
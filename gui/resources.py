@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Registers the :/newPrefix/... resources the first time they are needed.
+#
+# The preferred source is images/image.rcc, a binary resource file that Qt
+# memory-maps, so nothing is decoded until a resource is actually read.
+# When the .rcc has not been built (or SWITCHEROO_RESOURCES=module is set)
+# the generated gui.image_rc module is imported instead.
+#
+# Build the .rcc (and the pre-scaled images, see gui.assets) with:
+#   python -m gui.resources
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(ROOT, "images")
+QRC_PATH = os.path.join(IMAGES_DIR, "image.qrc")
+SCALED_QRC_PATH = os.path.join(IMAGES_DIR, "scaled.qrc")
+RCC_PATH = os.path.join(IMAGES_DIR, "image.rcc")
+
+MODE_ENV = "SWITCHEROO_RESOURCES"
+MODES = ("auto", "rcc", "module")
+
+_loaded_mode = None
+
+def resource_mode():
+    mode = os.environ.get(MODE_ENV, "auto").lower()
+    return mode if mode in MODES else "auto"
+
+def ensure_resources():
+    global _loaded_mode
+    if _loaded_mode is not None:
+        return _loaded_mode
+
+    mode = resource_mode()
+    if mode != "module" and os.path.exists(RCC_PATH):
+        from PySide6.QtCore import QResource
+        if QResource.registerResource(RCC_PATH):
+            _loaded_mode = "rcc"
+            return _loaded_mode
+    if mode == "rcc":
+        raise RuntimeError(f"cannot register {RCC_PATH}, run 'python -m gui.resources' first")
+
+    import gui.image_rc
+    _loaded_mode = "module"
+    return _loaded_mode
+
+def build(output=RCC_PATH):
+    from gui.assets import build_variants
+    build_variants()
+
+    # The PNGs are already compressed, storing them as-is lets Qt hand out the
+    # mapped bytes directly instead of inflating a copy
+    subprocess.run(["pyside6-rcc", "--binary", "--no-compress", QRC_PATH, SCALED_QRC_PATH, "-o", output], check=True)
+    return output
+
+if __name__ == "__main__":
+    print(build(*sys.argv[1:2]))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Declarative wizard step graph.
+#
+# A step names the page it shows, the step that follows it (by default the
+# next one in the list), a guard that must hold before the user can leave it
+# and the probes to prefetch while it is on screen, so the work the
+# following steps need is already running when the user presses Next.
+
+class Step:
+    __slots__ = ("name", "page", "next", "guard", "prefetch")
+
+    def __init__(self, name, page=None, next=None, guard=None, prefetch=()):
+        self.name = name
+        self.page = page or name
+        self.next = next
+        self.guard = guard
+        self.prefetch = tuple(prefetch)
+
+class StepGraph:
+    def __init__(self, steps):
+        self.steps = {}
+        self.following = {}
+        self.first = steps[0].name if steps else None
+        for i, step in enumerate(steps):
+            if step.name in self.steps:
+                raise ValueError(f"duplicate wizard step {step.name!r}")
+            self.steps[step.name] = step
+            following = step.next
+            if following is None and i + 1 < len(steps):
+                following = steps[i + 1].name
+            self.following[step.name] = following
+        for name, following in self.following.items():
+            if following is not None and following not in self.steps:
+                raise ValueError(f"step {name!r} continues to unknown step {following!r}")
+
+    def __getitem__(self, name):
+        return self.steps[name]
+
+    def next_step(self, name):
+        following = self.following[name]
+        return self.steps[following] if following is not None else None
+
+    def can_leave(self, name, context):
+        guard = self.steps[name].guard
+        return guard is None or bool(guard(context))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Read-only viewer for long plain text files.
+#
+# The file is never loaded as a whole: load() scans it once and keeps only
+# the byte offset of every BLOCK_LINES-th line, blocks of lines are read back
+# on demand into a small LRU cache, and paintEvent() only draws the lines
+# that fit in the viewport. Memory and layout time don't depend on how long
+# the document is.
+
+from array import array
+from collections import OrderedDict
+
+from PySide6.QtGui import QFontDatabase, QPainter
+from PySide6.QtWidgets import QAbstractScrollArea
+
+class TextFileViewer(QAbstractScrollArea):
+    BLOCK_LINES = 256
+    CACHED_BLOCKS = 8
+    MARGIN = 6
+    TAB_SIZE = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._path = None
+        self._encoding = "utf-8"
+        self._offsets = array("Q")
+        self._line_count = 0
+        self._max_columns = 0
+        self._blocks = OrderedDict()
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+
+    def path(self):
+        return self._path
+
+    def line_count(self):
+        return self._line_count
+
+    def load(self, path, encoding="utf-8"):
+        offsets = array("Q")
+        line_count = 0
+        max_columns = 0
+        pos = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                if line_count % self.BLOCK_LINES == 0:
+                    offsets.append(pos)
+                pos += len(raw)
+                line_count += 1
+                if len(raw) > max_columns or b"\t" in raw:
+                    # Without tabs the byte length is an upper bound, so most
+                    # lines never need decoding here
+                    max_columns = max(max_columns, len(self._decode(raw, encoding)))
+
+        self._path = path
+        self._encoding = encoding
+        self._offsets = offsets
+        self._line_count = line_count
+        self._max_columns = max_columns
+        self._blocks.clear()
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def _decode(self, raw, encoding):
+        return raw.decode(encoding, errors="replace").rstrip("\r\n").expandtabs(self.TAB_SIZE)
+
+    def _block(self, index):
+        lines = self._blocks.get(index)
+        if lines is not None:
+            self._blocks.move_to_end(index)
+            return lines
+
+        lines = []
+        with open(self._path, "rb") as f:
+            f.seek(self._offsets[index])
+            for _ in range(self.BLOCK_LINES):
+                raw = f.readline()
+                if not raw:
+                    break
+                lines.append(self._decode(raw, self._encoding))
+
+        self._blocks[index] = lines
+        if len(self._blocks) > self.CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+        return lines
+
+    def lines(self, first, count):
+        last = min(first + count, self._line_count)
+        out = []
+        line = first
+        while line < last:
+            block, start = divmod(line, self.BLOCK_LINES)
+            chunk = self._block(block)[start:start + last - line]
+            if not chunk:
+                break
+            out.extend(chunk)
+            line += len(chunk)
+        return out
+
+    def _visible_lines(self):
+        spacing = self.fontMetrics().lineSpacing()
+        return max(1, (self.viewport().height() - 2 * self.MARGIN) // spacing)
+
+    def _update_scrollbars(self):
+        visible = self._visible_lines()
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(0, self._line_count - visible))
+        vbar.setPageStep(visible)
+        vbar.setSingleStep(1)
+
+        char_width = self.fontMetrics().horizontalAdvance("M")
+        width = self._max_columns * char_width + 2 * self.MARGIN
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(0, width - self.viewport().width()))
+        hbar.setPageStep(self.viewport().width())
+        hbar.setSingleStep(char_width)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        self._update_scrollbars()
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        if self._path is None:
+            return
+        metrics = self.fontMetrics()
+        spacing = metrics.lineSpacing()
+        first = self.verticalScrollBar().value()
+        x = self.MARGIN - self.horizontalScrollBar().value()
+        y = self.MARGIN + metrics.ascent()
+
+        painter = QPainter(self.viewport())
+        painter.setPen(self.palette().text().color())
+        for text in self.lines(first, self._visible_lines() + 1):
+            painter.drawText(x, y, text)
+            y += spacing
+        painter.end()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Offline hardware compatibility store built from linux-hardware.org dumps.
+#
+# A dump is a CSV/TSV file (optionally gzipped) with one row per device:
+#
+#   bus,vendor,device,subvendor,subdevice,class,driver,works,detected,failed
+#
+# IDs are hex, empty subvendor/subdevice means "any subsystem" and the last
+# three columns are report counts. Delta dumps may add an "op" column where
+# "D" deletes the row. Rows are upserted into an SQLite table keyed (and so
+# indexed) on bus, vendor, device and subsystem IDs; unchanged rows are not
+# rewritten and a dump whose checksum was already imported is skipped, so
+# a refresh only touches what changed. A malformed row aborts the whole dump
+# with a CompatDBError naming its file and line.
+#
+#   python -m hardware.compatdb import dump.csv.gz [--db PATH]
+#   python -m hardware.compatdb lookup pci 8086 46a6
+#   python -m hardware.compatdb check [--root /sys]
+
+import argparse
+import csv
+import gzip
+import io
+import os
+import sys
+import time
+
+from system.store import Store, default_data_dir, sha256_file
+
+SCHEMA_VERSION = 1
+ANY = -1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS devices (
+    bus TEXT NOT NULL,
+    vendor INTEGER NOT NULL,
+    device INTEGER NOT NULL,
+    subvendor INTEGER NOT NULL DEFAULT -1,
+    subdevice INTEGER NOT NULL DEFAULT -1,
+    class TEXT,
+    driver TEXT,
+    works INTEGER NOT NULL DEFAULT 0,
+    detected INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bus, vendor, device, subvendor, subdevice)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS devices_subsystem ON devices (bus, subvendor, subdevice);
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    imported_at REAL NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO devices (bus, vendor, device, subvendor, subdevice, class, driver, works, detected, failed)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (bus, vendor, device, subvendor, subdevice) DO UPDATE SET
+    class = excluded.class, driver = excluded.driver,
+    works = excluded.works, detected = excluded.detected, failed = excluded.failed
+WHERE class IS NOT excluded.class OR driver IS NOT excluded.driver
+    OR works != excluded.works OR detected != excluded.detected OR failed != excluded.failed
+"""
+
+# The exact subsystem row sorts before the generic one for each wanted device
+BATCH = """
+SELECT w.pos, d.* FROM wanted w
+JOIN devices d ON d.bus = w.bus AND d.vendor = w.vendor AND d.device = w.device
+    AND ((d.subvendor = w.subvendor AND d.subdevice = w.subdevice) OR (d.subvendor = -1 AND d.subdevice = -1))
+ORDER BY w.pos, d.subvendor = -1
+"""
+
+DELETE = "DELETE FROM devices WHERE bus = ? AND vendor = ? AND device = ? AND subvendor = ? AND subdevice = ?"
+
+class CompatDBError(Exception):
+    pass
+
+# Alternative header names seen in exports
+ALIASES = {
+    "vendor_id": "vendor", "device_id": "device",
+    "subvendor_id": "subvendor", "subdevice_id": "subdevice",
+    "subsys_vendor": "subvendor", "subsys_device": "subdevice",
+    "device_class": "class", "type": "class",
+}
+
+def default_db_path():
+    return os.path.join(default_data_dir(), "hardware.db")
+
+def parse_id(value):
+    value = (value or "").strip().lower()
+    if not value or value in ("*", "-", "any"):
+        return ANY
+    return int(value[2:] if value.startswith("0x") else value, 16)
+
+def format_id(value):
+    return "" if value == ANY else f"{value:04x}"
+
+class Compat:
+    __slots__ = ("bus", "vendor", "device", "subvendor", "subdevice", "device_class", "driver",
+                 "works", "detected", "failed")
+
+    def __init__(self, bus, vendor, device, subvendor, subdevice, device_class, driver, works, detected, failed):
+        self.bus = bus
+        self.vendor = vendor
+        self.device = device
+        self.subvendor = subvendor
+        self.subdevice = subdevice
+        self.device_class = device_class
+        self.driver = driver
+        self.works = works
+        self.detected = detected
+        self.failed = failed
+
+    @property
+    def reports(self):
+        return self.works + self.detected + self.failed
+
+    @property
+    def confidence(self):
+        # Share of conclusive reports that say the device works
+        conclusive = self.works + self.failed
+        return self.works / conclusive if conclusive else 0.0
+
+    @property
+    def status(self):
+        if self.works and self.confidence >= 0.5:
+            return "works"
+        if self.failed:
+            return "failed"
+        return "detected" if self.detected else "unknown"
+
+    def __repr__(self):
+        sub = f" {format_id(self.subvendor)}:{format_id(self.subdevice)}" if self.subvendor != ANY else ""
+        return f"<Compat {self.bus} {self.vendor:04x}:{self.device:04x}{sub} {self.status} ({self.reports} reports)>"
+
+class CompatGroup:
+    # Every device of one class on a machine, with the report counts summed
+    __slots__ = ("device_class", "matches", "missing", "works", "detected", "failed")
+
+    def __init__(self, device_class):
+        self.device_class = device_class
+        self.matches = []
+        self.missing = []
+        self.works = 0
+        self.detected = 0
+        self.failed = 0
+
+    def add(self, key, compat):
+        if compat is None:
+            self.missing.append(key)
+            return
+        self.matches.append((key, compat))
+        self.works += compat.works
+        self.detected += compat.detected
+        self.failed += compat.failed
+
+    @property
+    def reports(self):
+        return self.works + self.detected + self.failed
+
+    @property
+    def confidence(self):
+        conclusive = self.works + self.failed
+        return self.works / conclusive if conclusive else 0.0
+
+    def __repr__(self):
+        return (f"<CompatGroup {self.device_class}: {len(self.matches)} known, {len(self.missing)} unknown, "
+                f"confidence {self.confidence:.0%} ({self.reports} reports)>")
+
+def scanned_class(device):
+    # A hardware.sysfs record's class written the way dumps do (hex), None for tuples
+    value = getattr(device, "device_class", None)
+    if not value and getattr(device, "interface_classes", None):
+        # USB devices of class 0 have one per interface
+        value = device.interface_classes[0]
+    return None if value is None else f"{value:x}"
+
+def device_key(device):
+    # (bus, vendor, device, subvendor, subdevice) from a tuple or a hardware.sysfs record
+    if isinstance(device, tuple):
+        key = device + (ANY,) * (5 - len(device))
+    else:
+        key = (device.bus, device.vendor, device.device, device.subvendor, device.subdevice)
+    return key[:3] + tuple(ANY if i is None else i for i in key[3:5])
+
+class CompatDB(Store):
+    def __init__(self, path=None):
+        super().__init__(path or default_db_path(), SCHEMA, SCHEMA_VERSION)
+
+    def source_checksum(self, name):
+        row = self.conn.execute("SELECT sha256 FROM sources WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def import_dump(self, path, name=None, force=False):
+        # Returns the number of rows read, or None when the dump was unchanged; dumps are
+        # remembered by their resolved path, different directories may hold a dump.csv.gz each
+        name = name or os.path.realpath(path)
+        digest = sha256_file(path)
+        if not force and self.source_checksum(name) == digest:
+            return None
+
+        count = 0
+        with _open_text(path) as f, self.conn:
+            upserts = []
+            for row in _read_rows(f, path):
+                count += 1
+                key = (row["bus"], row["vendor"], row["device"], row["subvendor"], row["subdevice"])
+                if row["op"] == "D":
+                    # Keep the file's order in case the same row comes back later
+                    self.conn.executemany(UPSERT, upserts)
+                    upserts.clear()
+                    self.conn.execute(DELETE, key)
+                    continue
+                upserts.append(key + (row["class"], row["driver"], row["works"], row["detected"], row["failed"]))
+                if len(upserts) >= 10000:
+                    self.conn.executemany(UPSERT, upserts)
+                    upserts.clear()
+            self.conn.executemany(UPSERT, upserts)
+            self.conn.execute("INSERT OR REPLACE INTO sources (name, sha256, rows, imported_at) VALUES (?, ?, ?, ?)",
+                              (name, digest, count, time.time()))
+        return count
+
+    def lookup(self, bus, vendor, device, subvendor=ANY, subdevice=ANY):
+        # The exact subsystem row if there is one, otherwise the generic row
+        row = self.conn.execute(
+            "SELECT * FROM devices WHERE bus = ? AND vendor = ? AND device = ? "
+            "AND ((subvendor = ? AND subdevice = ?) OR (subvendor = -1 AND subdevice = -1)) "
+            "ORDER BY subvendor = -1 LIMIT 1",
+            (bus, vendor, device, subvendor, subdevice)).fetchone()
+        return Compat(*row) if row else None
+
+    def lookup_many(self, devices):
+        # One query for a whole machine, returns (key, Compat or None) pairs in input order
+        keys = [device_key(d) for d in devices]
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted "
+                              "(pos INTEGER PRIMARY KEY, bus TEXT, vendor INTEGER, device INTEGER, "
+                              "subvendor INTEGER, subdevice INTEGER)")
+            self.conn.execute("DELETE FROM wanted")
+            self.conn.executemany("INSERT INTO wanted VALUES (?, ?, ?, ?, ?, ?)",
+                                  ((pos,) + key for pos, key in enumerate(keys)))
+            found = {}
+            for row in self.conn.execute(BATCH):
+                found.setdefault(row[0], Compat(*row[1:]))
+            self.conn.execute("DELETE FROM wanted")
+        return [(key, found.get(pos)) for pos, key in enumerate(keys)]
+
+    def check(self, devices):
+        # lookup_many() grouped by device class, the store's or for devices it doesn't
+        # know the scanned one; "unknown" when neither says
+        groups = {}
+        for device, (key, compat) in zip(devices, self.lookup_many(devices)):
+            device_class = compat.device_class if compat is not None and compat.device_class else None
+            device_class = device_class or scanned_class(device) or "unknown"
+            group = groups.get(device_class)
+            if group is None:
+                group = groups[device_class] = CompatGroup(device_class)
+            group.add(key, compat)
+        return groups
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM devices").fetchone()[0]
+
+def _open_text(path):
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+def _read_rows(f, path):
+    first = f.readline()
+    dialect = "excel-tab" if "\t" in first else "excel"
+    header = [ALIASES.get(h.strip().lower(), h.strip().lower()) for h in next(csv.reader([first], dialect))]
+    missing = {"bus", "vendor", "device"} - set(header)
+    if missing:
+        raise CompatDBError(f"{path}: dump is missing columns: {', '.join(sorted(missing))}")
+
+    reader = csv.reader(f, dialect)
+    for values in reader:
+        if not values:
+            continue
+        # +1 for the header line read above
+        line = reader.line_num + 1
+        if len(values) < len(header):
+            raise CompatDBError(f"{path}:{line}: expected {len(header)} fields, got {len(values)}")
+        raw = dict(zip(header, values))
+        try:
+            yield {
+                "bus": raw["bus"].strip().lower(),
+                "vendor": parse_id(raw["vendor"]),
+                "device": parse_id(raw["device"]),
+                "subvendor": parse_id(raw.get("subvendor")),
+                "subdevice": parse_id(raw.get("subdevice")),
+                "class": raw.get("class") or None,
+                "driver": raw.get("driver") or None,
+                "works": int(raw.get("works") or 0),
+                "detected": int(raw.get("detected") or 0),
+                "failed": int(raw.get("failed") or 0),
+                "op": (raw.get("op") or "").strip().upper(),
+            }
+        except ValueError as e:
+            raise CompatDBError(f"{path}:{line}: {e}") from None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hardware.compatdb")
+    parser.add_argument("--db", default=None, help="database path (default: $XDG_DATA_HOME/switcheroo/hardware.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("import", help="import full or delta dumps")
+    p.add_argument("dumps", nargs="+")
+    p.add_argument("--force", action="store_true", help="import even if the dump was already imported")
+    p = sub.add_parser("lookup", help="look a device up")
+    p.add_argument("bus")
+    p.add_argument("ids", nargs="+", help="vendor device [subvendor subdevice]")
+    p = sub.add_parser("check", help="check every PCI and USB device on this machine")
+    p.add_argument("--root", default="/sys", help="sysfs root to scan (default: /sys)")
+    args = parser.parse_args(argv)
+
+    with CompatDB(args.db) as db:
+        if args.command == "import":
+            for dump in args.dumps:
+                try:
+                    count = db.import_dump(dump, force=args.force)
+                except CompatDBError as e:
+                    print(e, file=sys.stderr)
+                    return 1
+                print(f"{dump}: " + ("unchanged" if count is None else f"{count} rows"))
+            print(f"{db.count()} devices in {db.path}")
+        elif args.command == "lookup":
+            print(db.lookup(args.bus, *(parse_id(i) for i in args.ids[:4])))
+        else:
+            from hardware.sysfs import pci_devices, usb_devices
+            for group in db.check(pci_devices(args.root) + usb_devices(args.root)).values():
+                print(group)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Firmware the matched kernel modules ask for, and which of it is missing.
+#
+# The firmware= entries come straight from the .modinfo ELF section of the
+# module files (.ko, .ko.gz, .ko.xz and .ko.zst; zstd needs Python 3.14's
+# compression.zstd or the zstandard package). Modules are found through
+# modules.dep, read on a process pool and the results cached by path, size
+# and mtime in $XDG_CACHE_HOME/switcheroo/firmware.json. The declared blobs
+# are then checked against /lib/firmware (compressed or not) or against a
+# distro manifest listing the firmware files a release ships. Modules that
+# can't be read (truncated, corrupt, or .zst without a decoder) are
+# reported as unreadable, never as needing no firmware, and aren't cached.
+#
+#   python -m hardware.firmware [--kernel RELEASE] [--manifest FILE]
+#   python -m hardware.firmware modinfo iwlwifi.ko.zst
+
+import argparse
+import fnmatch
+import gzip
+import json
+import lzma
+import os
+import platform
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from system.cache import atomic_write, default_index_dir, file_stamp
+
+CACHE_VERSION = 1
+FIRMWARE_DIR = "/lib/firmware"
+FIRMWARE_SUFFIXES = ("", ".xz", ".zst")
+MODULE_SUFFIXES = (".ko", ".ko.gz", ".ko.xz", ".ko.zst")
+# Below this many modules a process pool costs more than it saves
+POOL_MIN = 8
+
+class FirmwareError(Exception):
+    pass
+
+def module_dir(release=None):
+    return os.path.join("/lib/modules", release or platform.release())
+
+def default_cache_path():
+    return os.path.join(default_index_dir(), "firmware.json")
+
+def module_name(path):
+    name = os.path.basename(path)
+    for suffix in MODULE_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return name.replace("-", "_")
+
+def read_modules_dep(moddir):
+    # Module name -> absolute path of its file
+    modules = {}
+    with open(os.path.join(moddir, "modules.dep"), encoding="utf-8") as f:
+        for line in f:
+            path = line.partition(":")[0].strip()
+            if path:
+                modules[module_name(path)] = os.path.join(moddir, path)
+    return modules
+
+def _zstd_decompress(data):
+    try:
+        from compression import zstd
+        return zstd.decompress(data)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise FirmwareError("reading .zst modules needs Python 3.14 or the zstandard package") from None
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+def read_module(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".xz"):
+        return lzma.decompress(data)
+    if path.endswith(".gz"):
+        return gzip.decompress(data)
+    if path.endswith(".zst"):
+        return _zstd_decompress(data)
+    return data
+
+def elf_section(data, wanted):
+    if data[:4] != b"\x7fELF":
+        raise FirmwareError("not an ELF file")
+    is64 = data[4] == 2
+    endian = "<" if data[5] == 1 else ">"
+    if is64:
+        shoff, = struct.unpack_from(endian + "Q", data, 0x28)
+        shentsize, shnum, shstrndx = struct.unpack_from(endian + "HHH", data, 0x3A)
+        header = struct.Struct(endian + "IIQQQQ")
+    else:
+        shoff, = struct.unpack_from(endian + "I", data, 0x20)
+        shentsize, shnum, shstrndx = struct.unpack_from(endian + "HHH", data, 0x2E)
+        header = struct.Struct(endian + "IIIIII")
+
+    sections = [header.unpack_from(data, shoff + i * shentsize) for i in range(shnum)]
+    if shstrndx >= len(sections):
+        raise FirmwareError("no section name table")
+    names_offset = sections[shstrndx][4]
+    for name, _, _, _, offset, size in sections:
+        start = names_offset + name
+        if data[start:data.index(b"\0", start)] == wanted:
+            return data[offset:offset + size]
+    return None
+
+def module_firmware(path):
+    # The firmware= entries of one module, in declaration order
+    section = elf_section(read_module(path), b".modinfo")
+    firmware = []
+    for field in (section or b"").split(b"\0"):
+        key, _, value = field.partition(b"=")
+        if key == b"firmware" and value:
+            name = value.decode("utf-8", "replace")
+            if name not in firmware:
+                firmware.append(name)
+    return firmware
+
+def _extract(path):
+    # Runs in the pool, errors are returned as text so one bad module doesn't stop the rest;
+    # truncated or corrupt archives raise EOFError, zlib.error, ZstdError and the like
+    try:
+        return path, module_firmware(path), None
+    except Exception as e:
+        return path, [], f"{type(e).__name__}: {e}"
+
+def _stamp(path):
+    # A list, as it comes back from JSON
+    return list(file_stamp(path))
+
+def load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("modules", {})
+
+def save_cache(path, modules):
+    try:
+        with atomic_write(path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "modules": modules}, f)
+    except OSError:
+        pass
+
+def extract_firmware(paths, cache_path=None, max_workers=None):
+    # ({module path: [firmware, ...]}, {module path: error}) with the modules that couldn't be
+    # read only in the second; only modules changed since the last run are read
+    cache_path = cache_path or default_cache_path()
+    cache = load_cache(cache_path)
+    result = {}
+    errors = {}
+    todo = []
+    for path in dict.fromkeys(paths):
+        try:
+            stamp = _stamp(path)
+        except OSError as e:
+            errors[path] = str(e)
+            continue
+        entry = cache.get(path)
+        if entry is not None and entry[0] == stamp:
+            result[path] = entry[1]
+        else:
+            todo.append((path, stamp))
+
+    if not todo:
+        return result, errors
+    names = [path for path, _ in todo]
+    if len(todo) < POOL_MIN:
+        extracted = map(_extract, names)
+    else:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                extracted = list(pool.map(_extract, names, chunksize=max(1, len(names) // 32)))
+        except (OSError, NotImplementedError):
+            # No working multiprocessing here (e.g. no sem_open), do it in-process
+            extracted = map(_extract, names)
+
+    for (path, stamp), (_, firmware, error) in zip(todo, extracted):
+        if error is None:
+            result[path] = firmware
+            cache[path] = [stamp, firmware]
+        else:
+            errors[path] = error
+    save_cache(cache_path, cache)
+    return result, errors
+
+class FirmwareStore:
+    # What firmware is available, from a firmware directory or a manifest of file names
+    def __init__(self, root=FIRMWARE_DIR, manifest=None):
+        self.root = root
+        self.names = None
+        if manifest is not None:
+            self.names = set(read_manifest(manifest))
+
+    def _listing(self, pattern):
+        if self.names is not None:
+            return [name for name in self.names if any(fnmatch.fnmatchcase(name, pattern + s) for s in FIRMWARE_SUFFIXES)]
+        directory, _, base = pattern.rpartition("/")
+        try:
+            entries = os.listdir(os.path.join(self.root, directory))
+        except OSError:
+            return []
+        prefix = directory + "/" if directory else ""
+        return [prefix + e for e in entries if any(fnmatch.fnmatchcase(e, base + s) for s in FIRMWARE_SUFFIXES)]
+
+    def has(self, name):
+        if any(c in name for c in "*?["):
+            return bool(self._listing(name))
+        if self.names is not None:
+            return any(name + suffix in self.names for suffix in FIRMWARE_SUFFIXES)
+        return any(os.path.exists(os.path.join(self.root, name + suffix)) for suffix in FIRMWARE_SUFFIXES)
+
+def read_manifest(path):
+    # One file name per line, or linux-firmware's WHENCE with "File:" lines
+    names = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith(("File:", "RawFile:", "Link:")):
+                line = line.partition(":")[2].strip().split(" -> ")[0].strip()
+            elif ":" in line:
+                continue
+            names.append(line.strip('"').removeprefix("/lib/firmware/").removeprefix("/usr/lib/firmware/"))
+    return names
+
+class FirmwareReport:
+    __slots__ = ("device", "module", "declared", "missing", "error")
+
+    def __init__(self, device, module, declared, missing, error=None):
+        self.device = device
+        self.module = module
+        self.declared = declared
+        self.missing = missing
+        self.error = error
+
+    @property
+    def status(self):
+        # Modules list every blob any of their devices might load, so some
+        # missing ones are normal; none present at all is the real problem.
+        # A module that couldn't be read says nothing either way
+        if self.error is not None:
+            return "unreadable"
+        if not self.declared:
+            return "none-needed"
+        if not self.missing:
+            return "ok"
+        return "missing" if len(self.missing) == len(self.declared) else "partial"
+
+    def __repr__(self):
+        return f"<FirmwareReport {self.device.name} {self.module}: {self.status}, {len(self.missing)}/{len(self.declared)} missing>"
+
+def check_devices(devices, alias_index, moddir=None, store=None, cache_path=None, max_workers=None):
+    # A FirmwareReport for each (device, matched module) pair
+    modules = read_modules_dep(moddir or module_dir())
+    store = store or FirmwareStore()
+    matched = [(device, [m for m in alias_index.modules_for(device) if m in modules]) for device in devices]
+    firmware, errors = extract_firmware([modules[m] for _, names in matched for m in names], cache_path, max_workers)
+
+    reports = []
+    for device, names in matched:
+        for name in names:
+            declared = firmware.get(modules[name], [])
+            reports.append(FirmwareReport(device, name, declared, [f for f in declared if not store.has(f)],
+                                          errors.get(modules[name])))
+    return reports
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hardware.firmware")
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("modinfo", help="print the firmware entries of module files")
+    p.add_argument("modules", nargs="+")
+    parser.add_argument("--kernel", default=None, help="kernel release (default: the running one)")
+    parser.add_argument("--firmware-dir", default=FIRMWARE_DIR)
+    parser.add_argument("--manifest", default=None, help="check against this list of firmware files instead")
+    parser.add_argument("--root", default="/sys", help="sysfs root to scan")
+    args = parser.parse_args(argv)
+
+    if args.command == "modinfo":
+        for path in args.modules:
+            _, firmware, error = _extract(path)
+            print(f"{path}: {error or ' '.join(firmware) or '-'}")
+        return 0
+
+    from hardware.modalias import load_index
+    from hardware.sysfs import all_devices, scan
+    moddir = module_dir(args.kernel)
+    try:
+        index = load_index(os.path.join(moddir, "modules.alias"))
+        reports = check_devices(all_devices(scan(args.root)), index, moddir,
+                                FirmwareStore(args.firmware_dir, args.manifest))
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    for report in reports:
+        line = f"{report.device.bus} {report.device.name} {report.module}: {report.status}"
+        if report.error:
+            line += f" ({report.error})"
+        elif report.missing:
+            line += " (" + ", ".join(report.missing[:5]) + (", ..." if len(report.missing) > 5 else "") + ")"
+        print(line)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Hotplug events for the device lists.
+#
+# Event sources all have fileno() (None when they have to be polled),
+# read() returning the pending Uevents and close():
+#
+#   NetlinkSource  kernel uevents from a NETLINK_KOBJECT_UEVENT socket
+#   PollingSource  stats /sys/class/block and /sys/bus/usb/devices and
+#                  only lists them when their mtime moved
+#   FakeSource     events pushed by hand, for tests and the benchmarks
+#
+# DeviceTracker applies events to a hardware.sysfs scan() result by
+# re-reading just the device the event is about. There is no Qt here,
+# gui.device_watcher hooks a source up to the event loop.
+
+import os
+import socket
+
+NETLINK_KOBJECT_UEVENT = 15
+KERNEL_GROUP = 1
+POLL_INTERVAL_MS = 1000
+POLLED_DIRS = (("class/block", "block"), ("bus/usb/devices", "usb"))
+
+class Uevent:
+    __slots__ = ("action", "devpath", "subsystem", "devtype", "props")
+
+    def __init__(self, action, devpath, subsystem=None, devtype=None, props=None):
+        self.action = action
+        self.devpath = devpath
+        self.subsystem = subsystem
+        self.devtype = devtype
+        self.props = props or {}
+
+    @property
+    def name(self):
+        return self.devpath.rstrip("/").rpartition("/")[2]
+
+    def __repr__(self):
+        return f"<Uevent {self.action} {self.subsystem}/{self.devtype} {self.devpath}>"
+
+def parse_uevent(data):
+    # "action@devpath\0KEY=value\0...", None for anything else (e.g. udev's own messages)
+    fields = data.split(b"\0")
+    action, at, devpath = fields[0].decode("utf-8", "replace").partition("@")
+    if not at:
+        return None
+    props = {}
+    for field in fields[1:]:
+        key, eq, value = field.decode("utf-8", "replace").partition("=")
+        if eq:
+            props[key] = value
+    return Uevent(props.get("ACTION", action), props.get("DEVPATH", devpath),
+                  props.get("SUBSYSTEM"), props.get("DEVTYPE"), props)
+
+class NetlinkSource:
+    interval = None
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+        try:
+            self.sock.bind((0, KERNEL_GROUP))
+            self.sock.setblocking(False)
+        except OSError:
+            self.sock.close()
+            raise
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def read(self):
+        events = []
+        while True:
+            try:
+                data = self.sock.recv(16384)
+            except (BlockingIOError, InterruptedError):
+                break
+            event = parse_uevent(data)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def close(self):
+        self.sock.close()
+
+class PollingSource:
+    # Only add and remove can be seen this way, there is no "change"
+    interval = POLL_INTERVAL_MS
+
+    def __init__(self, sysfs="/sys", dirs=POLLED_DIRS):
+        self.sysfs = sysfs
+        self.dirs = dirs
+        self.state = {}
+        for rel, _ in dirs:
+            self.state[rel] = self._stat(rel), self._list(rel)
+
+    def fileno(self):
+        return None
+
+    def _stat(self, rel):
+        try:
+            st = os.stat(os.path.join(self.sysfs, rel))
+            return st.st_mtime_ns, st.st_ino
+        except OSError:
+            return None
+
+    def _list(self, rel):
+        try:
+            with os.scandir(os.path.join(self.sysfs, rel)) as it:
+                return frozenset(entry.name for entry in it)
+        except OSError:
+            return frozenset()
+
+    def read(self):
+        events = []
+        for rel, subsystem in self.dirs:
+            stamp, names = self.state[rel]
+            new_stamp = self._stat(rel)
+            if new_stamp == stamp:
+                continue
+            new_names = self._list(rel)
+            self.state[rel] = new_stamp, new_names
+            for action, changed in (("remove", names - new_names), ("add", new_names - names)):
+                for name in sorted(changed):
+                    events.append(Uevent(action, f"/{rel}/{name}", subsystem, self._devtype(rel, subsystem, name)))
+        return events
+
+    def _devtype(self, rel, subsystem, name):
+        if subsystem == "usb":
+            return "usb_interface" if ":" in name else "usb_device"
+        return "partition" if os.path.exists(os.path.join(self.sysfs, rel, name, "partition")) else "disk"
+
+    def close(self):
+        pass
+
+class FakeSource:
+    # Pushing an event also makes a socket readable, so it is watched like a NetlinkSource
+    interval = None
+
+    def __init__(self):
+        self.pending = []
+        self.sock, self._wake = socket.socketpair()
+        self.sock.setblocking(False)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def push(self, action, devpath, subsystem=None, devtype=None, **props):
+        self.pending.append(Uevent(action, devpath, subsystem, devtype, props))
+        self._wake.send(b"\0")
+
+    def read(self):
+        while True:
+            try:
+                if not self.sock.recv(4096):
+                    break
+            except (BlockingIOError, InterruptedError):
+                break
+        events, self.pending = self.pending, []
+        return events
+
+    def close(self):
+        self.pending.clear()
+        self.sock.close()
+        self._wake.close()
+
+def open_source(sysfs="/sys"):
+    # Kernel uevents where the socket can be opened, polling otherwise
+    if hasattr(socket, "AF_NETLINK") and sysfs == "/sys":
+        try:
+            return NetlinkSource()
+        except OSError:
+            pass
+    return PollingSource(sysfs)
+
+class DeviceTracker:
+    def __init__(self, scanned, root=None):
+        from hardware.sysfs import as_root
+        self.scanned = scanned
+        self.root = as_root(root)
+
+    def _target(self, event):
+        # (bus, device name) the event is about, None for events we don't track
+        if event.subsystem == "usb":
+            return "usb", event.name.partition(":")[0]
+        if event.subsystem == "block" and event.devtype != "partition":
+            return "block", event.name
+        if event.subsystem == "pci":
+            return "pci", event.name
+        return None
+
+    def apply(self, event):
+        # Returns ("add" | "remove" | "change", record) or None when nothing changed
+        from hardware.sysfs import READERS
+
+        target = self._target(event)
+        if target is None:
+            return None
+        bus, name = target
+        devices = self.scanned.setdefault(bus, [])
+        index = next((i for i, d in enumerate(devices) if d.name == name), None)
+
+        # Removing an interface or unbinding a driver changes its device
+        whole = ":" not in event.name
+        if event.action == "remove" and whole:
+            if index is None:
+                return None
+            return "remove", devices.pop(index)
+
+        record = READERS[bus](self.root, name)
+        if record is None:
+            if index is None:
+                return None
+            return "remove", devices.pop(index)
+        if index is None:
+            devices.append(record)
+            return "add", record
+        devices[index] = record
+        return "change", record
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Vendor, device and class names from pci.ids / usb.ids.
+#
+# The text databases are compiled once into a binary index: a header, a
+# sorted array of fixed-width records and a string table. Each record is
+#
+#   kind (1 byte) pad (1) ids (4 x 2 bytes, big-endian) string offset (4) length (2)
+#
+# so the first 10 bytes compare bytewise in the same order as the IDs. The
+# index is memory-mapped and binary-searched, a lookup touches a handful of
+# pages and nothing is parsed at startup. Indexes live under
+# $XDG_CACHE_HOME/switcheroo and are rebuilt when the source file changes.
+#
+#   python -m hardware.ids compile /usr/share/hwdata/pci.ids out.idx
+#   python -m hardware.ids pci 8086 46a6
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+from system.cache import atomic_write, default_index_dir, file_stamp, source_changed
+
+MAGIC = b"SWIDS\x00\x00\x01"
+HEADER = struct.Struct(">8sIIQQ")  # magic, records, strings offset, source size, source mtime_ns
+RECORD = struct.Struct(">BxHHHHIH")
+KEY = struct.Struct(">BxHHHH")
+
+VENDOR, DEVICE, SUBSYSTEM, CLASS, SUBCLASS, PROG_IF = range(1, 7)
+
+SOURCES = {
+    "pci": ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids"),
+    "usb": ("/usr/share/hwdata/usb.ids", "/usr/share/misc/usb.ids", "/var/lib/usbutils/usb.ids"),
+}
+
+def find_source(bus):
+    for path in SOURCES[bus]:
+        if os.path.isfile(path):
+            return path
+    return None
+
+def _is_hex(text):
+    return all(c in "0123456789abcdef" for c in text)
+
+def parse_ids(f):
+    # Yields (kind, a, b, c, d, name); sections other than vendors and classes are skipped
+    section = None
+    top = mid = None
+    for raw in f:
+        line = raw.rstrip("\n")
+        if not line or line.startswith("#"):
+            continue
+        depth = len(line) - len(line.lstrip("\t"))
+        line = line[depth:]
+        try:
+            if depth == 0:
+                if line.startswith("C "):
+                    section = "class"
+                    top = int(line[2:4], 16)
+                    yield CLASS, top, 0, 0, 0, line[4:].strip()
+                elif len(line) > 4 and line[4] == " " and _is_hex(line[:4]):
+                    section = "vendor"
+                    top = int(line[:4], 16)
+                    yield VENDOR, top, 0, 0, 0, line[4:].strip()
+                else:
+                    section = None
+            elif section == "vendor":
+                if depth == 1:
+                    mid = int(line[:4], 16)
+                    yield DEVICE, top, mid, 0, 0, line[4:].strip()
+                else:
+                    sub, _, name = line.partition("  ")
+                    subvendor, subdevice = sub.split()
+                    yield SUBSYSTEM, top, mid, int(subvendor, 16), int(subdevice, 16), name.strip()
+            elif section == "class":
+                if depth == 1:
+                    mid = int(line[:2], 16)
+                    yield SUBCLASS, top, mid, 0, 0, line[2:].strip()
+                else:
+                    yield PROG_IF, top, mid, int(line[:2], 16), 0, line[2:].strip()
+        except ValueError:
+            continue
+
+def compile_ids(source, dest):
+    entries = {}
+    with open(source, encoding="utf-8", errors="replace") as f:
+        for kind, a, b, c, d, name in parse_ids(f):
+            entries.setdefault(KEY.pack(kind, a, b, c, d), name)
+
+    strings = bytearray()
+    offsets = {}
+    records = bytearray()
+    for key in sorted(entries):
+        data = entries[key].encode("utf-8")[:0xffff]
+        offset = offsets.get(data)
+        if offset is None:
+            offset = offsets[data] = len(strings)
+            strings += data
+        records += key + struct.pack(">IH", offset, len(data))
+
+    header = HEADER.pack(MAGIC, len(entries), HEADER.size + len(records), *file_stamp(source))
+    with atomic_write(dest) as f:
+        f.write(header)
+        f.write(records)
+        f.write(strings)
+    return len(entries)
+
+class IdsIndex:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.strings, self.source_size, self.source_mtime = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not an ids index")
+
+    def close(self):
+        self.map.close()
+
+    def stale(self, source):
+        return source_changed(source, (self.source_size, self.source_mtime))
+
+    def _find(self, kind, a, b=0, c=0, d=0):
+        key = KEY.pack(kind, a, b, c, d)
+        size = RECORD.size
+        width = KEY.size
+        mm = self.map
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = HEADER.size + mid * size
+            probe = mm[pos:pos + width]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                offset, length = struct.unpack_from(">IH", mm, pos + width)
+                start = self.strings + offset
+                return mm[start:start + length].decode("utf-8")
+        return None
+
+    def vendor(self, vendor):
+        return self._find(VENDOR, vendor)
+
+    def device(self, vendor, device):
+        return self._find(DEVICE, vendor, device)
+
+    def subsystem(self, vendor, device, subvendor, subdevice):
+        return self._find(SUBSYSTEM, vendor, device, subvendor, subdevice)
+
+    def device_class(self, base, sub=None, prog_if=None):
+        # Most specific name known for the class code
+        if sub is not None and prog_if is not None:
+            name = self._find(PROG_IF, base, sub, prog_if)
+            if name:
+                return name
+        if sub is not None:
+            name = self._find(SUBCLASS, base, sub)
+            if name:
+                return name
+        return self._find(CLASS, base)
+
+def open_index(bus, source=None, index_dir=None):
+    # The compiled index for pci/usb, (re)built from the text file when needed
+    source = source or find_source(bus)
+    if source is None:
+        return None
+    path = os.path.join(index_dir or default_index_dir(), f"{bus}.ids.idx")
+    try:
+        index = IdsIndex(path)
+        if not index.stale(source):
+            return index
+        index.close()
+    except (OSError, ValueError, struct.error):
+        pass
+    try:
+        compile_ids(source, path)
+        return IdsIndex(path)
+    except OSError:
+        return None
+
+class NameResolver:
+    def __init__(self, index_dir=None, sources=None):
+        self.index_dir = index_dir
+        self.sources = sources or {}
+        self.indexes = {}
+
+    def index(self, bus):
+        if bus not in self.indexes:
+            self.indexes[bus] = open_index(bus, self.sources.get(bus), self.index_dir) if bus in SOURCES else None
+        return self.indexes[bus]
+
+    def close(self):
+        for index in self.indexes.values():
+            if index is not None:
+                index.close()
+        self.indexes.clear()
+
+    def names(self, device):
+        # (vendor, product) names for a hardware.sysfs record, None where unknown
+        index = self.index(device.bus)
+        if index is None:
+            return None, None
+        product = None
+        if device.subvendor is not None and device.subdevice is not None:
+            product = index.subsystem(device.vendor, device.device, device.subvendor, device.subdevice)
+        return index.vendor(device.vendor), product or index.device(device.vendor, device.device)
+
+    def class_name(self, device):
+        index = self.index(device.bus)
+        if index is None:
+            return None
+        code = device.device_class
+        if device.bus == "pci":
+            return index.device_class(code >> 16, (code >> 8) & 0xff, code & 0xff)
+        return index.device_class(code)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hardware.ids")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("compile", help="compile a pci.ids/usb.ids file")
+    p.add_argument("source")
+    p.add_argument("dest")
+    for bus in SOURCES:
+        p = sub.add_parser(bus, help=f"look up {bus} IDs")
+        p.add_argument("ids", nargs="+", help="vendor [device [subvendor subdevice]]")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        print(f"{compile_ids(args.source, args.dest)} entries written to {args.dest}")
+        return 0
+
+    index = open_index(args.command)
+    if index is None:
+        print(f"no {args.command}.ids found", file=sys.stderr)
+        return 1
+    ids = [int(i, 16) for i in args.ids[:4]]
+    if len(ids) == 1:
+        print(index.vendor(*ids))
+    elif len(ids) == 2:
+        print(index.vendor(ids[0]), index.device(*ids), sep=" / ")
+    else:
+        print(index.vendor(ids[0]), index.device(*ids[:2]), index.subsystem(*ids), sep=" / ")
+    index.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Device x distro support matrix, offline.
+#
+# A distro kernel bundle is a directory holding what is needed to judge
+# hardware support without the kernel itself:
+#
+#   bundle.json               {"name": "Fedora 41", "kernel": "6.11.4-301.fc41"}
+#   modules.alias             copied from /lib/modules/<release>
+#   modules.builtin.modinfo   (optional) aliases of built-in drivers
+#   modules.firmware          "module firmware" pairs, one per line
+#   firmware.manifest         firmware files the distro ships, one per line
+#
+# make_bundle() writes one from an installed kernel. evaluate() runs every
+# bundle against the devices of a hardware snapshot on a process pool. The
+# alias indexes are compiled once in the parent (bundles with the same
+# modules.alias and modules.builtin.modinfo share one) and reach the
+# workers through the marshal cache of hardware.modalias, or directly when
+# the workers are forked.
+#
+#   python -m hardware.matrix machine.jsonl.gz bundles/*
+#   python -m hardware.matrix bundle bundles/this-machine --name "This system"
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from hardware import firmware, modalias
+
+# Alias indexes by modules.alias checksum, filled in the parent before the pool starts
+_INDEXES = {}
+
+class Bundle:
+    __slots__ = ("path", "id", "name", "kernel")
+
+    def __init__(self, path):
+        self.path = path
+        # Bundles are told apart by where they are, different trees may use the same directory name
+        self.id = os.path.realpath(path)
+        info = {}
+        try:
+            with open(os.path.join(path, "bundle.json"), encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            pass
+        self.name = info.get("name") or os.path.basename(os.path.normpath(path))
+        self.kernel = info.get("kernel")
+
+    @property
+    def alias_path(self):
+        return os.path.join(self.path, "modules.alias")
+
+    def module_firmware(self):
+        modules = {}
+        try:
+            with open(os.path.join(self.path, "modules.firmware"), encoding="utf-8") as f:
+                for line in f:
+                    module, _, name = line.strip().partition(" ")
+                    if name:
+                        modules.setdefault(module, []).append(name)
+        except OSError:
+            pass
+        return modules
+
+    def firmware_store(self):
+        # None when the bundle has no manifest, firmware then isn't checked
+        manifest = os.path.join(self.path, "firmware.manifest")
+        return firmware.FirmwareStore(manifest=manifest) if os.path.isfile(manifest) else None
+
+class Support:
+    __slots__ = ("status", "modules", "missing")
+
+    # Best first, for sorting and summaries
+    ORDER = ("supported", "partial", "firmware-missing", "unsupported")
+
+    def __init__(self, status, modules=(), missing=()):
+        self.status = status
+        self.modules = list(modules)
+        self.missing = list(missing)
+
+    def __repr__(self):
+        return f"<Support {self.status} {','.join(self.modules) or '-'}>"
+
+class Matrix:
+    def __init__(self, devices, bundles, cells):
+        self.devices = devices
+        self.bundles = bundles
+        # bundle id -> [Support for each device]
+        self.cells = cells
+
+    def get(self, device_index, bundle_id):
+        return self.cells[bundle_id][device_index]
+
+    def summary(self, bundle_id):
+        counts = dict.fromkeys(Support.ORDER, 0)
+        for support in self.cells[bundle_id]:
+            counts[support.status] += 1
+        return counts
+
+    def ranking(self):
+        # Bundles sorted by how many devices they fully support
+        return sorted(self.bundles, key=lambda b: [-self.summary(b.id)[s] for s in Support.ORDER[:3]])
+
+def _checksum(bundle):
+    # Of everything the alias index is built from: modules.alias and modules.builtin.modinfo
+    h = hashlib.sha1()
+    for path in (bundle.alias_path, modalias.builtin_modinfo_path(bundle.alias_path)):
+        try:
+            with open(path, "rb") as f:
+                h.update(f.read())
+        except FileNotFoundError:
+            if path == bundle.alias_path:
+                raise
+        h.update(b"\0")
+    return h.hexdigest()
+
+def _index(path, checksum):
+    index = _INDEXES.get(checksum)
+    if index is None:
+        index = _INDEXES[checksum] = modalias.load_index(path)
+    return index
+
+def evaluate_bundle(bundle, checksum, devices):
+    index = _index(bundle.alias_path, checksum)
+    module_firmware = bundle.module_firmware()
+    store = bundle.firmware_store()
+    row = []
+    for device in devices:
+        modules = index.modules_for(device)
+        if not modules:
+            row.append(Support("unsupported"))
+            continue
+        # One module with all its firmware present is enough to drive the device
+        missing = {}
+        for module in modules:
+            declared = module_firmware.get(module, [])
+            absent = [name for name in declared if store is not None and not store.has(name)]
+            missing[module] = (absent, declared)
+        if any(not absent for absent, _ in missing.values()):
+            status = "supported"
+        elif any(len(absent) < len(declared) for absent, declared in missing.values()):
+            status = "partial"
+        else:
+            status = "firmware-missing"
+        row.append(Support(status, modules, sorted({n for absent, _ in missing.values() for n in absent})))
+    return bundle.id, row
+
+def _evaluate(args):
+    return evaluate_bundle(*args)
+
+def evaluate(devices, bundle_paths, max_workers=None):
+    # devices: hardware.sysfs records; those without a modalias can't be judged and are left out
+    devices = [device for device in devices if device.modaliases]
+    # The same bundle given twice (e.g. through a symlink) is evaluated once
+    bundles = {}
+    for path in bundle_paths:
+        bundle = Bundle(path)
+        bundles.setdefault(bundle.id, bundle)
+    bundles = list(bundles.values())
+    checksums = {}
+    for bundle in bundles:
+        checksum = checksums[bundle.id] = _checksum(bundle)
+        _index(bundle.alias_path, checksum)
+
+    jobs = [(bundle, checksums[bundle.id], devices) for bundle in bundles]
+    if len(jobs) < 2 or max_workers == 1:
+        rows = map(_evaluate, jobs)
+    else:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                rows = list(pool.map(_evaluate, jobs))
+        except (OSError, NotImplementedError):
+            rows = map(_evaluate, jobs)
+    return Matrix(devices, bundles, dict(rows))
+
+def make_bundle(dest, moddir=None, firmware_dir=firmware.FIRMWARE_DIR, name=None, kernel=None):
+    # A bundle for an installed kernel; needs modules.dep and the module files
+    moddir = moddir or firmware.module_dir()
+    modules = firmware.read_modules_dep(moddir)
+    paths = {path: module for module, path in modules.items()}
+    declared, errors = firmware.extract_firmware(list(paths))
+    if errors:
+        # An unread module would look like one needing no firmware in every matrix made from this
+        path, error = next(iter(errors.items()))
+        raise firmware.FirmwareError(f"{len(errors)} of {len(paths)} modules can't be read, "
+                                     f"e.g. {os.path.relpath(path, moddir)}: {error}")
+
+    os.makedirs(dest, exist_ok=True)
+    for filename in ("modules.alias", "modules.builtin.modinfo"):
+        source = os.path.join(moddir, filename)
+        if os.path.isfile(source):
+            shutil.copyfile(source, os.path.join(dest, filename))
+    with open(os.path.join(dest, "modules.firmware"), "w", encoding="utf-8") as f:
+        for path in sorted(declared, key=paths.get):
+            for blob in declared[path]:
+                f.write(f"{paths[path]} {blob}\n")
+
+    with open(os.path.join(dest, "firmware.manifest"), "w", encoding="utf-8") as f:
+        for root, _, files in os.walk(firmware_dir):
+            for filename in sorted(files):
+                f.write(os.path.relpath(os.path.join(root, filename), firmware_dir) + "\n")
+
+    with open(os.path.join(dest, "bundle.json"), "w", encoding="utf-8") as f:
+        json.dump({"name": name or os.path.basename(os.path.normpath(dest)),
+                   "kernel": kernel or os.path.basename(os.path.normpath(moddir))}, f)
+    return Bundle(dest)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["bundle"]:
+        parser = argparse.ArgumentParser(prog="python -m hardware.matrix bundle")
+        parser.add_argument("dest")
+        parser.add_argument("--name", default=None)
+        parser.add_argument("--modules", default=None, help="module directory (default: the running kernel's)")
+        parser.add_argument("--firmware-dir", default=firmware.FIRMWARE_DIR)
+        args = parser.parse_args(argv[1:])
+        try:
+            bundle = make_bundle(args.dest, args.modules, args.firmware_dir, args.name)
+        except (OSError, firmware.FirmwareError) as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"wrote {bundle.name} ({bundle.kernel}) to {bundle.path}")
+        return 0
+
+    parser = argparse.ArgumentParser(prog="python -m hardware.matrix")
+    parser.add_argument("snapshot", help="snapshot made with python -m hardware.snapshot")
+    parser.add_argument("bundles", nargs="+")
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    from hardware.snapshot import SnapshotError, load_snapshot
+    from hardware.sysfs import all_devices, scan
+    try:
+        devices = all_devices(scan(load_snapshot(args.snapshot).root()))
+        matrix = evaluate(devices, args.bundles, args.jobs)
+    except (OSError, SnapshotError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    bundles = matrix.ranking()
+    width = max([len(f"{d.bus} {d.name}") for d in matrix.devices] + [6])
+    print(" " * width + "  " + "  ".join(f"{b.name[:16]:>16}" for b in bundles))
+    for i, device in enumerate(matrix.devices):
+        print(f"{device.bus + ' ' + device.name:<{width}}  " + "  ".join(f"{matrix.get(i, b.id).status:>16}" for b in bundles))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
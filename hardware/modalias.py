@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Which kernel modules will drive a device, from its modalias.
+#
+# modules.alias has tens of thousands of glob patterns, so instead of
+# trying each of them the patterns are bucketed by their literal prefix
+# (everything before the first *, ? or [). Matching a modalias looks up
+# each of its prefixes that has a bucket and globs only the patterns in
+# those, a few dict lookups plus a handful of regex matches per device.
+# The few big buckets of wildcard patterns are split again on a literal
+# piece from the middle of the pattern. Aliases of built-in drivers come
+# from modules.builtin.modinfo when it is next to modules.alias. The
+# buckets are stored with marshal under $XDG_CACHE_HOME/switcheroo and
+# rebuilt when the alias file changes.
+#
+#   python -m hardware.modalias [--alias FILE] [modalias ...]
+
+import argparse
+import fnmatch
+import hashlib
+import marshal
+import os
+import platform
+import re
+import sys
+
+from system.cache import atomic_write, default_index_dir, file_stamp
+
+INDEX_VERSION = 1
+GLOB_CHARS = "*?["
+GLOB_SPLIT = re.compile(r"\*|\?|\[[^]]*\]")
+# Buckets bigger than this get a second index, on pieces of ANCHOR_MIN chars or more
+ANCHOR_BUCKET = 16
+ANCHOR_MIN = 3
+
+def default_alias_path(release=None):
+    return os.path.join("/lib/modules", release or platform.release(), "modules.alias")
+
+def builtin_modinfo_path(alias_path):
+    return os.path.join(os.path.dirname(alias_path), "modules.builtin.modinfo")
+
+def _stat(path):
+    try:
+        return file_stamp(path)
+    except OSError:
+        return None
+
+def literal_prefix(pattern):
+    for i, c in enumerate(pattern):
+        if c in GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+def read_aliases(path):
+    # (pattern, module) pairs in file order, built-in aliases last
+    aliases = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("alias "):
+                parts = line.split()
+                if len(parts) >= 3:
+                    aliases.append((parts[1], parts[2]))
+    try:
+        with open(builtin_modinfo_path(path), "rb") as f:
+            for field in f.read().split(b"\0"):
+                key, _, value = field.decode("utf-8", "replace").partition("=")
+                module, _, name = key.partition(".")
+                if name == "alias" and value:
+                    aliases.append((value, module))
+    except OSError:
+        pass
+    return aliases
+
+class AliasIndex:
+    def __init__(self, buckets):
+        # buckets: literal prefix -> [(file order, pattern, module), ...]
+        self.buckets = buckets
+        self.lengths = sorted({len(prefix) for prefix in buckets})
+        self.compiled = {}
+        self.anchors = {}
+
+    @classmethod
+    def from_aliases(cls, aliases):
+        buckets = {}
+        for order, (pattern, module) in enumerate(aliases):
+            buckets.setdefault(literal_prefix(pattern), []).append((order, pattern, module))
+        return cls(buckets)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def _matcher(self, pattern):
+        matcher = self.compiled.get(pattern)
+        if matcher is None:
+            if any(c in pattern for c in GLOB_CHARS):
+                matcher = re.compile(fnmatch.translate(pattern), re.DOTALL).match
+            else:
+                matcher = pattern.__eq__
+            self.compiled[pattern] = matcher
+        return matcher
+
+    def _anchors(self, prefix, bucket):
+        # Patterns without a long literal prefix ("pci:v*d*...bc03sc*i*") pile
+        # up in a few buckets. Those are indexed again on the longest literal
+        # piece of the rest of the pattern, looked up at every offset
+        anchors = self.anchors.get(prefix)
+        if anchors is None:
+            keyed = {}
+            loose = []
+            for entry in bucket:
+                piece = max(GLOB_SPLIT.split(entry[1][len(prefix):]), key=len)
+                if len(piece) >= ANCHOR_MIN:
+                    keyed.setdefault(piece, []).append(entry)
+                else:
+                    loose.append(entry)
+            anchors = self.anchors[prefix] = (keyed, sorted({len(p) for p in keyed}), loose)
+        return anchors
+
+    def _candidates(self, prefix, bucket, modalias):
+        if len(bucket) <= ANCHOR_BUCKET:
+            return bucket
+        keyed, lengths, candidates = self._anchors(prefix, bucket)
+        candidates = list(candidates)
+        start = len(prefix)
+        for length in lengths:
+            for i in range(start, len(modalias) - length + 1):
+                found = keyed.get(modalias[i:i + length])
+                if found is not None:
+                    candidates += found
+        return candidates
+
+    def match(self, modalias):
+        # Matching modules in modules.alias order, like modprobe would try them
+        found = []
+        size = len(modalias)
+        for length in self.lengths:
+            if length > size:
+                break
+            prefix = modalias[:length]
+            bucket = self.buckets.get(prefix)
+            if bucket is None:
+                continue
+            for order, pattern, module in self._candidates(prefix, bucket, modalias):
+                if self._matcher(pattern)(modalias):
+                    found.append((order, module))
+        found.sort()
+        seen = set()
+        return [m for _, m in found if not (m in seen or seen.add(m))]
+
+    def modules_for(self, device):
+        modules = []
+        for modalias in device.modaliases:
+            for module in self.match(modalias):
+                if module not in modules:
+                    modules.append(module)
+        return modules
+
+def compile_aliases(path):
+    return AliasIndex.from_aliases(read_aliases(path))
+
+def load_index(path=None, index_dir=None):
+    # The index for an alias file, from the marshal cache when it is still current
+    path = path or default_alias_path()
+    # The built-in aliases are part of the index too
+    stamp = (INDEX_VERSION, os.path.abspath(path), *file_stamp(path), _stat(builtin_modinfo_path(path)))
+    name = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    cache = os.path.join(index_dir or default_index_dir(), f"modalias-{name}.marshal")
+    try:
+        with open(cache, "rb") as f:
+            cached_stamp, buckets = marshal.loads(f.read())
+        if cached_stamp == stamp:
+            return AliasIndex(buckets)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    index = compile_aliases(path)
+    try:
+        with atomic_write(cache) as f:
+            marshal.dump((stamp, index.buckets), f)
+    except OSError:
+        pass
+    return index
+
+def predict(devices, index):
+    # (device, modules) for every device; no modules means no driver in this kernel
+    return [(device, index.modules_for(device)) for device in devices]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hardware.modalias")
+    parser.add_argument("--alias", default=None, help="modules.alias to use (default: the running kernel's)")
+    parser.add_argument("--root", default="/sys", help="sysfs root to scan when no modalias is given")
+    parser.add_argument("modaliases", nargs="*")
+    args = parser.parse_args(argv)
+
+    try:
+        index = load_index(args.alias)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.modaliases:
+        for modalias in args.modaliases:
+            print(f"{modalias}: {' '.join(index.match(modalias)) or '-'}")
+        return 0
+
+    from hardware.sysfs import all_devices, scan
+    for device, modules in predict(all_devices(scan(args.root)), index):
+        print(f"{device.bus} {device.name}: {' '.join(modules) or 'no driver'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Hardware snapshots: scan once, evaluate anywhere.
+#
+# A snapshot is gzipped JSON lines. The first line is a header with the
+# format version, then one record per line:
+#
+#   {"t": "system", "name": "cpu", "data": {...}}      cpu, memory, firmware
+#   {"t": "dev", "dir": "bus/pci/devices/0000:00:02.0",
+#    "attrs": {...}, "links": {...}, "dirs": [...], "digest": "..."}
+#
+# The sysfs subset is whatever hardware.sysfs actually reads: capture()
+# runs the enumerator through a recording root, so the two can't drift
+# apart. SnapshotRoot serves those records back as a virtual sysfs root and
+# the per-device digests let diff() find the devices that changed without
+# comparing their attributes.
+#
+#   python -m hardware.snapshot capture machine.jsonl.gz
+#   python -m hardware.snapshot scan machine.jsonl.gz
+#   python -m hardware.snapshot diff old.jsonl.gz new.jsonl.gz
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+
+from system.cache import atomic_write
+
+FORMAT = "switcheroo-snapshot"
+FORMAT_VERSION = 1
+SECURE_BOOT_VAR = "firmware/efi/efivars/SecureBoot-8be4df61-93ca-11d2-aa0d-00e098032b8c"
+
+class SnapshotError(Exception):
+    pass
+
+class DeviceEntry:
+    __slots__ = ("dir", "attrs", "links", "dirs", "digest")
+
+    def __init__(self, dir, attrs=None, links=None, dirs=None, digest=None):
+        self.dir = dir
+        self.attrs = attrs if attrs is not None else {}
+        self.links = links if links is not None else {}
+        self.dirs = dirs if dirs is not None else set()
+        self.digest = digest
+
+    def compute_digest(self):
+        data = json.dumps([self.attrs, self.links, sorted(self.dirs)], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+    def record(self):
+        return {"t": "dev", "dir": self.dir, "attrs": self.attrs, "links": self.links,
+                "dirs": sorted(self.dirs), "digest": self.digest or self.compute_digest()}
+
+class Snapshot:
+    def __init__(self, header=None, system=None, devices=None):
+        self.header = header or {"format": FORMAT, "version": FORMAT_VERSION}
+        self.system = system if system is not None else {}
+        self.devices = devices if devices is not None else {}
+
+    def root(self):
+        return SnapshotRoot(self)
+
+    def records(self):
+        yield self.header
+        for name in sorted(self.system):
+            yield {"t": "system", "name": name, "data": self.system[name]}
+        for dir in sorted(self.devices):
+            yield self.devices[dir].record()
+
+class RecordingRoot:
+    # Passes calls through to a real root and keeps what was found, per device
+    def __init__(self, root):
+        self.root = root
+        self.collections = set()
+        self.devices = {}
+
+    def _entry(self, rel):
+        parent, _, rest = rel.partition("/")
+        while rest:
+            name, _, sub = rest.partition("/")
+            if parent in self.collections and sub:
+                dir = f"{parent}/{name}"
+                entry = self.devices.get(dir)
+                if entry is None:
+                    entry = self.devices[dir] = DeviceEntry(dir)
+                return entry, sub
+            parent = f"{parent}/{name}"
+            rest = sub
+        return None, None
+
+    def listdir(self, rel):
+        names = self.root.listdir(rel)
+        self.collections.add(rel)
+        return names
+
+    def read(self, rel):
+        value = self.root.read(rel)
+        if value is not None:
+            entry, sub = self._entry(rel)
+            if entry is not None:
+                entry.attrs[sub] = value
+        return value
+
+    def link(self, rel):
+        value = self.root.link(rel)
+        if value is not None:
+            entry, sub = self._entry(rel)
+            if entry is not None:
+                entry.links[sub] = value
+        return value
+
+    def exists(self, rel):
+        found = self.root.exists(rel)
+        if found:
+            entry, sub = self._entry(rel)
+            if entry is not None:
+                entry.dirs.add(sub)
+        return found
+
+class SnapshotRoot:
+    # The subset of sysfs stored in a snapshot, usable wherever hardware.sysfs takes a root
+    def __init__(self, snapshot):
+        self.devices = snapshot.devices
+        self.children = {}
+        for dir in snapshot.devices:
+            parent, _, name = dir.rpartition("/")
+            self.children.setdefault(parent, []).append(name)
+        for names in self.children.values():
+            names.sort()
+
+    def _entry(self, rel):
+        parts = rel.split("/")
+        for i in range(len(parts) - 1, 0, -1):
+            entry = self.devices.get("/".join(parts[:i]))
+            if entry is not None:
+                return entry, "/".join(parts[i:])
+        return None, None
+
+    def listdir(self, rel):
+        return list(self.children.get(rel.rstrip("/"), ()))
+
+    def read(self, rel):
+        entry, sub = self._entry(rel)
+        return entry.attrs.get(sub) if entry is not None else None
+
+    def link(self, rel):
+        entry, sub = self._entry(rel)
+        return entry.links.get(sub) if entry is not None else None
+
+    def exists(self, rel):
+        rel = rel.rstrip("/")
+        if rel in self.devices or rel in self.children:
+            return True
+        entry, sub = self._entry(rel)
+        if entry is None:
+            return False
+        if sub in entry.attrs or sub in entry.links or sub in entry.dirs:
+            return True
+        prefix = sub + "/"
+        return any(key.startswith(prefix) for key in (*entry.attrs, *entry.links, *entry.dirs))
+
+def _read(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", "replace").strip()
+    except OSError:
+        return None
+
+def cpu_info(proc="/proc"):
+    info = {"model": None, "count": 0, "flags": []}
+    text = _read(os.path.join(proc, "cpuinfo")) or ""
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        key = key.strip()
+        if key == "processor":
+            info["count"] += 1
+        elif key in ("model name", "Model", "cpu model") and info["model"] is None:
+            info["model"] = value.strip()
+        elif key in ("flags", "Features") and not info["flags"]:
+            info["flags"] = sorted(value.split())
+    return info
+
+def memory_info(proc="/proc"):
+    text = _read(os.path.join(proc, "meminfo")) or ""
+    for line in text.splitlines():
+        if line.startswith("MemTotal:"):
+            return {"total": int(line.split()[1]) * 1024}
+    return {"total": None}
+
+def firmware_info(sysfs="/sys"):
+    efi = os.path.isdir(os.path.join(sysfs, "firmware", "efi"))
+    secure_boot = None
+    if efi:
+        try:
+            with open(os.path.join(sysfs, SECURE_BOOT_VAR), "rb") as f:
+                # 4 bytes of attributes, then the value
+                secure_boot = f.read()[4:5] == b"\x01"
+        except OSError:
+            pass
+    info = {"efi": efi, "secure_boot": secure_boot}
+    for name in ("sys_vendor", "product_name", "board_name", "bios_vendor", "bios_version", "bios_date"):
+        info[name] = _read(os.path.join(sysfs, "class", "dmi", "id", name))
+    return info
+
+def capture(sysfs="/sys", proc="/proc"):
+    from hardware.sysfs import SysfsRoot, scan
+
+    recorder = RecordingRoot(SysfsRoot(sysfs))
+    scan(recorder)
+    for entry in recorder.devices.values():
+        entry.digest = entry.compute_digest()
+
+    header = {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "created": int(time.time()),
+        "host": platform.node(),
+        "kernel": platform.release(),
+        "machine": platform.machine(),
+    }
+    system = {
+        "cpu": cpu_info(proc),
+        "memory": memory_info(proc),
+        "firmware": firmware_info(sysfs),
+    }
+    return Snapshot(header, system, recorder.devices)
+
+def _open(path, mode, compressed=None):
+    if compressed is None:
+        compressed = path.endswith(".gz")
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6)
+    return open(path, mode, encoding="utf-8")
+
+def write_snapshot(path, snapshot):
+    with atomic_write(path, "w", _open, compressed=path.endswith(".gz")) as f:
+        for record in snapshot.records():
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+def iter_records(path):
+    # Header first, then the records one at a time
+    with _open(path, "r") as f:
+        try:
+            header = json.loads(f.readline())
+        except (ValueError, gzip.BadGzipFile):
+            header = None
+        if not isinstance(header, dict) or header.get("format") != FORMAT:
+            raise SnapshotError(f"{path} is not a hardware snapshot")
+        if header.get("version", 0) > FORMAT_VERSION:
+            raise SnapshotError(f"{path} uses snapshot format {header['version']}, "
+                                f"this version reads up to {FORMAT_VERSION}")
+        yield header
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def load_snapshot(path):
+    records = iter_records(path)
+    snapshot = Snapshot(next(records))
+    for record in records:
+        kind = record.get("t")
+        if kind == "system":
+            snapshot.system[record["name"]] = record["data"]
+        elif kind == "dev":
+            entry = DeviceEntry(record["dir"], record["attrs"], record["links"], set(record["dirs"]), record.get("digest"))
+            if entry.digest is None:
+                entry.digest = entry.compute_digest()
+            snapshot.devices[entry.dir] = entry
+        # Unknown record types come from newer minor revisions, skip them
+    return snapshot
+
+def diff(old, new):
+    # Device dirs added, removed and changed between two snapshots, plus changed system sections
+    added = sorted(set(new.devices) - set(old.devices))
+    removed = sorted(set(old.devices) - set(new.devices))
+    changed = sorted(dir for dir in set(old.devices) & set(new.devices)
+                     if old.devices[dir].digest != new.devices[dir].digest)
+    system = sorted(name for name in set(old.system) | set(new.system)
+                    if old.system.get(name) != new.system.get(name))
+    return added, removed, changed, system
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hardware.snapshot")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("capture", help="scan this machine into a snapshot")
+    p.add_argument("path")
+    p.add_argument("--sysfs", default="/sys")
+    p.add_argument("--proc", default="/proc")
+    p = sub.add_parser("scan", help="list the devices stored in a snapshot")
+    p.add_argument("path")
+    p = sub.add_parser("diff", help="show what changed between two snapshots")
+    p.add_argument("old")
+    p.add_argument("new")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "capture":
+            snapshot = capture(args.sysfs, args.proc)
+            write_snapshot(args.path, snapshot)
+            print(f"{len(snapshot.devices)} devices written to {args.path} ({os.path.getsize(args.path)} bytes)")
+        elif args.command == "scan":
+            from hardware.sysfs import all_devices, scan
+            for device in all_devices(scan(load_snapshot(args.path).root())):
+                print(device)
+        else:
+            added, removed, changed, system = diff(load_snapshot(args.old), load_snapshot(args.new))
+            for sign, dirs in (("+", added), ("-", removed), ("~", changed), ("~", system)):
+                for dir in dirs:
+                    print(f"{sign} {dir}")
+    except (OSError, SnapshotError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# PCI, USB and block device enumeration straight from sysfs.
+#
+# No lspci/lsusb/lsblk: the device directories are walked with os.scandir
+# and only the attribute files needed for identification are read. All
+# access goes through a SysfsRoot, so the same code runs against the live
+# /sys, a fixture tree or anything else implementing listdir/read/link/
+# exists (see hardware.snapshot).
+
+import os
+
+PCI_DIR = "bus/pci/devices"
+USB_DIR = "bus/usb/devices"
+BLOCK_DIR = "class/block"
+
+class SysfsRoot:
+    def __init__(self, path="/sys"):
+        self.path = path
+
+    def _path(self, rel):
+        return os.path.join(self.path, rel)
+
+    def listdir(self, rel):
+        try:
+            with os.scandir(self._path(rel)) as it:
+                return sorted(entry.name for entry in it)
+        except OSError:
+            return []
+
+    def read(self, rel):
+        try:
+            with open(self._path(rel), "rb") as f:
+                return f.read().strip().decode("utf-8", "replace")
+        except OSError:
+            return None
+
+    def link(self, rel):
+        try:
+            return os.path.basename(os.readlink(self._path(rel)))
+        except OSError:
+            return None
+
+    def exists(self, rel):
+        return os.path.exists(self._path(rel))
+
+def as_root(root):
+    if root is None:
+        return SysfsRoot()
+    if isinstance(root, str):
+        return SysfsRoot(root)
+    return root
+
+def _hex(value):
+    try:
+        return int(value, 16)
+    except (TypeError, ValueError):
+        return None
+
+class PciDevice:
+    __slots__ = ("slot", "vendor", "device", "subvendor", "subdevice", "device_class", "modalias", "driver")
+    bus = "pci"
+
+    def __init__(self, slot, vendor, device, subvendor, subdevice, device_class, modalias, driver):
+        self.slot = slot
+        self.vendor = vendor
+        self.device = device
+        self.subvendor = subvendor
+        self.subdevice = subdevice
+        self.device_class = device_class
+        self.modalias = modalias
+        self.driver = driver
+
+    @property
+    def name(self):
+        return self.slot
+
+    @property
+    def modaliases(self):
+        return (self.modalias,) if self.modalias else ()
+
+    def __repr__(self):
+        return f"<PciDevice {self.slot} {self.vendor:04x}:{self.device:04x} class {self.device_class:06x} driver={self.driver}>"
+
+class UsbDevice:
+    __slots__ = ("name", "vendor", "device", "device_class", "interface_classes", "modaliases", "drivers")
+    bus = "usb"
+    subvendor = None
+    subdevice = None
+
+    def __init__(self, name, vendor, device, device_class, interface_classes=(), modaliases=(), drivers=()):
+        self.name = name
+        self.vendor = vendor
+        self.device = device
+        self.device_class = device_class
+        self.interface_classes = interface_classes
+        self.modaliases = modaliases
+        self.drivers = drivers
+
+    @property
+    def driver(self):
+        return self.drivers[0] if self.drivers else None
+
+    def __repr__(self):
+        return f"<UsbDevice {self.name} {self.vendor:04x}:{self.device:04x} drivers={','.join(self.drivers) or None}>"
+
+class BlockDevice:
+    __slots__ = ("name", "size", "removable", "rotational", "model", "modalias", "driver")
+    bus = "block"
+
+    def __init__(self, name, size, removable, rotational, model, modalias, driver):
+        self.name = name
+        self.size = size
+        self.removable = removable
+        self.rotational = rotational
+        self.model = model
+        self.modalias = modalias
+        self.driver = driver
+
+    @property
+    def modaliases(self):
+        return (self.modalias,) if self.modalias else ()
+
+    def __repr__(self):
+        return f"<BlockDevice {self.name} {self.size // 10**9} GB model={self.model!r} removable={self.removable}>"
+
+def read_pci_device(root, slot):
+    base = f"{PCI_DIR}/{slot}/"
+    vendor = _hex(root.read(base + "vendor"))
+    device = _hex(root.read(base + "device"))
+    if vendor is None or device is None:
+        return None
+    return PciDevice(
+        slot, vendor, device,
+        _hex(root.read(base + "subsystem_vendor")),
+        _hex(root.read(base + "subsystem_device")),
+        _hex(root.read(base + "class")) or 0,
+        root.read(base + "modalias"),
+        root.link(base + "driver"))
+
+def read_usb_device(root, name, interfaces=None):
+    # interfaces: names of the "1-2:1.0" style entries, listed here when not given
+    base = f"{USB_DIR}/{name}/"
+    vendor = _hex(root.read(base + "idVendor"))
+    device = _hex(root.read(base + "idProduct"))
+    if vendor is None or device is None:
+        return None
+    usb = UsbDevice(name, vendor, device, _hex(root.read(base + "bDeviceClass")) or 0)
+    if interfaces is None:
+        interfaces = [i for i in root.listdir(USB_DIR) if i.partition(":")[0] == name and ":" in i]
+
+    # Interfaces carry the modalias and the bound driver
+    for iface in interfaces:
+        base = f"{USB_DIR}/{iface}/"
+        iface_class = _hex(root.read(base + "bInterfaceClass"))
+        if iface_class is not None and iface_class not in usb.interface_classes:
+            usb.interface_classes += (iface_class,)
+        modalias = root.read(base + "modalias")
+        if modalias:
+            usb.modaliases += (modalias,)
+        driver = root.link(base + "driver")
+        if driver and driver not in usb.drivers:
+            usb.drivers += (driver,)
+    return usb
+
+def read_block_device(root, name):
+    # Whole disks backed by hardware, partitions and virtual devices give None
+    base = f"{BLOCK_DIR}/{name}/"
+    if not root.exists(base + "device") or root.exists(base + "partition"):
+        return None
+    sectors = root.read(base + "size")
+    return BlockDevice(
+        name,
+        int(sectors) * 512 if sectors and sectors.isdigit() else 0,
+        root.read(base + "removable") == "1",
+        root.read(base + "queue/rotational") == "1",
+        root.read(base + "device/model"),
+        root.read(base + "device/modalias"),
+        root.link(base + "device/driver"))
+
+def pci_devices(root=None):
+    root = as_root(root)
+    devices = (read_pci_device(root, slot) for slot in root.listdir(PCI_DIR))
+    return [device for device in devices if device is not None]
+
+def usb_devices(root=None):
+    root = as_root(root)
+    names = root.listdir(USB_DIR)
+    interfaces = {}
+    for name in names:
+        if ":" in name:
+            interfaces.setdefault(name.partition(":")[0], []).append(name)
+    devices = (read_usb_device(root, name, interfaces.get(name, ())) for name in names if ":" not in name)
+    return [device for device in devices if device is not None]
+
+def block_devices(root=None):
+    root = as_root(root)
+    devices = (read_block_device(root, name) for name in root.listdir(BLOCK_DIR))
+    return [device for device in devices if device is not None]
+
+READERS = {"pci": read_pci_device, "usb": read_usb_device, "block": read_block_device}
+
+def scan(root=None):
+    root = as_root(root)
+    return {
+        "pci": pci_devices(root),
+        "usb": usb_devices(root),
+        "block": block_devices(root),
+    }
+
+def all_devices(scanned):
+    return [device for devices in scanned.values() for device in devices]
@@ -16,47 +16,54 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import subprocess
-import os
-import re
+import sys
 import platform
-import gui.gui
-import gui.windows_ui
-import gui.image_rc
-from gui.gui import MainApp
-from PySide6.QtWidgets import QApplication
+from system import tracing
+from system.cache import cached
+from system.live import is_live
 
-def is_live():
-    out = subprocess.run("df ~", shell=True, capture_output=True, text=True, check=False)
-    fs = out.stdout.strip().split("\n")[-1].split()[0].split("/")[-1]
+# Qt is only imported here, so the branches that don't show a window (and
+# the headless switcheroo CLI, which reuses this module) never load PySide6
+def create_gui():
+    with tracing.span("import PySide6"):
+        from PySide6.QtWidgets import QApplication
+    with tracing.span("import gui.windows_ui"):
+        import gui.windows_ui
+    with tracing.span("import gui.gui"):
+        from gui.gui import MainApp
 
-    parts = subprocess.run("awk '{print $4}' /proc/partitions", shell=True, capture_output=True, text=True)
-    devices = parts.stdout.split()
-
-    # Only keep real disk devices (sd*, nvme*, mmcblk*)
-    real = [p for p in devices if re.match(r'^(sd\w+|nvme\d+n\d+p?\d*|mmcblk\d+p?\d*)$', p)]
-    if fs not in real:
-        cg = subprocess.run("cat /proc/1/cgroup", shell=True, capture_output=True, text=True)
-        return True # Home not on real disk = live session
+    with tracing.span("QApplication"):
+        app = QApplication.instance() or QApplication([])
+    with tracing.span("MainApp"):
+        win = MainApp()
+    tracing.install_first_paint_hook(win)
+    return app, win
 
-    return False # Home on real disk = installed system
+def run_gui():
+    app, win = create_gui()
+    win.show()
+    return app.exec()
 
-if __name__ == "__main__":
+# The event loop's exit status, None where there is no window to show yet
+def main(argv=None):
+    tracing.enable_from_argv(sys.argv if argv is None else argv)
     system = platform.system()
-    app = QApplication([])
 
     if system == "Windows":
-        win = MainApp()
+        return run_gui()
 
     elif system == "Linux":
-        if is_live():
+        with tracing.span("is_live"):
+            live = cached("is_live", is_live)
+        if live:
             # TODO: Show live linux gui
             # DEBUG: print("Live distro")
             pass
         else:
             # TODO: Show installed linux gui
-            # DEBUG: win = MainApp()
-            # DEBUG: win.show()
-            # DEBUG: app.exec()
+            # DEBUG: return run_gui()
             # DEBUG: print("Installed distro")
             pass
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Offline store of installable Linux apps from AppStream catalogs.
+#
+# Reads Flathub-style appstream.xml(.gz) and distro DEP-11 YAML
+# (Components-<arch>.yml.gz/.xz) one component at a time: XML through
+# iterparse, clearing every component once read, YAML document by
+# document (PyYAML when installed, a reader for the few fields needed
+# otherwise). Only id, name, summary, categories and keywords are kept, in
+# an SQLite database indexed on ids, lower-case names, categories and
+# keywords.
+#
+# Catalogs are re-ingested incrementally: a file with the same size and
+# mtime, or the same checksum, as last time is skipped, and otherwise only
+# components whose fields changed are rewritten and the ones that went away
+# deleted.
+#
+#   python -m software.appstream ingest appstream.xml.gz Components-amd64.yml.gz [--db PATH]
+#   python -m software.appstream search gimp
+#   python -m software.appstream show org.gimp.GIMP
+
+import argparse
+import gzip
+import hashlib
+import lzma
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from system.store import Store, default_data_dir, sha256_file
+
+SCHEMA_VERSION = 1
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+BATCH = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS components (
+    source TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    name_lower TEXT,
+    summary TEXT,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (source, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS components_id ON components (id);
+CREATE INDEX IF NOT EXISTS components_name ON components (name_lower);
+CREATE TABLE IF NOT EXISTS categories (
+    source TEXT NOT NULL,
+    id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (source, id, category)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS categories_category ON categories (category);
+CREATE TABLE IF NOT EXISTS keywords (
+    source TEXT NOT NULL,
+    id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (source, id, keyword)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS keywords_keyword ON keywords (keyword);
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY,
+    origin TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    components INTEGER NOT NULL,
+    imported_at REAL NOT NULL
+);
+"""
+
+def default_db_path():
+    return os.path.join(default_data_dir(), "appstream.db")
+
+class Component:
+    __slots__ = ("id", "name", "summary", "categories", "keywords", "source")
+
+    def __init__(self, id, name=None, summary=None, categories=(), keywords=(), source=None):
+        self.id = id
+        self.name = name
+        self.summary = summary
+        self.categories = list(categories)
+        self.keywords = list(keywords)
+        self.source = source
+
+    @property
+    def digest(self):
+        h = hashlib.sha1()
+        for field in (self.name, self.summary, "\x1f".join(self.categories), "\x1f".join(self.keywords)):
+            h.update((field or "").encode("utf-8") + b"\x1e")
+        return h.hexdigest()
+
+    def __repr__(self):
+        return f"<Component {self.id} {self.name!r}>"
+
+def _open_binary(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+def _is_yaml(path):
+    name = os.path.basename(path).lower()
+    for suffix in (".gz", ".xz"):
+        name = name.removesuffix(suffix)
+    return name.endswith((".yml", ".yaml"))
+
+def _untranslated(elem):
+    return elem.get(XML_LANG) in (None, "C")
+
+def read_xml(f, info):
+    # Components of an AppStream XML collection; info gets the collection's origin
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(f, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+                info["origin"] = elem.get("origin")
+            elif elem.tag == "component":
+                depth += 1
+            continue
+        if elem.tag != "component":
+            continue
+        depth -= 1
+        if depth:
+            continue
+        component = Component(elem.findtext("id", "").strip())
+        for child in elem:
+            if child.tag == "name" and component.name is None and _untranslated(child):
+                component.name = (child.text or "").strip() or None
+            elif child.tag == "summary" and component.summary is None and _untranslated(child):
+                component.summary = (child.text or "").strip() or None
+            elif child.tag == "categories":
+                component.categories = [c.text.strip() for c in child if c.tag == "category" and c.text]
+            elif child.tag == "keywords" and _untranslated(child):
+                component.keywords += [k.text.strip() for k in child
+                                       if k.tag == "keyword" and k.text and _untranslated(k)]
+        # Drop what was read so far, the tree never grows past one component
+        root.clear()
+        if component.id:
+            yield component
+
+def _yaml_documents(f):
+    # Raw text of each "---" separated document
+    lines = []
+    for raw in f:
+        line = raw.decode("utf-8", "replace")
+        if line.startswith("---"):
+            if lines:
+                yield "".join(lines)
+            lines = []
+        else:
+            lines.append(line)
+    if lines:
+        yield "".join(lines)
+
+def _scalar(text):
+    text = text.strip()
+    if text[:1] in ("|", ">"):
+        # Block scalars only appear in fields that aren't kept
+        return None
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        quote = text[0]
+        text = text[1:-1]
+        return text.replace("''", "'") if quote == "'" else text.replace('\\"', '"')
+    return text or None
+
+def _parse_fallback(text):
+    # The fields a DEP-11 component needs, without PyYAML: top-level scalars and
+    # lists, and the scalars and lists one level down ("Name: {C: ...}")
+    doc = {}
+    key = None
+    sub = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        if stripped.startswith("- ") or stripped == "-":
+            if key is None:
+                continue
+            if sub is not None and indent >= 2:
+                target, name = doc[key], sub
+            else:
+                target, name = doc, key
+            if not isinstance(target.get(name), list):
+                target[name] = []
+            target[name].append(_scalar(stripped[2:]))
+        elif indent == 0:
+            key, _, value = stripped.partition(":")
+            sub = None
+            doc[key] = _scalar(value)
+        elif indent == 2 and key is not None and ":" in stripped:
+            sub, _, value = stripped.partition(":")
+            if not isinstance(doc.get(key), dict):
+                doc[key] = {}
+            doc[key][sub] = _scalar(value)
+    return doc
+
+def _yaml_loader():
+    try:
+        import yaml
+    except ImportError:
+        return _parse_fallback
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return lambda text: yaml.load(text, Loader=loader)
+
+def _c(value):
+    # The untranslated text of a DEP-11 localised field
+    if isinstance(value, dict):
+        value = value.get("C")
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+def read_dep11(f, info):
+    # Components of a DEP-11 YAML catalog; info gets the header's origin
+    load = _yaml_loader()
+    for n, text in enumerate(_yaml_documents(f)):
+        try:
+            doc = load(text)
+        except Exception:
+            # One broken document doesn't stop the rest of the catalog
+            continue
+        if not isinstance(doc, dict):
+            continue
+        if n == 0 and doc.get("File") == "DEP-11":
+            info["origin"] = doc.get("Origin")
+            continue
+        component_id = doc.get("ID")
+        if not isinstance(component_id, str):
+            continue
+        keywords = doc.get("Keywords")
+        keywords = keywords.get("C") if isinstance(keywords, dict) else keywords
+        categories = doc.get("Categories")
+        yield Component(component_id.strip(), _c(doc.get("Name")), _c(doc.get("Summary")),
+                        [str(c) for c in categories] if isinstance(categories, list) else (),
+                        [str(k) for k in keywords] if isinstance(keywords, list) else ())
+
+def read_catalog(path, info=None):
+    # Components of any supported catalog file, streamed
+    info = {} if info is None else info
+    with _open_binary(path) as f:
+        reader = read_dep11 if _is_yaml(path) else read_xml
+        yield from reader(f, info)
+
+class AppStreamDB(Store):
+    def __init__(self, path=None):
+        super().__init__(path or default_db_path(), SCHEMA, SCHEMA_VERSION)
+
+    def _source(self, name):
+        return self.conn.execute("SELECT size, mtime_ns, sha256 FROM sources WHERE name = ?", (name,)).fetchone()
+
+    def ingest(self, path, name=None, force=False):
+        # Returns (changed, removed) component counts, or None when the catalog was unchanged.
+        # Sources are told apart by their resolved path: every DEP-11 suite and component
+        # (main, universe, ...) ships its own Components-amd64.yml
+        name = name or os.path.realpath(path)
+        st = os.stat(path)
+        known = None if force else self._source(name)
+        if known is not None and known[:2] == (st.st_size, st.st_mtime_ns):
+            return None
+        digest = sha256_file(path)
+        if known is not None and known[2] == digest:
+            with self.conn:
+                self.conn.execute("UPDATE sources SET size = ?, mtime_ns = ? WHERE name = ?",
+                                  (st.st_size, st.st_mtime_ns, name))
+            return None
+
+        old = dict(self.conn.execute("SELECT id, digest FROM components WHERE source = ?", (name,)))
+        seen = set()
+        changed = []
+        info = {}
+        count = written = 0
+        with self.conn:
+            for component in read_catalog(path, info):
+                if component.id in seen:
+                    continue
+                seen.add(component.id)
+                count += 1
+                if old.get(component.id) != component.digest:
+                    written += 1
+                    changed.append(component)
+                    if len(changed) >= BATCH:
+                        self._write(name, changed)
+                        changed.clear()
+            self._write(name, changed)
+            removed = [(name, i) for i in old if i not in seen]
+            for table in ("components", "categories", "keywords"):
+                self.conn.executemany(f"DELETE FROM {table} WHERE source = ? AND id = ?", removed)
+            self.conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?, ?)",
+                              (name, info.get("origin"), st.st_size, st.st_mtime_ns, digest, count, time.time()))
+        return written, len(removed)
+
+    def _write(self, name, components):
+        ids = [(name, c.id) for c in components]
+        for table in ("categories", "keywords"):
+            self.conn.executemany(f"DELETE FROM {table} WHERE source = ? AND id = ?", ids)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO components (source, id, name, name_lower, summary, digest) VALUES (?, ?, ?, ?, ?, ?)",
+            [(name, c.id, c.name, (c.name or "").lower(), c.summary, c.digest) for c in components])
+        self.conn.executemany("INSERT OR IGNORE INTO categories VALUES (?, ?, ?)",
+                              [(name, c.id, cat) for c in components for cat in c.categories])
+        self.conn.executemany("INSERT OR IGNORE INTO keywords VALUES (?, ?, ?)",
+                              [(name, c.id, k.lower()) for c in components for k in c.keywords])
+
+    def _components(self, rows):
+        components = []
+        for source, component_id, name, summary in rows:
+            key = (source, component_id)
+            categories = [r[0] for r in self.conn.execute(
+                "SELECT category FROM categories WHERE source = ? AND id = ?", key)]
+            keywords = [r[0] for r in self.conn.execute(
+                "SELECT keyword FROM keywords WHERE source = ? AND id = ?", key)]
+            components.append(Component(component_id, name, summary, categories, keywords, source))
+        return components
+
+    def get(self, component_id):
+        # Every source's entry for an app id (e.g. the Flatpak ids of the alternatives catalog)
+        return self._components(self.conn.execute(
+            "SELECT source, id, name, summary FROM components WHERE id = ? ORDER BY source", (component_id,)))
+
+    def search(self, text, limit=20):
+        # Exact id, name prefix and keyword matches, then the last part of the id ("gimp"
+        # for org.gimp.GIMP or gimp.desktop) and name substrings. Those two scan the table,
+        # but only run when the indexed lookups didn't fill the limit
+        text = text.strip()
+        lower = text.lower()
+        like = lower.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        rows = self.conn.execute("""
+            SELECT source, id, name, summary FROM components WHERE id = ?
+            UNION ALL
+            SELECT source, id, name, summary FROM components WHERE name_lower >= ? AND name_lower < ?
+            UNION ALL
+            SELECT c.source, c.id, c.name, c.summary FROM keywords k
+            JOIN components c ON c.source = k.source AND c.id = k.id WHERE k.keyword = ?
+            UNION ALL
+            SELECT source, id, name, summary FROM components
+            WHERE id LIKE ? ESCAPE '\\' OR id LIKE ? ESCAPE '\\' OR id LIKE ? ESCAPE '\\'
+            UNION ALL
+            SELECT source, id, name, summary FROM components WHERE instr(name_lower, ?)
+            LIMIT ?""", (text, lower, lower + "\uffff", lower, f"%.{like}", f"%.{like}.desktop", f"{like}.desktop", lower, limit * 2))
+        unique = {}
+        for row in rows:
+            unique.setdefault(row[:2], row)
+        return self._components(list(unique.values())[:limit])
+
+    def in_category(self, category, limit=100):
+        return self._components(self.conn.execute("""
+            SELECT c.source, c.id, c.name, c.summary FROM categories g
+            JOIN components c ON c.source = g.source AND c.id = g.id WHERE g.category = ?
+            ORDER BY c.name_lower LIMIT ?""", (category, limit)))
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM components").fetchone()[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m software.appstream")
+    parser.add_argument("--db", default=None, help="database path (default: $XDG_DATA_HOME/switcheroo/appstream.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("ingest", help="ingest AppStream XML or DEP-11 YAML catalogs")
+    p.add_argument("catalogs", nargs="+")
+    p.add_argument("--force", action="store_true", help="read the catalog even if it didn't change")
+    p = sub.add_parser("search", help="find apps by id, name or keyword")
+    p.add_argument("text")
+    p = sub.add_parser("show", help="print an app's entries")
+    p.add_argument("id")
+    args = parser.parse_args(argv)
+
+    with AppStreamDB(args.db) as db:
+        if args.command == "ingest":
+            for catalog in args.catalogs:
+                try:
+                    result = db.ingest(catalog, force=args.force)
+                except (OSError, ET.ParseError, EOFError, lzma.LZMAError) as e:
+                    print(f"{catalog}: {e}", file=sys.stderr)
+                    continue
+                print(f"{catalog}: " + ("unchanged" if result is None else "%d written, %d removed" % result))
+            print(f"{db.count()} components in {db.path}")
+        else:
+            found = db.search(args.text) if args.command == "search" else db.get(args.id)
+            for c in found:
+                print(f"{c.id}  {c.name or '?'} - {c.summary or ''}  [{c.source}]")
+                if args.command == "show":
+                    print(f"    categories: {', '.join(c.categories) or '-'}")
+                    print(f"    keywords: {', '.join(c.keywords) or '-'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Linux alternatives for Windows programs, from a compiled catalog.
+#
+# The catalog is written as JSON (see alternatives.json) and compiled into
+# a binary file that is memory-mapped and never parsed as a whole:
+#
+#   header
+#   keys          (string, entry) sorted by the normalised name bytes
+#   entries       name, category, first alternative, alternative count
+#   alternatives  name, app id, note
+#   string table  offsets of every interned string, then the UTF-8 blob
+#
+# Opening costs a header read; a lookup binary-searches the keys and
+# decodes the one entry asked for. The trigram index for fuzzy matches is
+# only built the first time an exact lookup misses. Compiled catalogs live
+# under $XDG_CACHE_HOME/switcheroo and are rebuilt when the source changes.
+#
+#   python -m software.catalog compile alternatives.json out.idx
+#   python -m software.catalog "Adobe Photoshop 2024 (64-bit)" ...
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+
+from software.matcher import TrigramIndex, normalize
+from system.cache import atomic_write, default_index_dir, file_stamp, source_changed
+
+MAGIC = b"SWALT\x00\x00\x02"
+# magic, keys, entries, alternatives, strings, source size, source mtime_ns
+HEADER = struct.Struct(">8sIIIIQQ")
+KEY = struct.Struct(">II")
+ENTRY = struct.Struct(">IIIH")
+ALTERNATIVE = struct.Struct(">III")
+NONE = 0xffffffff
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alternatives.json")
+
+class Alternative:
+    __slots__ = ("name", "app_id", "note")
+
+    def __init__(self, name, app_id=None, note=None):
+        self.name = name
+        self.app_id = app_id
+        self.note = note
+
+    def __repr__(self):
+        return f"<Alternative {self.name} {self.app_id or '-'}>"
+
+class Entry:
+    __slots__ = ("index", "name", "category", "alternatives")
+
+    def __init__(self, index, name, category, alternatives):
+        self.index = index
+        self.name = name
+        self.category = category
+        self.alternatives = alternatives
+
+    def __repr__(self):
+        return f"<Entry {self.name}: {', '.join(a.name for a in self.alternatives)}>"
+
+def compile_catalog(source, dest):
+    with open(source, encoding="utf-8") as f:
+        programs = json.load(f)
+
+    strings = {}
+    def intern(text):
+        if text is None:
+            return NONE
+        return strings.setdefault(text, len(strings))
+
+    keys = {}
+    entries = bytearray()
+    alternatives = bytearray()
+    count = 0
+    for index, program in enumerate(programs):
+        alts = program.get("alternatives", [])
+        entries += ENTRY.pack(intern(program["name"]), intern(program.get("category")), count, len(alts))
+        for alt in alts:
+            alternatives += ALTERNATIVE.pack(intern(alt["name"]), intern(alt.get("id")), intern(alt.get("note")))
+        count += len(alts)
+        for name in [program["name"]] + program.get("aliases", []):
+            key = normalize(name)
+            if key:
+                keys.setdefault(key.encode("utf-8"), index)
+
+    key_records = bytearray()
+    for key in sorted(keys):
+        key_records += KEY.pack(intern(key.decode("utf-8")), keys[key])
+
+    offsets = bytearray()
+    blob = bytearray()
+    for text in strings:
+        offsets += struct.pack(">I", len(blob))
+        blob += text.encode("utf-8")
+    offsets += struct.pack(">I", len(blob))
+
+    header = HEADER.pack(MAGIC, len(keys), len(programs), count, len(strings), *file_stamp(source))
+    with atomic_write(dest) as f:
+        for part in (header, key_records, entries, alternatives, offsets, blob):
+            f.write(part)
+    return len(programs)
+
+class Catalog:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, self.key_count, self.count, alternatives, strings,
+             self.source_size, self.source_mtime) = HEADER.unpack_from(self.map)
+        except struct.error:
+            magic = None
+        if magic != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not an alternatives catalog")
+        self.keys_at = HEADER.size
+        self.entries_at = self.keys_at + self.key_count * KEY.size
+        self.alternatives_at = self.entries_at + self.count * ENTRY.size
+        self.offsets_at = self.alternatives_at + alternatives * ALTERNATIVE.size
+        self.blob_at = self.offsets_at + (strings + 1) * 4
+        self._index = None
+
+    def close(self):
+        self.map.close()
+
+    def __len__(self):
+        return self.count
+
+    def stale(self, source):
+        return source_changed(source, (self.source_size, self.source_mtime))
+
+    def _bytes(self, sid):
+        start, end = struct.unpack_from(">II", self.map, self.offsets_at + sid * 4)
+        return self.map[self.blob_at + start:self.blob_at + end]
+
+    def string(self, sid):
+        return None if sid == NONE else self._bytes(sid).decode("utf-8")
+
+    def entry(self, index):
+        name, category, first, count = ENTRY.unpack_from(self.map, self.entries_at + index * ENTRY.size)
+        alternatives = []
+        for i in range(first, first + count):
+            alt_name, app_id, note = ALTERNATIVE.unpack_from(self.map, self.alternatives_at + i * ALTERNATIVE.size)
+            alternatives.append(Alternative(self.string(alt_name), self.string(app_id), self.string(note)))
+        return Entry(index, self.string(name), self.string(category), alternatives)
+
+    def _key(self, position):
+        return KEY.unpack_from(self.map, self.keys_at + position * KEY.size)
+
+    def lookup(self, name):
+        # Exact match on the normalised name or one of its aliases
+        wanted = normalize(name).encode("utf-8")
+        lo, hi = 0, self.key_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            sid, index = self._key(mid)
+            probe = self._bytes(sid)
+            if probe < wanted:
+                lo = mid + 1
+            elif probe > wanted:
+                hi = mid
+            else:
+                return self.entry(index)
+        return None
+
+    def keys(self):
+        for position in range(self.key_count):
+            sid, index = self._key(position)
+            yield index, self.string(sid)
+
+    def index(self):
+        if self._index is None:
+            self._index = TrigramIndex(self.keys())
+        return self._index
+
+    def match(self, name, limit=3):
+        # [(score, Entry)] best first; an exact hit skips the fuzzy index altogether
+        entry = self.lookup(name)
+        if entry is not None:
+            return [(1.0, entry)]
+        return [(score, self.entry(index)) for score, index, _ in self.index().match(name, limit)]
+
+def open_catalog(source=SOURCE, index_dir=None):
+    # The compiled catalog, (re)built from the JSON source when needed
+    path = os.path.join(index_dir or default_index_dir(), "alternatives.idx")
+    try:
+        catalog = Catalog(path)
+        if not catalog.stale(source):
+            return catalog
+        catalog.close()
+    except (OSError, ValueError):
+        pass
+    try:
+        compile_catalog(source, path)
+        return Catalog(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["compile"]:
+        parser = argparse.ArgumentParser(prog="python -m software.catalog compile")
+        parser.add_argument("source")
+        parser.add_argument("dest")
+        args = parser.parse_args(argv[1:])
+        try:
+            count = compile_catalog(args.source, args.dest)
+        except (OSError, ValueError, KeyError) as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"{count} programs written to {args.dest}")
+        return 0
+
+    parser = argparse.ArgumentParser(prog="python -m software.catalog")
+    parser.add_argument("names", nargs="+")
+    parser.add_argument("--source", default=SOURCE)
+    parser.add_argument("--catalog", default=None, help="compiled catalog to use as is")
+    args = parser.parse_args(argv)
+
+    catalog = Catalog(args.catalog) if args.catalog else open_catalog(args.source)
+    if catalog is None:
+        print(f"can't compile {args.source}", file=sys.stderr)
+        return 1
+    for name in args.names:
+        found = catalog.match(name)
+        print(name if found else f"{name}: no alternatives known")
+        for score, entry in found:
+            alternatives = ", ".join(f"{a.name} ({a.app_id})" if a.app_id else a.name for a in entry.alternatives)
+            print(f"    {score:.2f}  {entry.name}  ->  {alternatives}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
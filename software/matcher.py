@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Fuzzy matching of Windows program names against catalog names.
+#
+# Names are normalised first (case, accents, versions, years, architectures,
+# locales and filler words go), then cut into word trigrams the way
+# PostgreSQL's pg_trgm does. The index maps each trigram to the catalog
+# rows containing it; a query counts shared trigrams through it, keeps the
+# best few rows and only scores those. Rows sharing nothing with the query
+# are never looked at. In the score each trigram weighs 1 / the number of
+# catalog programs using it, so a vendor name shared by many of them
+# ("Microsoft OneDrive" against "Microsoft Office") counts for little, and
+# runtimes, updaters and plugins of a catalog program don't match it.
+#
+#   python -m software.matcher CATALOG.txt "Adobe Photoshop 2024 (64-bit)" ...
+
+import argparse
+import heapq
+import re
+import sys
+import unicodedata
+from collections import Counter
+from itertools import chain
+
+SHORTLIST = 32
+THRESHOLD = 0.45
+# Trigrams in more than this share of the rows (" mi", "soft") say little and cost a lot
+COMMON = 0.05
+
+_NOISE = re.compile(r"""
+    \b(?:x64|x86|x86_64|amd64|arm64|aarch64|win32|win64|32|64)[\s-]?bit\b
+  | \b(?:x64|x86|x86_64|amd64|arm64|aarch64|win32|win64)\b
+  | \b(?:([a-z]{2})-\1                                   # lowercase locales: it-it, en-us, pt-br
+       | en-(?:us|gb|au|ca) | pt-br | zh-(?:cn|tw|hk) | ja-jp | ko-kr | sv-se | da-dk | nb-no
+       | cs-cz | el-gr | uk-ua | es-mx | fr-ca)\b
+  | \bv?\d+(?:[._]\d+)+[a-z0-9]*\b                       # 2.10.38, v1.2b, 10_0
+  | \b(?:version|build|rev|release)\s*\d+\b
+  | \b(?:19|20)\d\d\b                                    # years
+""", re.VERBOSE)
+# Locales as Windows writes them (en-US, pt-BR); the lowercase ones above are only the
+# usual ones, as a plain xx-xx also catches "wi-fi", "hi-fi" and "to-do"
+_LOCALE = re.compile(r"\b[a-z]{2}-[A-Z]{2}\b")
+_PUNCT = re.compile(r"[^a-z0-9+#]+")
+# Parts of something else rather than programs of their own: "Microsoft Edge WebView2 Runtime" is not Edge
+COMPONENTS = {"runtime", "runtimes", "redistributable", "redist", "webview2", "sdk", "update", "updater",
+              "helper", "service", "plugin", "addin", "extension", "driver", "drivers"}
+STOPWORDS = {"the", "for", "and", "of", "version", "edition", "bit", "inc", "ltd", "llc", "corporation", "corp"}
+
+def normalize(name):
+    name = unicodedata.normalize("NFKD", name)
+    name = _LOCALE.sub(" ", "".join(c for c in name if not unicodedata.combining(c))).lower()
+    name = _NOISE.sub(" ", name)
+    words = [w for w in _PUNCT.sub(" ", name).split() if w not in STOPWORDS]
+    return " ".join(words)
+
+def trigrams(text):
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+class TrigramIndex:
+    def __init__(self, entries):
+        # entries: (key, name) pairs; a key may come with several names (aliases)
+        self.keys = []
+        self.names = []
+        self.grams = []
+        self.words = []
+        self.weights = []
+        self.postings = {}
+        for key, name in entries:
+            text = normalize(name)
+            grams = trigrams(text)
+            if not grams:
+                continue
+            row = len(self.keys)
+            self.keys.append(key)
+            self.names.append(name)
+            self.grams.append(frozenset(grams))
+            self.words.append(frozenset(text.split()))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(row)
+        limit = max(50, int(len(self.keys) * COMMON))
+        self.common = {gram for gram, rows in self.postings.items() if len(rows) > limit}
+        # Aliases of one program don't make its trigrams any more common
+        self.weight = {gram: 1 / len({self.keys[row] for row in rows}) for gram, rows in self.postings.items()}
+        self.weights = [self.weigh(grams) for grams in self.grams]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def shortlist(self, grams, size=SHORTLIST):
+        # Rows sharing the most rare trigrams with the query, relative to their size;
+        # common trigrams only count in the score
+        rare = [self.postings[g] for g in grams if g in self.postings and g not in self.common]
+        if not rare:
+            # Nothing but common trigrams ("microsoft"): fall back to them
+            rare = [self.postings[g] for g in grams if g in self.postings]
+        counts = Counter(chain.from_iterable(rare)).most_common(size * 4)
+        return [row for row, count in heapq.nlargest(size, counts, key=lambda rc: rc[1] / len(self.grams[rc[0]]))]
+
+    def weigh(self, grams):
+        # Trigrams the catalog doesn't have are as telling as the rarest ones
+        return sum(self.weight.get(gram, 1.0) for gram in grams)
+
+    def score(self, row, grams, words, weight=None):
+        # A runtime, updater or plugin of the catalog program isn't the program
+        if (words - self.words[row]) & COMPONENTS:
+            return 0.0
+        if weight is None:
+            weight = self.weigh(grams)
+        dice = 2 * self.weigh(grams & self.grams[row]) / (weight + self.weights[row])
+        # Catalog names are usually the short form ("GIMP", "Microsoft Office"), all
+        # their words in the program name is a good sign; dice still orders those
+        if words >= self.words[row]:
+            return 0.75 + 0.25 * dice
+        return dice
+
+    def match(self, name, limit=5, threshold=THRESHOLD):
+        # [(score, key, catalog name)] best first, one per key
+        text = normalize(name)
+        grams = trigrams(text)
+        if not grams:
+            return []
+        words = frozenset(text.split())
+        weight = self.weigh(grams)
+        results = {}
+        for row in self.shortlist(grams):
+            score = self.score(row, grams, words, weight)
+            key = self.keys[row]
+            if score >= threshold and score > results.get(key, (0,))[0]:
+                results[key] = (score, self.names[row])
+        ranked = sorted(((score, key, n) for key, (score, n) in results.items()), key=lambda r: -r[0])
+        return ranked[:limit]
+
+    def best(self, name, threshold=THRESHOLD):
+        found = self.match(name, 1, threshold)
+        return found[0] if found else None
+
+def read_catalog(path):
+    # "key<TAB>name" or just "name" per line
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line and not line.startswith("#"):
+                key, _, name = line.partition("\t")
+                entries.append((key, name or key))
+    return entries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m software.matcher")
+    parser.add_argument("catalog", help="text file, one \"key<TAB>name\" or \"name\" per line")
+    parser.add_argument("names", nargs="+")
+    parser.add_argument("--limit", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    try:
+        index = TrigramIndex(read_catalog(args.catalog))
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    for name in args.names:
+        print(f"{name}  ->  {normalize(name)!r}")
+        for score, key, found in index.match(name, args.limit):
+            print(f"    {score:.2f}  {key}  {found}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Installed Windows programs, read offline from the registry hives.
+#
+# Hive (regf) files are memory-mapped and only the cells on the way to
+# the Uninstall keys are decoded: a key is its nk cell offset until its
+# name, subkeys or values are asked for, and subkey lookups walk the
+# lf/lh/li/ri lists comparing names one at a time. Nothing else in the
+# hive is read, so a 100+ MB SOFTWARE hive costs a few page faults.
+# Hives whose transaction logs weren't replayed are read as they are.
+#
+#   python -m software.registry [--windows /mnt/windows] [--hive FILE ...] [--json]
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+
+BASE_BLOCK = 4096
+BIG_DATA_SEGMENT = 16344
+KEY_COMP_NAME = 0x20
+VALUE_COMP_NAME = 0x1
+DATA_INLINE = 0x80000000
+
+REG_SZ, REG_EXPAND_SZ, REG_BINARY, REG_DWORD, REG_DWORD_BIG_ENDIAN = 1, 2, 3, 4, 5
+REG_MULTI_SZ, REG_QWORD = 7, 11
+
+UNINSTALL = "Microsoft\\Windows\\CurrentVersion\\Uninstall"
+# (hive, key path, scope) for every place programs register themselves
+UNINSTALL_KEYS = {
+    "SOFTWARE": ((UNINSTALL, "machine"), ("WOW6432Node\\" + UNINSTALL, "machine-32bit")),
+    "NTUSER.DAT": (("Software\\" + UNINSTALL, "user"), ("Software\\WOW6432Node\\" + UNINSTALL, "user-32bit")),
+}
+UPDATE_TYPES = {"update", "hotfix", "security update", "service pack"}
+
+class RegistryError(Exception):
+    pass
+
+class Hive:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise RegistryError(f"{path} is empty") from None
+        if self.map[:4] != b"regf":
+            self.map.close()
+            raise RegistryError(f"{path} is not a registry hive")
+        self.minor, = struct.unpack_from("<I", self.map, 0x18)
+        root, = struct.unpack_from("<I", self.map, 0x24)
+        self.root = Key(self, root)
+
+    def close(self):
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def cell(self, offset):
+        # (position, length) of the payload of the cell at a hive bin offset
+        start = BASE_BLOCK + offset
+        if offset == 0xffffffff or start + 4 > len(self.map):
+            raise RegistryError(f"bad cell offset {offset:#x}")
+        size, = struct.unpack_from("<i", self.map, start)
+        size = -size if size < 0 else size
+        if size < 4 or start + size > len(self.map):
+            raise RegistryError(f"bad cell size at {offset:#x}")
+        return start + 4, size - 4
+
+    def unpack(self, fmt, pos):
+        return struct.unpack_from(fmt, self.map, pos)
+
+    def signed(self, offset, signature, what):
+        pos, length = self.cell(offset)
+        if self.map[pos:pos + 2] != signature:
+            raise RegistryError(f"no {what} at {offset:#x}")
+        return pos, length
+
+    def open(self, path):
+        key = self.root
+        for part in filter(None, path.split("\\")):
+            key = key.subkey(part)
+            if key is None:
+                return None
+        return key
+
+class Key:
+    __slots__ = ("hive", "offset", "_pos")
+
+    def __init__(self, hive, offset):
+        self.hive = hive
+        self.offset = offset
+        self._pos = None
+
+    @property
+    def pos(self):
+        # Nothing is read until the key is used
+        if self._pos is None:
+            self._pos = self.hive.signed(self.offset, b"nk", "key")[0]
+        return self._pos
+
+    @property
+    def name(self):
+        pos = self.pos
+        flags, = self.hive.unpack("<H", pos + 2)
+        length, = self.hive.unpack("<H", pos + 72)
+        raw = self.hive.map[pos + 76:pos + 76 + length]
+        return raw.decode("latin-1") if flags & KEY_COMP_NAME else raw.decode("utf-16-le", "replace")
+
+    def _subkey_offsets(self, list_offset, depth=0):
+        pos, length = self.hive.cell(list_offset)
+        sig = self.hive.map[pos:pos + 2]
+        count, = self.hive.unpack("<H", pos + 2)
+        step = 8 if sig in (b"lf", b"lh") else 4
+        if sig not in (b"lf", b"lh", b"li", b"ri") or 4 + count * step > length or depth > 1:
+            raise RegistryError(f"bad subkey list at {list_offset:#x}")
+        for i in range(count):
+            offset, = self.hive.unpack("<I", pos + 4 + i * step)
+            if sig == b"ri":
+                yield from self._subkey_offsets(offset, depth + 1)
+            else:
+                yield offset
+
+    def subkeys(self):
+        count, = self.hive.unpack("<I", self.pos + 20)
+        if not count:
+            return
+        list_offset, = self.hive.unpack("<I", self.pos + 28)
+        for offset in self._subkey_offsets(list_offset):
+            yield Key(self.hive, offset)
+
+    def subkey(self, name):
+        wanted = name.casefold()
+        for key in self.subkeys():
+            if key.name.casefold() == wanted:
+                return key
+        return None
+
+    def values(self):
+        count, list_offset = self.hive.unpack("<II", self.pos + 36)
+        if not count:
+            return
+        pos, length = self.hive.cell(list_offset)
+        for i in range(min(count, length // 4)):
+            yield Value(self.hive, self.hive.unpack("<I", pos + i * 4)[0])
+
+    def value(self, name, default=None):
+        # Data of the named value; "" is the default value
+        wanted = name.casefold()
+        for value in self.values():
+            try:
+                if value.name.casefold() == wanted:
+                    return value.data
+            except RegistryError:
+                continue
+        return default
+
+    def __repr__(self):
+        return f"<Key {self.name}>"
+
+class Value:
+    __slots__ = ("hive", "offset", "pos")
+
+    def __init__(self, hive, offset):
+        self.hive = hive
+        self.offset = offset
+        self.pos = hive.signed(offset, b"vk", "value")[0]
+
+    @property
+    def name(self):
+        length, = self.hive.unpack("<H", self.pos + 2)
+        flags, = self.hive.unpack("<H", self.pos + 16)
+        raw = self.hive.map[self.pos + 20:self.pos + 20 + length]
+        return raw.decode("latin-1") if flags & VALUE_COMP_NAME else raw.decode("utf-16-le", "replace")
+
+    @property
+    def type(self):
+        return self.hive.unpack("<I", self.pos + 12)[0]
+
+    def raw(self):
+        hive = self.hive
+        size, offset = hive.unpack("<II", self.pos + 4)
+        if size & DATA_INLINE:
+            return hive.map[self.pos + 8:self.pos + 8 + min(size & ~DATA_INLINE, 4)]
+        if size == 0:
+            return b""
+        pos, length = hive.cell(offset)
+        if size > BIG_DATA_SEGMENT and hive.minor >= 4 and hive.map[pos:pos + 2] == b"db":
+            count, segments = hive.unpack("<HI", pos + 2)
+            listing, _ = hive.cell(segments)
+            parts = []
+            for i in range(count):
+                segment, length = hive.cell(hive.unpack("<I", listing + i * 4)[0])
+                parts.append(hive.map[segment:segment + min(length, BIG_DATA_SEGMENT)])
+            return b"".join(parts)[:size]
+        return hive.map[pos:pos + min(size, length)]
+
+    @property
+    def data(self):
+        kind = self.type
+        raw = self.raw()
+        if kind in (REG_SZ, REG_EXPAND_SZ):
+            return raw.decode("utf-16-le", "replace").split("\0", 1)[0]
+        if kind == REG_MULTI_SZ:
+            return [s for s in raw.decode("utf-16-le", "replace").split("\0") if s]
+        if kind == REG_DWORD and len(raw) >= 4:
+            return struct.unpack_from("<I", raw)[0]
+        if kind == REG_DWORD_BIG_ENDIAN and len(raw) >= 4:
+            return struct.unpack_from(">I", raw)[0]
+        if kind == REG_QWORD and len(raw) >= 8:
+            return struct.unpack_from("<Q", raw)[0]
+        return raw
+
+class Program:
+    __slots__ = ("name", "version", "publisher", "location", "key", "scope", "source")
+
+    def __init__(self, name, version=None, publisher=None, location=None, key=None, scope=None, source=None):
+        self.name = name
+        self.version = version
+        self.publisher = publisher
+        self.location = location
+        self.key = key
+        self.scope = scope
+        self.source = source
+
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self):
+        return f"<Program {self.name!r} {self.version or ''} ({self.scope})>"
+
+def _text(value):
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+def uninstall_entries(hive, kind):
+    # Programs listed in a SOFTWARE or NTUSER.DAT hive, updates and system components left out
+    for path, scope in UNINSTALL_KEYS[kind]:
+        try:
+            key = hive.open(path)
+        except RegistryError:
+            continue
+        if key is None:
+            continue
+        for entry in key.subkeys():
+            try:
+                name = _text(entry.value("DisplayName"))
+                if name is None or entry.value("SystemComponent") == 1:
+                    continue
+                if entry.value("ParentKeyName") or (_text(entry.value("ReleaseType")) or "").lower() in UPDATE_TYPES:
+                    continue
+                yield Program(name, _text(entry.value("DisplayVersion")), _text(entry.value("Publisher")),
+                              _text(entry.value("InstallLocation")), entry.name, scope, hive.path)
+            except RegistryError:
+                continue
+
+def find_path(directory, *parts):
+    # Case-insensitive path lookup, NTFS mounts may or may not fold case
+    path = directory
+    for part in parts:
+        exact = os.path.join(path, part)
+        if os.path.lexists(exact):
+            path = exact
+            continue
+        try:
+            names = os.listdir(path)
+        except OSError:
+            return None
+        match = next((n for n in names if n.casefold() == part.casefold()), None)
+        if match is None:
+            return None
+        path = os.path.join(path, match)
+    return path
+
+def find_hives(windows_root):
+    # (path, kind) of the machine hive and every user's NTUSER.DAT under a mounted Windows partition
+    hives = []
+    software = find_path(windows_root, "Windows", "System32", "config", "SOFTWARE")
+    if software:
+        hives.append((software, "SOFTWARE"))
+    users = find_path(windows_root, "Users")
+    if users:
+        for user in sorted(os.listdir(users)):
+            ntuser = find_path(os.path.join(users, user), "NTUSER.DAT")
+            if ntuser and os.path.isfile(ntuser):
+                hives.append((ntuser, "NTUSER.DAT"))
+    return hives
+
+def windows_roots(proc="/proc"):
+    # Mounted partitions that look like a Windows installation
+    from system.live import read_mountinfo
+    roots = []
+    for mount in read_mountinfo(proc):
+        if mount.fstype in ("ntfs", "ntfs3", "fuseblk") and find_path(mount.mountpoint, "Windows", "System32"):
+            roots.append(mount.mountpoint)
+    return roots
+
+def hive_kind(path):
+    return "NTUSER.DAT" if os.path.basename(path).casefold() == "ntuser.dat" else "SOFTWARE"
+
+def installed_programs(hives):
+    # hives: (path, kind) pairs; the same program seen twice (e.g. per-user and machine) is kept once
+    programs = {}
+    for path, kind in hives:
+        try:
+            with Hive(path) as hive:
+                for program in uninstall_entries(hive, kind):
+                    programs.setdefault((program.name.casefold(), program.version), program)
+        except (OSError, RegistryError):
+            continue
+    return sorted(programs.values(), key=lambda p: p.name.casefold())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m software.registry")
+    parser.add_argument("--windows", action="append", default=[], help="mounted Windows partition (default: detect)")
+    parser.add_argument("--hive", action="append", default=[], help="SOFTWARE or NTUSER.DAT file to read")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    hives = [(path, hive_kind(path)) for path in args.hive]
+    roots = args.windows or ([] if hives else windows_roots())
+    for root in roots:
+        hives += find_hives(root)
+    if not hives:
+        print("no Windows registry hives found", file=sys.stderr)
+        return 1
+
+    programs = installed_programs(hives)
+    if args.json:
+        print(json.dumps([p.as_dict() for p in programs], indent=2))
+    else:
+        for program in programs:
+            print(f"{program.name}  {program.version or ''}  [{program.publisher or '?'}]")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Programs found through Start Menu shortcuts, for what the registry misses.
+#
+# Portable and per-user apps often have no Uninstall key but do have a
+# shortcut. Every .lnk under ProgramData's and each user's Start Menu is
+# parsed (MS-SHLLINK: the header, the LinkInfo local path and the string
+# section; the item ID list is skipped and the extra data blocks only read
+# for an environment-variable target) on a thread pool. Targets on the
+# mounted partition have the ProductName/CompanyName/ProductVersion of
+# their PE version resource read, seeking straight to it. The result is
+# merged with the registry inventory, dropping shortcuts to programs it
+# already lists.
+#
+#   python -m software.shortcuts [--windows /mnt/windows] [--all] [--json]
+#   python -m software.shortcuts --lnk FILE ...
+
+import argparse
+import json
+import ntpath
+import os
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from software.matcher import normalize
+from software.registry import Program, find_hives, find_path, installed_programs, windows_roots
+
+LINK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+HEADER = struct.Struct("<I16sII")  # size, CLSID, link flags, file attributes
+HEADER_SIZE = 0x4C
+
+HAS_ID_LIST = 0x1
+HAS_LINK_INFO = 0x2
+HAS_NAME = 0x4
+HAS_RELATIVE_PATH = 0x8
+HAS_WORKING_DIR = 0x10
+HAS_ARGUMENTS = 0x20
+HAS_ICON_LOCATION = 0x40
+IS_UNICODE = 0x80
+HAS_EXP_STRING = 0x200
+ENVIRONMENT_BLOCK = 0xA0000001
+VOLUME_ID_AND_LOCAL_BASE_PATH = 0x1
+
+START_MENU = ("Microsoft", "Windows", "Start Menu", "Programs")
+# Shortcuts that are not programs in their own right
+SKIP_WORDS = {"uninstall", "uninstaller", "readme", "read me", "help", "manual", "documentation",
+              "release notes", "website", "license", "changelog"}
+RT_VERSION = 16
+MAX_WORKERS = 8
+
+class LinkError(Exception):
+    pass
+
+class Shortcut:
+    __slots__ = ("path", "name", "target", "arguments", "working_dir", "description",
+                 "product", "company", "version", "user")
+
+    def __init__(self, path, target=None, arguments=None, working_dir=None, description=None, user=None):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.target = target
+        self.arguments = arguments
+        self.working_dir = working_dir
+        self.description = description
+        self.product = None
+        self.company = None
+        self.version = None
+        self.user = user
+
+    @property
+    def display_name(self):
+        return self.product or self.name
+
+    def __repr__(self):
+        return f"<Shortcut {self.name!r} -> {self.target}>"
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise LinkError("truncated shortcut")
+    return data
+
+def _cstring(data, offset, unicode=False):
+    if unicode:
+        end = offset
+        while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+            end += 2
+        return data[offset:end].decode("utf-16-le", "replace")
+    end = data.find(b"\0", offset)
+    return data[offset:end if end >= 0 else len(data)].decode("cp1252", "replace")
+
+def _link_info_path(info):
+    # Local path of the target, from the LinkInfo structure
+    header_size, flags = struct.unpack_from("<II", info, 4)
+    if not flags & VOLUME_ID_AND_LOCAL_BASE_PATH:
+        return None
+    local, _, suffix = struct.unpack_from("<III", info, 16)
+    if header_size >= 0x24:
+        local_unicode, suffix_unicode = struct.unpack_from("<II", info, 28)
+        if local_unicode:
+            return _cstring(info, local_unicode, True) + (_cstring(info, suffix_unicode, True) if suffix_unicode else "")
+    return _cstring(info, local) + (_cstring(info, suffix) if suffix else "")
+
+def parse_lnk(path, user=None):
+    with open(path, "rb") as f:
+        header = _read_exact(f, HEADER_SIZE)
+        size, clsid, flags, _ = HEADER.unpack_from(header)
+        if size != HEADER_SIZE or clsid != LINK_CLSID:
+            raise LinkError(f"{path} is not a shell link")
+        if flags & HAS_ID_LIST:
+            id_list_size, = struct.unpack("<H", _read_exact(f, 2))
+            f.seek(id_list_size, os.SEEK_CUR)
+        target = None
+        if flags & HAS_LINK_INFO:
+            info_size, = struct.unpack("<I", _read_exact(f, 4))
+            if info_size < 0x1C:
+                raise LinkError(f"{path}: bad LinkInfo")
+            target = _link_info_path(struct.pack("<I", info_size) + _read_exact(f, info_size - 4))
+
+        strings = {}
+        unicode = flags & IS_UNICODE
+        for flag in (HAS_NAME, HAS_RELATIVE_PATH, HAS_WORKING_DIR, HAS_ARGUMENTS, HAS_ICON_LOCATION):
+            if flags & flag:
+                count, = struct.unpack("<H", _read_exact(f, 2))
+                raw = _read_exact(f, count * 2 if unicode else count)
+                strings[flag] = raw.decode("utf-16-le" if unicode else "cp1252", "replace")
+
+        if not target and flags & HAS_EXP_STRING:
+            target = _environment_target(f)
+    return Shortcut(path, target, strings.get(HAS_ARGUMENTS), strings.get(HAS_WORKING_DIR),
+                    strings.get(HAS_NAME), user)
+
+def _environment_target(f):
+    # Walk the extra data blocks up to the EnvironmentVariableDataBlock
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            return None
+        size, signature = struct.unpack("<II", head)
+        if size < 8:
+            return None
+        if signature == ENVIRONMENT_BLOCK and size >= 0x314:
+            block = _read_exact(f, size - 8)
+            return _cstring(block, 260, True) or _cstring(block, 0)
+        f.seek(size - 8, os.SEEK_CUR)
+
+def expand_variables(target, user=None):
+    # The usual variables of Start Menu shortcuts, as seen from the system drive
+    home = f"C:\\Users\\{user}" if user else "C:\\Users\\Public"
+    variables = {
+        "programfiles": "C:\\Program Files", "programfiles(x86)": "C:\\Program Files (x86)",
+        "programw6432": "C:\\Program Files", "commonprogramfiles": "C:\\Program Files\\Common Files",
+        "systemroot": "C:\\Windows", "windir": "C:\\Windows", "systemdrive": "C:",
+        "programdata": "C:\\ProgramData", "allusersprofile": "C:\\ProgramData",
+        "userprofile": home, "appdata": home + "\\AppData\\Roaming", "localappdata": home + "\\AppData\\Local",
+    }
+    parts = target.split("%")
+    for i in range(1, len(parts) - 1, 2):
+        value = variables.get(parts[i].lower())
+        parts[i] = value if value is not None else f"%{parts[i]}%"
+    return "".join(parts)
+
+def local_path(windows_root, target):
+    # Where a C:\ path of the shortcut is on the mounted partition, if it's there
+    drive, rest = ntpath.splitdrive(target)
+    if drive.upper() not in ("C:", ""):
+        return None
+    parts = [p for p in rest.split("\\") if p]
+    return find_path(windows_root, *parts) if parts else None
+
+def _pe_resource(f, wanted):
+    # (file offset, size) of the first resource of a type, walking the resource tree with seeks
+    f.seek(0)
+    dos = f.read(64)
+    if dos[:2] != b"MZ":
+        return None
+    pe, = struct.unpack_from("<I", dos, 0x3C)
+    f.seek(pe)
+    head = f.read(24)
+    if head[:4] != b"PE\0\0":
+        return None
+    sections, = struct.unpack_from("<H", head, 6)
+    optional_size, = struct.unpack_from("<H", head, 20)
+    optional = f.read(optional_size)
+    magic, = struct.unpack_from("<H", optional)
+    directories = 96 if magic == 0x10b else 112
+    if optional_size < directories + 24:
+        return None
+    rsrc_rva, = struct.unpack_from("<I", optional, directories + 16)
+    table = f.read(sections * 40)
+
+    def offset_of(rva):
+        for i in range(sections):
+            size, address, raw_size, raw = struct.unpack_from("<IIII", table, i * 40 + 8)
+            if address <= rva < address + max(size, raw_size):
+                return raw + rva - address
+        return None
+
+    base = offset_of(rsrc_rva)
+    if base is None:
+        return None
+    # Type, then name, then language; the first name and language do
+    directory = 0
+    for level in range(3):
+        f.seek(base + directory)
+        named, ids = struct.unpack_from("<HH", f.read(16), 12)
+        entries = f.read((named + ids) * 8)
+        chosen = None
+        for i in range(len(entries) // 8):
+            name, target = struct.unpack_from("<II", entries, i * 8)
+            if level or name == wanted:
+                chosen = target
+                break
+        if chosen is None:
+            return None
+        if not chosen & 0x80000000:
+            return _data_entry(f, base, chosen, offset_of)
+        directory = chosen & 0x7fffffff
+    return None
+
+def _data_entry(f, base, entry, offset_of):
+    f.seek(base + entry)
+    rva, size = struct.unpack("<II", f.read(8))
+    offset = offset_of(rva)
+    return None if offset is None else (offset, size)
+
+def _version_block(data, offset):
+    # (key, value bytes, children start, end) of one VS_VERSIONINFO-style block
+    length, value_length, kind = struct.unpack_from("<HHH", data, offset)
+    end = min(offset + length, len(data))
+    key_end = offset + 6
+    while key_end + 1 < end and data[key_end:key_end + 2] != b"\0\0":
+        key_end += 2
+    key = data[offset + 6:key_end].decode("utf-16-le", "replace")
+    value = (key_end + 2 + 3) & ~3
+    value_size = value_length * 2 if kind == 1 else value_length
+    children = (value + value_size + 3) & ~3
+    return key, data[value:value + value_size], children, end
+
+def _children(data, start, end):
+    while start + 6 <= end:
+        length, = struct.unpack_from("<H", data, start)
+        if length == 0:
+            break
+        yield start
+        start = (start + length + 3) & ~3
+
+def version_strings(path):
+    # ProductName, CompanyName, ... of a PE file's version resource; {} when there isn't one
+    try:
+        with open(path, "rb") as f:
+            found = _pe_resource(f, RT_VERSION)
+            if found is None:
+                return {}
+            offset, size = found
+            f.seek(offset)
+            data = f.read(min(size, 1 << 16))
+    except (OSError, struct.error):
+        return {}
+    strings = {}
+    try:
+        key, _, children, end = _version_block(data, 0)
+        if key != "VS_VERSION_INFO":
+            return {}
+        for child in _children(data, children, end):
+            key, _, tables, table_end = _version_block(data, child)
+            if key != "StringFileInfo":
+                continue
+            for table in _children(data, tables, table_end):
+                _, _, entries, entries_end = _version_block(data, table)
+                for entry in _children(data, entries, entries_end):
+                    name, value, _, _ = _version_block(data, entry)
+                    strings.setdefault(name, value.decode("utf-16-le", "replace").split("\0", 1)[0].strip())
+    except struct.error:
+        pass
+    return strings
+
+def find_shortcuts(windows_root):
+    # (path, user) of every .lnk in the shared and per-user Start Menus
+    menus = [(find_path(windows_root, "ProgramData", *START_MENU), None)]
+    users = find_path(windows_root, "Users")
+    if users:
+        for user in sorted(os.listdir(users)):
+            menus.append((find_path(os.path.join(users, user), "AppData", "Roaming", *START_MENU), user))
+    found = []
+    for menu, user in menus:
+        if not menu:
+            continue
+        for directory, _, files in os.walk(menu):
+            found += [(os.path.join(directory, name), user) for name in sorted(files) if name.lower().endswith(".lnk")]
+    return found
+
+def read_shortcut(path, user=None, windows_root=None):
+    # Runs on the pool: parse the link, then read the target's version resource
+    try:
+        shortcut = parse_lnk(path, user)
+    except (OSError, LinkError, struct.error):
+        return None
+    if shortcut.target:
+        shortcut.target = expand_variables(shortcut.target, user)
+        local = local_path(windows_root, shortcut.target) if windows_root else None
+        if local and os.path.isfile(local):
+            strings = version_strings(local)
+            shortcut.product = strings.get("ProductName") or strings.get("FileDescription") or None
+            shortcut.company = strings.get("CompanyName") or None
+            shortcut.version = strings.get("ProductVersion") or strings.get("FileVersion") or None
+    return shortcut
+
+def read_shortcuts(links, windows_root=None, max_workers=MAX_WORKERS):
+    # links: (path, user) pairs; unreadable links are left out
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(lambda link: read_shortcut(link[0], link[1], windows_root), links)
+        return [shortcut for shortcut in results if shortcut is not None]
+
+def _is_program(shortcut):
+    target = (shortcut.target or "").lower()
+    if not target.endswith(".exe"):
+        return False
+    if target.startswith("c:\\windows\\"):
+        return False
+    name = shortcut.name.lower()
+    return not any(word in name for word in SKIP_WORDS) and "unins" not in ntpath.basename(target)
+
+def merge(programs, shortcuts):
+    # The registry programs plus one Program per shortcut to something they don't cover
+    merged = list(programs)
+    names = {normalize(p.name) for p in programs}
+    locations = [p.location.lower().rstrip("\\") + "\\" for p in programs if p.location]
+    seen = set()
+    for shortcut in shortcuts:
+        if not _is_program(shortcut):
+            continue
+        target = shortcut.target.lower()
+        if any(target.startswith(location) for location in locations):
+            continue
+        key = normalize(shortcut.display_name)
+        if not key or key in names or normalize(shortcut.name) in names or target in seen:
+            continue
+        names.add(key)
+        seen.add(target)
+        merged.append(Program(shortcut.display_name, shortcut.version, shortcut.company,
+                              ntpath.dirname(shortcut.target), shortcut.name,
+                              "shortcut-user" if shortcut.user else "shortcut", shortcut.path))
+    return sorted(merged, key=lambda p: p.name.casefold())
+
+def inventory(windows_root, max_workers=MAX_WORKERS):
+    # Registry programs and Start Menu shortcuts of one mounted Windows partition
+    programs = installed_programs(find_hives(windows_root))
+    return merge(programs, read_shortcuts(find_shortcuts(windows_root), windows_root, max_workers))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m software.shortcuts")
+    parser.add_argument("--windows", action="append", default=[], help="mounted Windows partition (default: detect)")
+    parser.add_argument("--lnk", nargs="+", default=None, help="just parse these shortcut files")
+    parser.add_argument("--all", action="store_true", help="list every shortcut instead of the merged inventory")
+    parser.add_argument("--jobs", type=int, default=MAX_WORKERS)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.lnk:
+        shortcuts = read_shortcuts([(path, None) for path in args.lnk], max_workers=args.jobs)
+        for s in shortcuts:
+            print(f"{s.path}: {s.target or '?'} {s.arguments or ''}".rstrip())
+        return 0 if shortcuts else 1
+
+    roots = args.windows or windows_roots()
+    if not roots:
+        print("no Windows partition found", file=sys.stderr)
+        return 1
+    for root in roots:
+        if args.all:
+            shortcuts = read_shortcuts(find_shortcuts(root), root, args.jobs)
+            if args.json:
+                print(json.dumps([{slot: getattr(s, slot) for slot in Shortcut.__slots__} for s in shortcuts], indent=2))
+            else:
+                for s in shortcuts:
+                    print(f"{s.display_name}  {s.version or ''}  -> {s.target or '?'}")
+            continue
+        programs = inventory(root, args.jobs)
+        if args.json:
+            print(json.dumps([p.as_dict() for p in programs], indent=2))
+        else:
+            for program in programs:
+                print(f"{program.name}  {program.version or ''}  [{program.publisher or '?'}] ({program.scope})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Command line entry point for scripted use.
+#
+# Only the gui subcommand imports Qt, everything else runs on the standard
+# library plus the system/ probes.
+#
+#   ./switcheroo.py detect [--json] [--refresh]
+#   ./switcheroo.py report [--pretty] [--refresh]
+#   ./switcheroo.py scan [--json] [--root /sys | --snapshot FILE]
+#   ./switcheroo.py gui [--profile-startup[=trace.json]]
+
+import argparse
+import json
+import platform
+import sys
+
+def detect(refresh=False):
+    system = platform.system()
+    info = {
+        "system": system,
+        "release": platform.release(),
+        "machine": platform.machine(),
+    }
+    if system == "Linux":
+        from system.cache import cached
+        from system.live import is_live
+        info["session"] = "live" if cached("is_live", is_live, refresh=refresh) else "installed"
+    return info
+
+def report(refresh=False):
+    return {
+        "detect": detect(refresh),
+        "python": platform.python_version(),
+    }
+
+def cmd_detect(args):
+    info = detect(args.refresh)
+    if args.json:
+        print(json.dumps(info))
+    else:
+        for key, value in info.items():
+            print(f"{key}: {value}")
+    return 0
+
+def cmd_report(args):
+    json.dump(report(args.refresh), sys.stdout, indent=2 if args.pretty else None)
+    print()
+    return 0
+
+def device_info(device):
+    info = {"bus": device.bus, "name": device.name}
+    for key in device.__slots__:
+        info[key] = getattr(device, key)
+    info["driver"] = device.driver
+    return info
+
+def cmd_scan(args):
+    from hardware.sysfs import scan
+    root = args.root
+    if args.snapshot:
+        from hardware.snapshot import load_snapshot
+        root = load_snapshot(args.snapshot).root()
+    scanned = scan(root)
+    if args.json:
+        print(json.dumps({bus: [device_info(d) for d in devices] for bus, devices in scanned.items()}))
+    else:
+        for devices in scanned.values():
+            for device in devices:
+                print(device)
+    return 0
+
+def cmd_gui(args):
+    import main
+    status = main.main(["switcheroo"] + args.gui_args)
+    if status is None:
+        print(f"switcheroo: no window for {platform.system()} yet", file=sys.stderr)
+        return 1
+    return status
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="switcheroo", description="Helps to switch to a linux distro easily")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("detect", help="tell whether this is a live session or an installed system")
+    p.add_argument("--json", action="store_true", help="print JSON instead of key: value lines")
+    p.add_argument("--refresh", action="store_true", help="probe again instead of reusing this boot's results")
+    p.set_defaults(func=cmd_detect)
+
+    p = sub.add_parser("report", help="print everything detected as JSON")
+    p.add_argument("--pretty", action="store_true", help="indent the JSON output")
+    p.add_argument("--refresh", action="store_true", help="probe again instead of reusing this boot's results")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("scan", help="list PCI, USB and block devices read from sysfs")
+    p.add_argument("--json", action="store_true", help="print JSON instead of one line per device")
+    p.add_argument("--root", default="/sys", help="sysfs root to read, e.g. a fixture tree (default: /sys)")
+    p.add_argument("--snapshot", help="read the devices from a snapshot made with python -m hardware.snapshot")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("gui", help="start the graphical wizard")
+    p.add_argument("gui_args", nargs=argparse.REMAINDER, help="options passed to the wizard, e.g. --profile-startup")
+    p.set_defaults(func=cmd_gui)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Boot-scoped cache for system probe results.
+#
+# Things like the live/installed decision or the hardware list can't change
+# until the next boot, so they are stored as JSON under $XDG_RUNTIME_DIR (or
+# a per-user directory in /dev/shm or the temp dir), tagged with the kernel's
+# boot_id. A different boot_id, a new PROBE_VERSION or a new version of a
+# single probe all invalidate the stored values. Where there is no boot_id
+# (e.g. Windows) nothing is cached and probes always run.
+#
+# Indexes compiled from files on disk do outlive a boot; they go under
+# $XDG_CACHE_HOME/switcheroo (default_index_dir) and are checked against
+# their source instead, by size and mtime (file_stamp, source_changed).
+# Every cache and index is written through atomic_write, so a reader sees
+# either the old file or the new one, never half of it.
+
+import contextlib
+import json
+import os
+import tempfile
+
+PROBE_VERSION = 1
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+CACHE_FILE = "probes.json"
+
+def read_boot_id(path=BOOT_ID_PATH):
+    try:
+        with open(path, encoding="ascii") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def _private_dir(path):
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.stat(path)
+    except OSError:
+        return None
+    # Shared locations like /dev/shm could have been prepared by someone else
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return None
+    return path
+
+def default_cache_dir():
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return _private_dir(os.path.join(runtime, "switcheroo"))
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    for base in ("/dev/shm", tempfile.gettempdir()):
+        if os.path.isdir(base):
+            path = _private_dir(os.path.join(base, f"switcheroo-{uid}"))
+            if path is not None:
+                return path
+    return None
+
+def default_index_dir():
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "switcheroo")
+
+def file_stamp(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+def source_changed(source, stamp):
+    # A source that went away keeps the index it was built into
+    try:
+        return file_stamp(source) != tuple(stamp)
+    except OSError:
+        return False
+
+@contextlib.contextmanager
+def atomic_write(path, mode="wb", open_file=open, **kwargs):
+    # open_file(tmp, mode, **kwargs) next to path, renamed over it once written;
+    # on errors the temporary file is removed and path left as it was
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open_file(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+class ProbeCache:
+    def __init__(self, directory=None, boot_id=None, version=PROBE_VERSION):
+        self.boot_id = boot_id if boot_id is not None else read_boot_id()
+        self.version = version
+        directory = directory if directory is not None else default_cache_dir()
+        self.path = os.path.join(directory, CACHE_FILE) if directory and self.boot_id else None
+        self._probes = None
+
+    def enabled(self):
+        return self.path is not None
+
+    def _load(self):
+        if self._probes is not None:
+            return self._probes
+        self._probes = {}
+        if self.path is None:
+            return self._probes
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self._probes
+        if data.get("boot_id") == self.boot_id and data.get("version") == self.version:
+            self._probes = data.get("probes", {})
+        return self._probes
+
+    def get(self, name, version=1, default=None):
+        entry = self._load().get(name)
+        if entry is None or entry.get("version") != version:
+            return default
+        return entry.get("value", default)
+
+    def set(self, name, value, version=1):
+        probes = self._load()
+        probes[name] = {"version": version, "value": value}
+        if self.path is None:
+            return
+
+        # Other processes may have stored their own probes meanwhile, keep them
+        self._probes = None
+        current = self._load()
+        current[name] = probes[name]
+        data = {"boot_id": self.boot_id, "version": self.version, "probes": current}
+        try:
+            with atomic_write(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
+
+    def cached(self, name, func, version=1, refresh=False):
+        missing = object()
+        value = missing if refresh else self.get(name, version, missing)
+        if value is missing:
+            value = func()
+            self.set(name, value, version)
+        return value
+
+    def clear(self):
+        self._probes = {}
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+_default = None
+
+def default_cache():
+    global _default
+    if _default is None:
+        _default = ProbeCache()
+    return _default
+
+def cached(name, func, version=1, refresh=False):
+    return default_cache().cached(name, func, version, refresh)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Live session detection without subprocesses.
+#
+# The mount holding the home directory is looked up in /proc/self/mountinfo
+# by st_dev (or by path for anonymous devices such as btrfs subvolumes), and
+# its block device is followed through /sys/class/block down to the disks
+# behind device-mapper, LUKS, LVM and md slaves. Home on overlay, squashfs or
+# tmpfs, or on a device that ends in loop/ram/zram, means a live session.
+# proc and sysfs roots can be pointed at fixture trees.
+
+import os
+import re
+
+LIVE_FSTYPES = {"overlay", "aufs", "unionfs", "squashfs", "tmpfs", "ramfs", "iso9660", "udf"}
+VIRTUAL_DEVICES = ("loop", "ram", "zram", "nbd")
+
+_escape = re.compile(r"\\([0-7]{3})")
+
+class Mount:
+    __slots__ = ("devno", "mountpoint", "fstype", "source")
+
+    def __init__(self, devno, mountpoint, fstype, source):
+        self.devno = devno
+        self.mountpoint = mountpoint
+        self.fstype = fstype
+        self.source = source
+
+def _unescape(field):
+    return _escape.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+def read_mountinfo(proc="/proc"):
+    mounts = []
+    with open(os.path.join(proc, "self", "mountinfo"), encoding="utf-8", errors="replace") as f:
+        for line in f:
+            fields = line.split()
+            try:
+                sep = fields.index("-", 6)
+            except ValueError:
+                continue
+            mounts.append(Mount(fields[2], _unescape(fields[4]), fields[sep + 1], _unescape(fields[sep + 2])))
+    return mounts
+
+def _contains(mountpoint, path):
+    return path == mountpoint or mountpoint == "/" or path.startswith(mountpoint + "/")
+
+def find_mount(mounts, path, devno=None):
+    # The last matching line wins, later mounts shadow earlier ones
+    best = None
+    for candidates in ([m for m in mounts if m.devno == devno], mounts):
+        for mount in candidates:
+            if _contains(mount.mountpoint, path) and (best is None or len(mount.mountpoint) >= len(best.mountpoint)):
+                best = mount
+        if best is not None:
+            return best
+    return None
+
+def _read(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def block_device(devno, sysfs="/sys"):
+    link = os.path.join(sysfs, "dev", "block", devno)
+    if os.path.islink(link):
+        return os.path.basename(os.readlink(link))
+
+    class_dir = os.path.join(sysfs, "class", "block")
+    try:
+        names = os.listdir(class_dir)
+    except OSError:
+        return None
+    for name in names:
+        if _read(os.path.join(class_dir, name, "dev")) == devno:
+            return name
+    return None
+
+def _device_from_source(source, sysfs="/sys"):
+    if not source.startswith("/dev/"):
+        return None
+    class_dir = os.path.join(sysfs, "class", "block")
+    name = os.path.basename(os.path.realpath(source))
+    if os.path.exists(os.path.join(class_dir, name)):
+        return name
+
+    # /dev/mapper/<name> when /dev itself isn't there to resolve (fixtures)
+    mapper = os.path.basename(source)
+    try:
+        names = os.listdir(class_dir)
+    except OSError:
+        return None
+    for dm in names:
+        if dm.startswith("dm-") and _read(os.path.join(class_dir, dm, "dm", "name")) == mapper:
+            return dm
+    return None
+
+def is_physical(name, sysfs="/sys", _seen=None):
+    if name.startswith(VIRTUAL_DEVICES):
+        return False
+    seen = _seen if _seen is not None else set()
+    if name in seen:
+        return False
+    seen.add(name)
+
+    node = os.path.join(sysfs, "class", "block", name)
+    try:
+        slaves = os.listdir(os.path.join(node, "slaves"))
+    except OSError:
+        slaves = []
+    if slaves:
+        return any(is_physical(slave, sysfs, seen) for slave in slaves)
+
+    if os.path.exists(os.path.join(node, "partition")):
+        parent = os.path.basename(os.path.dirname(os.path.realpath(node)))
+        return is_physical(parent, sysfs, seen)
+
+    return os.path.exists(os.path.join(node, "device"))
+
+def session_type(home, home_dev, proc="/proc", sysfs="/sys"):
+    mounts = read_mountinfo(proc)
+
+    root = find_mount(mounts, "/")
+    if root is not None and root.fstype in LIVE_FSTYPES:
+        return "live"
+
+    devno = f"{os.major(home_dev)}:{os.minor(home_dev)}"
+    mount = find_mount(mounts, home, devno)
+    if mount is None or mount.fstype in LIVE_FSTYPES:
+        return "live"
+
+    name = None
+    if not mount.devno.startswith("0:"):
+        name = block_device(mount.devno, sysfs)
+    if name is None:
+        name = _device_from_source(mount.source, sysfs)
+    if name is None or not is_physical(name, sysfs):
+        return "live" # Home not on real disk = live session
+
+    return "installed" # Home on real disk = installed system
+
+def is_live(home=None, proc="/proc", sysfs="/sys"):
+    home = os.path.realpath(home or os.path.expanduser("~"))
+    return session_type(home, os.stat(home).st_dev, proc, sysfs) == "live"
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Concurrent system probes.
+#
+# A probe is a function plus the names of the probes it depends on; the
+# results of those are passed to it as keyword arguments. ProbeRegistry.start()
+# runs every probe on a thread pool as soon as its dependencies are done and
+# reports each result through callbacks, so nothing waits on the slowest
+# probe. Probes registered with a cache_version go through the boot-scoped
+# cache in system.cache. There is no Qt here, gui.probe_runner turns the
+# callbacks into signals.
+
+import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class ProbeError(Exception):
+    pass
+
+class Probe:
+    __slots__ = ("name", "func", "requires", "cache_version")
+
+    def __init__(self, name, func, requires=(), cache_version=None):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.cache_version = cache_version
+
+class ProbeRegistry:
+    def __init__(self):
+        self.probes = {}
+
+    def register(self, name, func=None, requires=(), cache_version=None):
+        if func is None:
+            return lambda f: self.register(name, f, requires, cache_version)
+        if name in self.probes:
+            raise ProbeError(f"probe {name!r} is already registered")
+        self.probes[name] = Probe(name, func, requires, cache_version)
+        return func
+
+    def order(self, names=None):
+        # Dependency order of the wanted probes and everything they need
+        ordered = []
+        state = {}
+
+        def visit(name, chain):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ProbeError("probe dependency cycle: " + " -> ".join(chain + [name]))
+            if name not in self.probes:
+                raise ProbeError(f"unknown probe {name!r}" + (f" required by {chain[-1]!r}" if chain else ""))
+            state[name] = "visiting"
+            for dep in self.probes[name].requires:
+                visit(dep, chain + [name])
+            state[name] = "done"
+            ordered.append(name)
+
+        for name in (self.probes if names is None else names):
+            visit(name, [])
+        return ordered
+
+    def start(self, names=None, on_result=None, on_error=None, on_complete=None, cache=None, max_workers=None, known=None):
+        # known: results from an earlier run, those probes aren't run again
+        known = known or {}
+        wanted = [name for name in self.order(names) if name not in known]
+        run = ProbeRun(self, wanted, on_result, on_error, on_complete, cache, max_workers, known)
+        run.start()
+        return run
+
+    def run(self, names=None, cache=None, max_workers=None):
+        run = self.start(names, cache=cache, max_workers=max_workers)
+        run.wait()
+        return run.results, run.errors
+
+class ProbeRun:
+    def __init__(self, registry, names, on_result=None, on_error=None, on_complete=None, cache=None, max_workers=None, known=None):
+        self.registry = registry
+        self.names = names
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_complete = on_complete
+        self.cache = cache
+        self.results = dict(known or {})
+        self.errors = {}
+        self._pending = set(names)
+        self._left = len(names)
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._done = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="probe")
+
+    def start(self):
+        with self._lock:
+            ready = self._ready()
+        for probe in ready:
+            self._submit(probe)
+        if not self.names:
+            self._finish()
+
+    def _ready(self):
+        # Called with the lock held
+        ready = []
+        for name in list(self._pending):
+            probe = self.registry.probes[name]
+            if all(dep in self.results or dep in self.errors for dep in probe.requires):
+                self._pending.discard(name)
+                ready.append(probe)
+        return ready
+
+    def _submit(self, probe):
+        try:
+            self._executor.submit(self._run_probe, probe)
+        except RuntimeError:
+            pass # cancelled
+
+    def _call(self, probe, kwargs):
+        if self.cache is None or probe.cache_version is None:
+            return probe.func(**kwargs)
+        missing = object()
+        with self._cache_lock:
+            value = self.cache.get(probe.name, probe.cache_version, missing)
+        if value is missing:
+            value = probe.func(**kwargs)
+            with self._cache_lock:
+                self.cache.set(probe.name, value, probe.cache_version)
+        return value
+
+    def _run_probe(self, probe):
+        failed = [dep for dep in probe.requires if dep in self.errors]
+        try:
+            if failed:
+                raise ProbeError(f"skipped, {', '.join(failed)} failed")
+            value = self._call(probe, {dep: self.results[dep] for dep in probe.requires})
+        except Exception as e:
+            with self._lock:
+                self.errors[probe.name] = e
+                ready = self._ready()
+            if self.on_error is not None:
+                self.on_error(probe.name, e)
+        else:
+            with self._lock:
+                self.results[probe.name] = value
+                ready = self._ready()
+            if self.on_result is not None:
+                self.on_result(probe.name, value)
+
+        for next_probe in ready:
+            self._submit(next_probe)
+        with self._lock:
+            self._left -= 1
+            complete = self._left == 0
+        if complete:
+            self._finish()
+
+    def _finish(self):
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._done.set()
+        self._executor.shutdown(wait=False)
+        if self.on_complete is not None:
+            self.on_complete()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def cancel(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+def platform_info():
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+    }
+
+def live_session(platform):
+    if platform["system"] != "Linux":
+        return False
+    from system.live import is_live
+    return is_live()
+
+def hardware_devices(platform):
+    # Not cached: USB devices come and go within a boot and the scan is cheap
+    if platform["system"] != "Linux":
+        return {}
+    from hardware.sysfs import scan
+    return scan()
+
+def default_registry():
+    registry = ProbeRegistry()
+    registry.register("platform", platform_info)
+    registry.register("is_live", live_session, requires=("platform",), cache_version=1)
+    registry.register("devices", hardware_devices, requires=("platform",))
+    return registry
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Opt-in startup timeline tracer.
+#
+# Spans are recorded with a monotonic clock and written as Chrome trace-event
+# JSON, which chrome://tracing, Perfetto and speedscope can open as a flame
+# view. When tracing is disabled span() and instant() cost one global lookup,
+# and this module never imports Qt unless install_first_paint_hook() is used.
+#
+#   python main.py --profile-startup[=trace.json]
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+FLAG = "--profile-startup"
+DEFAULT_PATH = "startup-trace.json"
+
+_path = None
+_events = []
+_written = False
+
+def enabled():
+    return _path is not None
+
+def enable(path=DEFAULT_PATH):
+    global _path
+    if _path is None:
+        atexit.register(write)
+    _path = path
+
+def enable_from_argv(argv):
+    # Parsed by hand, this runs before anything else is imported
+    for arg in list(argv[1:]):
+        if arg == FLAG or arg.startswith(FLAG + "="):
+            argv.remove(arg)
+            enable(arg.partition("=")[2] or DEFAULT_PATH)
+    return enabled()
+
+def _now_us():
+    return time.monotonic_ns() / 1000
+
+def _event(name, ph, ts, cat, **fields):
+    event = {"name": name, "cat": cat, "ph": ph, "ts": ts,
+             "pid": os.getpid(), "tid": threading.get_native_id()}
+    event.update(fields)
+    _events.append(event)
+
+@contextmanager
+def span(name, cat="startup"):
+    if _path is None:
+        yield
+        return
+    start = _now_us()
+    try:
+        yield
+    finally:
+        _event(name, "X", start, cat, dur=_now_us() - start)
+
+def instant(name, cat="startup"):
+    if _path is not None:
+        _event(name, "i", _now_us(), cat, s="p")
+
+def write():
+    global _written
+    if _path is None or _written:
+        return None
+    _written = True
+    with open(_path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": _events, "displayTimeUnit": "ms"}, f)
+    return _path
+
+def install_first_paint_hook(widget, start_name="show"):
+    # Records a span from now until the widget's first paint event, then
+    # writes the trace since startup is over at that point
+    if _path is None:
+        return
+    from PySide6.QtCore import QEvent, QObject
+
+    class FirstPaintFilter(QObject):
+        def __init__(self, parent):
+            super().__init__(parent)
+            self.start = _now_us()
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                _event(f"{start_name} -> first paint", "X", self.start, "startup", dur=_now_us() - self.start)
+                instant("first paint")
+                write()
+            return False
+
+    widget.installEventFilter(FirstPaintFilter(widget))
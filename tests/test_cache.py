@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# ProbeCache invalidation by boot, cache format and probe version, and the
+# atomic_write/source_changed helpers the on-disk indexes share.
+#
+#   python -m unittest tests.test_cache
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from system.cache import CACHE_FILE, ProbeCache, atomic_write, file_stamp, source_changed
+
+class ProbeCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def cache(self, boot_id="boot-1", version=1):
+        return ProbeCache(self.dir, boot_id, version)
+
+    def test_survives_within_a_boot(self):
+        self.cache().set("is_live", True)
+        self.assertIs(self.cache().get("is_live"), True)
+
+    def test_new_boot_invalidates(self):
+        self.cache().set("is_live", True)
+        self.assertIsNone(self.cache("boot-2").get("is_live"))
+
+    def test_new_cache_version_invalidates(self):
+        self.cache().set("is_live", True)
+        self.assertIsNone(self.cache(version=2).get("is_live"))
+
+    def test_probe_version_invalidates_only_that_probe(self):
+        cache = self.cache()
+        cache.set("devices", ["old"], version=1)
+        cache.set("platform", "Linux")
+        fresh = self.cache()
+        self.assertEqual(fresh.get("devices", version=2, default="missing"), "missing")
+        self.assertEqual(fresh.get("platform"), "Linux")
+
+    def test_cached_calls_once_unless_refreshed(self):
+        calls = []
+        probe = lambda: calls.append(1) or len(calls)
+        self.assertEqual(self.cache().cached("n", probe), 1)
+        self.assertEqual(self.cache().cached("n", probe), 1)
+        self.assertEqual(self.cache().cached("n", probe, refresh=True), 2)
+        self.assertEqual(self.cache().cached("n", probe), 2)
+
+    def test_keeps_other_processes_probes(self):
+        first, second = self.cache(), self.cache()
+        first.get("a")
+        second.get("b")
+        first.set("a", 1)
+        second.set("b", 2)
+        self.assertEqual((self.cache().get("a"), self.cache().get("b")), (1, 2))
+
+    def test_no_boot_id_disables(self):
+        cache = ProbeCache(self.dir, boot_id="")
+        self.assertFalse(cache.enabled())
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.dir, CACHE_FILE)))
+
+    def test_corrupt_file_is_ignored(self):
+        with open(os.path.join(self.dir, CACHE_FILE), "w") as f:
+            f.write("{not json")
+        self.assertIsNone(self.cache().get("a"))
+        self.cache().set("a", 1)
+        with open(os.path.join(self.dir, CACHE_FILE)) as f:
+            self.assertEqual(json.load(f)["probes"]["a"]["value"], 1)
+
+    def test_clear(self):
+        cache = self.cache()
+        cache.set("a", 1)
+        cache.clear()
+        self.assertIsNone(self.cache().get("a"))
+
+class AtomicWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, "sub", "index.bin")
+
+    def test_writes_and_creates_the_directory(self):
+        with atomic_write(self.path) as f:
+            f.write(b"new")
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["index.bin"])
+
+    def test_failure_keeps_the_old_file(self):
+        with atomic_write(self.path, "w", encoding="utf-8") as f:
+            f.write("old")
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path, "w", encoding="utf-8") as f:
+                f.write("half")
+                raise RuntimeError
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "old")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["index.bin"])
+
+    def test_source_changed(self):
+        with atomic_write(self.path) as f:
+            f.write(b"source")
+        stamp = file_stamp(self.path)
+        self.assertFalse(source_changed(self.path, stamp))
+        self.assertFalse(source_changed(self.path, list(stamp)))
+        with open(self.path, "ab") as f:
+            f.write(b"more")
+        self.assertTrue(source_changed(self.path, stamp))
+        self.assertFalse(source_changed(os.path.join(self.dir, "missing"), stamp))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# CompatDB dump import and grouping by device class.
+#
+#   python -m unittest tests.test_compatdb
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from hardware.compatdb import CompatDB, CompatDBError
+from hardware.sysfs import PciDevice, UsbDevice
+
+DUMP = """bus,vendor,device,class,driver,works,detected,failed
+pci,8086,46a6,30000,i915,10,0,1
+"""
+
+class CompatDBTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.db = CompatDB(os.path.join(self.dir, "hardware.db"))
+        self.addCleanup(self.db.close)
+
+    def dump(self, text, name="dump.csv"):
+        path = os.path.join(self.dir, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_check_groups_unknown_devices_by_their_class(self):
+        self.db.import_dump(self.dump(DUMP))
+        devices = [
+            PciDevice("0000:00:02.0", 0x8086, 0x46a6, 0, 0, 0x030000, None, "i915"),
+            PciDevice("0000:01:00.0", 0x10de, 0x2684, 0, 0, 0x030000, None, None),
+            UsbDevice("1-2", 0x046d, 0xc52b, 0, (3,)),
+            ("pci", 0x1234, 0x5678),
+        ]
+        groups = self.db.check(devices)
+        self.assertEqual(sorted(groups), ["3", "30000", "unknown"])
+        self.assertEqual((len(groups["30000"].matches), len(groups["30000"].missing)), (1, 1))
+        self.assertEqual(len(groups["3"].missing), 1)
+        self.assertEqual(len(groups["unknown"].missing), 1)
+
+    def assert_rejected(self, text, message):
+        path = self.dump(text)
+        with self.assertRaises(CompatDBError) as cm:
+            self.db.import_dump(path)
+        self.assertEqual(str(cm.exception), f"{path}:{message}")
+        # Nothing from the bad dump is kept
+        self.assertEqual(self.db.count(), 0)
+        self.assertIsNone(self.db.source_checksum(os.path.realpath(path)))
+
+    def test_short_row(self):
+        self.assert_rejected(DUMP + "pci,10de\n", "3: expected 8 fields, got 2")
+
+    def test_bad_id(self):
+        self.assert_rejected(DUMP + "pci,10de,xyz,30000,,1,0,0\n", "3: invalid literal for int() with base 16: 'xyz'")
+
+    def test_bad_count(self):
+        self.assert_rejected(DUMP + "pci,10de,2684,30000,,many,0,0\n", "3: invalid literal for int() with base 10: 'many'")
+
+    def test_missing_columns(self):
+        self.assert_rejected("bus,vendor\npci,8086\n", " dump is missing columns: device")
+
+    def test_cli_fails_on_a_bad_dump(self):
+        from hardware.compatdb import main
+        path = self.dump(DUMP + "pci,10de\n")
+        self.assertEqual(main(["--db", os.path.join(self.dir, "cli.db"), "import", path]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
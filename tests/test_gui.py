@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# MainApp probe listeners: results and failures both reach the pages that
+# asked for them with watch_probe().
+#
+#   python -m unittest tests.test_gui
+
+import types
+import unittest
+
+try:
+    from gui.gui import MainApp
+except ImportError:
+    MainApp = None
+
+@unittest.skipIf(MainApp is None, "needs PySide6")
+class ProbeListenersTest(unittest.TestCase):
+    def setUp(self):
+        # Just the state the listener methods use, no window
+        self.app = types.SimpleNamespace(probes=types.SimpleNamespace(results={"platform": "linux"}),
+                                         probe_listeners={})
+        self.got = []
+
+    def watch(self, name, on_error=True):
+        MainApp.watch_probe(self.app, name, self.got.append,
+                            (lambda message: self.got.append(("failed", message))) if on_error else None)
+
+    def test_known_result_is_passed_at_once(self):
+        self.watch("platform")
+        self.assertEqual(self.got, ["linux"])
+        self.assertEqual(self.app.probe_listeners, {})
+
+    def test_result(self):
+        self.watch("devices")
+        MainApp.on_probe_finished(self.app, "devices", [])
+        self.assertEqual(self.got, [[]])
+
+    def test_failure(self):
+        self.watch("devices")
+        self.watch("devices", on_error=False)
+        MainApp.on_probe_failed(self.app, "devices", "no sysfs")
+        self.assertEqual(self.got, [("failed", "no sysfs")])
+        self.assertEqual(self.app.probe_listeners, {})
+        # A later run's result doesn't reach the dropped listeners
+        MainApp.on_probe_finished(self.app, "devices", [])
+        self.assertEqual(self.got, [("failed", "no sysfs")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# DeviceTracker and DeviceWatcher driven by a FakeSource over a small
+# hand-made sysfs tree.
+#
+#   python -m unittest tests.test_hotplug
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from hardware.hotplug import DeviceTracker, FakeSource
+from hardware.sysfs import scan
+
+def write_pci(sysfs, slot, vendor, device, driver=None):
+    path = os.path.join(sysfs, "devices", "pci0000:00", slot)
+    os.makedirs(path)
+    for name, value in (("vendor", f"0x{vendor:04x}"), ("device", f"0x{device:04x}"), ("class", "0x030000"),
+                        ("modalias", f"pci:v0000{vendor:04X}d0000{device:04X}sv00000000sd00000000bc03sc00i00")):
+        with open(os.path.join(path, name), "w") as f:
+            f.write(value + "\n")
+    if driver:
+        set_driver(sysfs, slot, driver)
+    os.symlink(path, os.path.join(sysfs, "bus", "pci", "devices", slot))
+
+def set_driver(sysfs, slot, driver):
+    path = os.path.join(sysfs, "devices", "pci0000:00", slot, "driver")
+    if os.path.lexists(path):
+        os.unlink(path)
+    if driver:
+        target = os.path.join(sysfs, "bus", "pci", "drivers", driver)
+        os.makedirs(target, exist_ok=True)
+        os.symlink(target, path)
+
+def remove_pci(sysfs, slot):
+    os.unlink(os.path.join(sysfs, "bus", "pci", "devices", slot))
+    shutil.rmtree(os.path.join(sysfs, "devices", "pci0000:00", slot))
+
+class SysfsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sysfs = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.sysfs)
+        for rel in ("bus/pci/devices", "bus/usb/devices", "class/block"):
+            os.makedirs(os.path.join(self.sysfs, rel))
+        write_pci(self.sysfs, "0000:00:02.0", 0x8086, 0x46a6, "i915")
+        self.scanned = scan(self.sysfs)
+        self.source = FakeSource()
+        self.addCleanup(self.source.close)
+
+class DeviceTrackerTest(SysfsTestCase):
+    def apply_pending(self, tracker):
+        return [tracker.apply(event) for event in self.source.read()]
+
+    def test_add_change_remove(self):
+        tracker = DeviceTracker(self.scanned, self.sysfs)
+        write_pci(self.sysfs, "0000:01:00.0", 0x10de, 0x2684)
+        self.source.push("add", "/devices/pci0000:00/0000:01:00.0", "pci")
+        (action, record), = self.apply_pending(tracker)
+        self.assertEqual((action, record.name, record.vendor, record.driver), ("add", "0000:01:00.0", 0x10de, None))
+
+        set_driver(self.sysfs, "0000:01:00.0", "nouveau")
+        self.source.push("bind", "/devices/pci0000:00/0000:01:00.0", "pci")
+        (action, record), = self.apply_pending(tracker)
+        self.assertEqual((action, record.driver), ("change", "nouveau"))
+
+        remove_pci(self.sysfs, "0000:01:00.0")
+        self.source.push("remove", "/devices/pci0000:00/0000:01:00.0", "pci")
+        (action, record), = self.apply_pending(tracker)
+        self.assertEqual((action, record.name), ("remove", "0000:01:00.0"))
+        self.assertEqual([d.name for d in self.scanned["pci"]], ["0000:00:02.0"])
+
+    def test_ignored_events(self):
+        tracker = DeviceTracker(self.scanned, self.sysfs)
+        # Untracked subsystem, partition, a device that is already gone, removing an unknown device
+        self.source.push("add", "/devices/virtual/net/lo", "net")
+        self.source.push("add", "/devices/virtual/block/loop0/loop0p1", "block", "partition")
+        self.source.push("add", "/devices/pci0000:00/0000:05:00.0", "pci")
+        self.source.push("remove", "/devices/pci0000:00/0000:06:00.0", "pci")
+        self.assertEqual(self.apply_pending(tracker), [None] * 4)
+        self.assertEqual([d.name for d in self.scanned["pci"]], ["0000:00:02.0"])
+
+    def test_read_drains(self):
+        self.source.push("add", "/devices/virtual/net/lo", "net")
+        self.assertEqual(len(self.source.read()), 1)
+        self.assertEqual(self.source.read(), [])
+
+try:
+    from PySide6.QtCore import QCoreApplication, QDeadlineTimer
+except ImportError:
+    QCoreApplication = None
+
+@unittest.skipIf(QCoreApplication is None, "needs PySide6")
+class DeviceWatcherTest(SysfsTestCase):
+    def test_signals_from_event_loop(self):
+        from gui.device_watcher import DeviceWatcher
+        app = QCoreApplication.instance() or QCoreApplication([])
+        watcher = DeviceWatcher(self.source, self.sysfs)
+        self.addCleanup(watcher.close)
+        seen = []
+        watcher.deviceAdded.connect(lambda d: seen.append(("add", d.name)))
+        watcher.deviceChanged.connect(lambda d: seen.append(("change", d.name)))
+        watcher.deviceRemoved.connect(lambda d: seen.append(("remove", d.name)))
+        watcher.start(self.scanned)
+
+        def run_until(count):
+            deadline = QDeadlineTimer(5000)
+            while len(seen) < count and not deadline.hasExpired():
+                app.processEvents()
+
+        write_pci(self.sysfs, "0000:01:00.0", 0x10de, 0x2684)
+        self.source.push("add", "/devices/pci0000:00/0000:01:00.0", "pci")
+        self.source.push("change", "/devices/pci0000:00/0000:00:02.0", "pci")
+        # Nothing is read until the event loop sees the source's socket
+        self.assertEqual(seen, [])
+        run_until(2)
+        remove_pci(self.sysfs, "0000:00:02.0")
+        self.source.push("remove", "/devices/pci0000:00/0000:00:02.0", "pci")
+        run_until(3)
+        self.assertEqual(seen, [("add", "0000:01:00.0"), ("change", "0000:00:02.0"), ("remove", "0000:00:02.0")])
+        self.assertEqual([d.name for d in self.scanned["pci"]], ["0000:01:00.0"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Name normalization used by the matcher and the compiled catalog.
+#
+#   python -m unittest tests.test_matcher
+
+import unittest
+
+from software.matcher import normalize
+
+class NormalizeTest(unittest.TestCase):
+    def test_strips_locales(self):
+        self.assertEqual(normalize("Mozilla Firefox (x64 en-US)"), "mozilla firefox")
+        self.assertEqual(normalize("LibreOffice 7.6 pt-BR"), "libreoffice")
+        self.assertEqual(normalize("Microsoft 365 - it-it"), "microsoft 365")
+        self.assertEqual(normalize("Microsoft 365 Apps - en-us"), "microsoft 365 apps")
+
+    def test_keeps_hyphenated_words(self):
+        self.assertEqual(normalize("Intel Wi-Fi 6 AX201"), "intel wi fi 6 ax201")
+        self.assertEqual(normalize("Audio Hi-Fi"), "audio hi fi")
+        self.assertEqual(normalize("Microsoft To-Do"), "microsoft to do")
+
+    def test_strips_versions_and_architectures(self):
+        self.assertEqual(normalize("7-Zip 23.01 (x64 edition)"), "7 zip")
+        self.assertEqual(normalize("Notepad++ 8.6 (64-bit x64)"), "notepad++")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# ProbeRegistry ordering, dependency errors and failure propagation.
+#
+#   python -m unittest tests.test_probes
+
+import threading
+import unittest
+
+from system.probes import ProbeError, ProbeRegistry
+
+class ProbeRegistryTest(unittest.TestCase):
+    def test_order_puts_dependencies_first(self):
+        registry = ProbeRegistry()
+        registry.register("c", lambda a, b: a + b, requires=("a", "b"))
+        registry.register("b", lambda a: a * 10, requires=("a",))
+        registry.register("a", lambda: 1)
+        registry.register("unrelated", lambda: None)
+        self.assertEqual(registry.order(["c"]), ["a", "b", "c"])
+        results, errors = registry.run(["c"])
+        self.assertEqual((results, errors), ({"a": 1, "b": 10, "c": 11}, {}))
+
+    def test_cycle(self):
+        registry = ProbeRegistry()
+        registry.register("a", lambda b: b, requires=("b",))
+        registry.register("b", lambda c: c, requires=("c",))
+        registry.register("c", lambda a: a, requires=("a",))
+        with self.assertRaisesRegex(ProbeError, r"cycle: a -> b -> c -> a"):
+            registry.order(["a"])
+        with self.assertRaises(ProbeError):
+            registry.start()
+
+    def test_missing_dependency(self):
+        registry = ProbeRegistry()
+        registry.register("gpu", lambda devices: devices, requires=("devices",))
+        with self.assertRaisesRegex(ProbeError, r"unknown probe 'devices' required by 'gpu'"):
+            registry.order()
+        with self.assertRaisesRegex(ProbeError, r"unknown probe 'nothing'$"):
+            registry.order(["nothing"])
+
+    def test_duplicate(self):
+        registry = ProbeRegistry()
+        registry.register("a", lambda: 1)
+        with self.assertRaises(ProbeError):
+            registry.register("a", lambda: 2)
+
+    def test_failure_skips_dependents(self):
+        registry = ProbeRegistry()
+
+        @registry.register("broken")
+        def broken():
+            raise OSError("no sysfs")
+
+        registry.register("uses_broken", lambda broken: broken, requires=("broken",))
+        registry.register("fine", lambda: "ok")
+        results, errors = registry.run()
+        self.assertEqual(results, {"fine": "ok"})
+        self.assertIsInstance(errors["broken"], OSError)
+        self.assertIsInstance(errors["uses_broken"], ProbeError)
+        self.assertIn("broken failed", str(errors["uses_broken"]))
+
+        failed = []
+        done = threading.Event()
+        run = registry.start(on_error=lambda name, e: failed.append(name), on_complete=done.set)
+        self.assertTrue(done.wait(5))
+        self.assertTrue(run.done())
+        self.assertEqual(sorted(failed), ["broken", "uses_broken"])
+
+    def test_known_results_are_not_run_again(self):
+        registry = ProbeRegistry()
+        calls = []
+        registry.register("a", lambda: calls.append("a") or 1)
+        registry.register("b", lambda a: a + 1, requires=("a",))
+        run = registry.start(known={"a": 41})
+        self.assertTrue(run.wait(5))
+        self.assertEqual((run.results, calls), ({"a": 41, "b": 42}, []))
+
+if __name__ == "__main__":
+    unittest.main()
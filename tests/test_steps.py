@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# SwitcherooOS - helps to switch to a linux distro easily
+# Copyright (C) 2025  Raffaele
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# StepGraph construction checks, step order and guards.
+#
+#   python -m unittest tests.test_steps
+
+import unittest
+
+from gui.steps import Step, StepGraph
+
+class StepGraphTest(unittest.TestCase):
+    def test_steps_follow_the_list_unless_told_otherwise(self):
+        graph = StepGraph([Step("welcome"), Step("license", next="done"), Step("skipped"), Step("done")])
+        self.assertEqual(graph.first, "welcome")
+        self.assertEqual(graph.next_step("welcome").name, "license")
+        self.assertEqual(graph.next_step("license").name, "done")
+        self.assertEqual(graph.next_step("skipped").name, "done")
+        self.assertIsNone(graph.next_step("done"))
+        self.assertEqual(graph["license"].page, "license")
+
+    def test_duplicate_step(self):
+        with self.assertRaisesRegex(ValueError, "duplicate wizard step 'license'"):
+            StepGraph([Step("license"), Step("license")])
+
+    def test_unknown_next_step(self):
+        with self.assertRaisesRegex(ValueError, "step 'welcome' continues to unknown step 'nowhere'"):
+            StepGraph([Step("welcome", next="nowhere"), Step("license")])
+
+    def test_guards(self):
+        context = {"accepted": False}
+        graph = StepGraph([Step("welcome"), Step("license", guard=lambda c: c["accepted"])])
+        self.assertTrue(graph.can_leave("welcome", context))
+        self.assertFalse(graph.can_leave("license", context))
+        context["accepted"] = True
+        self.assertTrue(graph.can_leave("license", context))
+
+    def test_empty(self):
+        self.assertIsNone(StepGraph([]).first)
+
+if __name__ == "__main__":
+    unittest.main()